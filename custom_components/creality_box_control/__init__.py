@@ -7,19 +7,36 @@ https://github.com/pcartwright81/creality_box_control
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from creality_wifi_box_client.creality_wifi_box_client import CrealityWifiBoxClient
+import homeassistant.helpers.config_validation as cv
 from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
-from custom_components.creality_box_control.const import HOST, PORT
+from custom_components.creality_box_control.const import (
+    CONF_ENTITY_GROUPS,
+    CONF_FARM_SCHEDULER,
+    CONF_REQUEST_TIMEOUT,
+    DOMAIN,
+    HOST,
+    PORT,
+    RELOAD_OPTIONS,
+    REQUEST_TIMEOUT,
+)
 
-from .coordinator import CrealityBoxDataUpdateCoordinator
 from .data import CrealityBoxData
+from .jobs import jobs_store
+from .scheduler import async_get_farm_scheduler
+from .services import async_setup_services
+from .websocket import async_setup_websocket
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import CrealityBoxControlConfigEntry
 
@@ -29,6 +46,15 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the bulk command services and the websocket commands."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -36,26 +62,72 @@ async def async_setup_entry(
     entry: CrealityBoxControlConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    # The client library and the coordinator are imported on the first setup,
+    # so loading the integration without boxes stays cheap
+    from .api import CrealityBoxClient  # noqa: PLC0415
+    from .coordinator import CrealityBoxDataUpdateCoordinator  # noqa: PLC0415
+
     coordinator = CrealityBoxDataUpdateCoordinator(
         hass=hass,
     )
     entry.runtime_data = CrealityBoxData(
-        client=CrealityWifiBoxClient(
-            box_ip=entry.data[HOST], box_port=entry.data[PORT]
+        client=CrealityBoxClient(
+            session=async_get_clientsession(hass),
+            box_ip=entry.data[HOST],
+            box_port=entry.data[PORT],
+            timeout=entry.options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT),
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.jobs.async_load()
+    # Start from the last snapshot so setup does not wait on a slow or offline box
+    cached = await coordinator.async_load_snapshot()
+    if not cached:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
+    _async_claim_box(hass, entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if cached:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), name=f"{DOMAIN} refresh {entry.title}"
+        )
+    entry.async_on_unload(
+        entry.add_update_listener(
+            partial(async_update_options, reload_options=_reload_options(entry))
+        )
+    )
+    if entry.options.get(CONF_FARM_SCHEDULER, False):
+        entry.async_on_unload(
+            async_get_farm_scheduler(hass).async_register(coordinator)
+        )
 
     return True
 
 
+@callback
+def _async_claim_box(hass: HomeAssistant, entry: CrealityBoxControlConfigEntry) -> None:
+    """
+    Key an entry added before entries had unique IDs on its device id.
+
+    A second entry of a box that is already configured is not set up, so
+    the box is polled once.
+    """
+    if entry.unique_id is not None:
+        return
+    did_string = entry.runtime_data.coordinator.data.did_string
+    if (
+        other := hass.config_entries.async_entry_for_domain_unique_id(
+            DOMAIN, did_string
+        )
+    ) is not None:
+        msg = f"{entry.title} is the same box as {other.title}, remove one of them"
+        raise ConfigEntryError(msg)
+    hass.config_entries.async_update_entry(entry, unique_id=did_string)
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: CrealityBoxControlConfigEntry,
@@ -64,9 +136,42 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: CrealityBoxControlConfigEntry,
+) -> None:
+    """Remove the snapshot and the job history of a deleted entry."""
+    from .coordinator import snapshot_store  # noqa: PLC0415
+
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await jobs_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: CrealityBoxControlConfigEntry,
 ) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_update_options(
+    hass: HomeAssistant,
+    entry: CrealityBoxControlConfigEntry,
+    reload_options: dict[str, Any],
+) -> None:
+    """Apply changed options in place, reloading only when the entities change."""
+    if _reload_options(entry) != reload_options:
+        await async_reload_entry(hass, entry)
+        return
+    entry.runtime_data.coordinator.async_apply_options()
+
+
+def _reload_options(entry: CrealityBoxControlConfigEntry) -> dict[str, Any]:
+    """Return the options of an entry that are only applied by a reload."""
+    options = {
+        key: entry.options.get(key, default) for key, default in RELOAD_OPTIONS.items()
+    }
+    # Saving the same groups in another order keeps the entities
+    options[CONF_ENTITY_GROUPS] = set(options[CONF_ENTITY_GROUPS])
+    return options
@@ -0,0 +1,78 @@
+"""Creality Wifi Box client bound to the shared Home Assistant session."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import aiohttp
+from creality_wifi_box_client.creality_wifi_box_client import CrealityWifiBoxClient
+from creality_wifi_box_client.exceptions import (
+    ClientConnectionError,
+    RequestTimeoutError,
+)
+
+from .const import MAX_REQUESTS_PER_BOX, REQUEST_TIMEOUT
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+class CrealityBoxClient(CrealityWifiBoxClient):
+    """
+    Client that reuses a pooled keep-alive session instead of owning one.
+
+    The session's connector is shared by every box, so each client limits
+    its own in-flight requests and enforces the request timeout itself.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        box_ip: str,
+        box_port: int,
+        timeout: int = REQUEST_TIMEOUT,
+    ) -> None:
+        """Initialize the client with a shared session."""
+        super().__init__(box_ip=box_ip, box_port=box_port, timeout=timeout)
+        self._session = session
+        self._request_slots = asyncio.Semaphore(MAX_REQUESTS_PER_BOX)
+
+    def set_timeout(self, timeout: float) -> None:
+        """Change the timeout of the following requests."""
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session."""
+        return self._session
+
+    async def close(self) -> None:
+        """Leave the shared session open, it is owned by Home Assistant."""
+
+    async def get_info(self) -> BoxInfo:
+        """Retrieve device information."""
+        async with self._request_slots, asyncio.timeout(self._timeout.total):
+            return await super().get_info()
+
+    async def get_info_raw(self) -> bytes:
+        """Retrieve the undecoded device information."""
+        url = f"{self.base_url}?fname=Info&opt=main&function=get"
+        async with self._request_slots, asyncio.timeout(self._timeout.total):
+            try:
+                async with self._session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            except aiohttp.ServerTimeoutError as e:
+                msg = "Request to WiFi Box timed out"
+                raise RequestTimeoutError(msg) from e
+            except aiohttp.ClientResponseError as e:
+                msg = f"HTTP error from WiFi Box: {e.status} {e.message}"
+                raise ClientConnectionError(msg) from e
+            except aiohttp.ClientError as e:
+                msg = f"Failed to connect to WiFi Box: {e}"
+                raise ClientConnectionError(msg) from e
+
+    async def _send_command(self, url: str, command_name: str) -> bool:
+        """Send a command to the box."""
+        async with self._request_slots, asyncio.timeout(self._timeout.total):
+            return await super()._send_command(url, command_name)
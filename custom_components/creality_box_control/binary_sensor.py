@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 
+from .const import CONF_ENTITY_GROUPS, ENTITY_GROUP_TOOLHEAD, ENTITY_GROUPS
 from .entity import CrealityBoxEntity
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
-    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -23,21 +21,19 @@ if TYPE_CHECKING:
     from .data import CrealityBoxControlConfigEntry
 
 
-@dataclass(frozen=True, kw_only=True)
-class CrealityBoxBinarySensorEntityDescription(BinarySensorEntityDescription):
-    """A class that describes binary sensor entities."""
-
-    value_fn: Callable[[BoxInfo], bool | None]
-
-
-ENTITY_DESCRIPTIONS: tuple[CrealityBoxBinarySensorEntityDescription, ...] = (
-    CrealityBoxBinarySensorEntityDescription(
+ENTITY_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
         key="upgrade_status",
         name="Upgrade Available",
-        value_fn=lambda x: bool(x.upgrade_status),
     ),
-    CrealityBoxBinarySensorEntityDescription(
-        key="error", name="error", value_fn=lambda x: x.error
+    BinarySensorEntityDescription(key="error", name="error"),
+)
+
+TOOLHEAD_ENTITY_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
+        key="fan",
+        name="Fan",
+        device_class=BinarySensorDeviceClass.RUNNING,
     ),
 )
 
@@ -48,12 +44,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
+    entity_descriptions = ENTITY_DESCRIPTIONS
+    if ENTITY_GROUP_TOOLHEAD in entry.options.get(CONF_ENTITY_GROUPS, ENTITY_GROUPS):
+        entity_descriptions += TOOLHEAD_ENTITY_DESCRIPTIONS
     async_add_entities(
         CrealityBoxBinarySensor(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for entity_description in entity_descriptions
     )
 
 
@@ -63,17 +62,16 @@ class CrealityBoxBinarySensor(CrealityBoxEntity, BinarySensorEntity):  # pyright
     def __init__(
         self,
         coordinator: CrealityBoxDataUpdateCoordinator,
-        entity_description: CrealityBoxBinarySensorEntityDescription,
+        entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
         super().__init__(coordinator, entity_description)
-        self._update_attr_value()
-
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_attr_value()
-        super()._handle_coordinator_update()
-
-    def _update_attr_value(self) -> None:
-        """Update the _attr_is_on value based on the coordinator data."""
-        self._attr_is_on = self.entity_description.value_fn(self.coordinator.data)  # pyright: ignore[reportAttributeAccessIssue]
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Update the _attr_is_on value based on the coordinator view."""
+        is_on = getattr(self.coordinator.view, self.entity_description.key)
+        if is_on == self._attr_is_on:
+            return False
+        self._attr_is_on = is_on
+        return True
@@ -0,0 +1,71 @@
+"""Circuit breaker for unreachable Creality boxes."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from random import uniform
+
+from .const import POLL_JITTER
+
+
+class CircuitState(StrEnum):
+    """States of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling a box after repeated failures and probe it with backoff."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        base_delay: float,
+        max_delay: float,
+    ) -> None:
+        """Initialize the breaker."""
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._retry_at = 0.0
+
+    def allow_request(self, now: float) -> bool:
+        """Return True if a request may be sent, moving to half open when due."""
+        if self.state is not CircuitState.OPEN:
+            return True
+        if now < self._retry_at:
+            return False
+        self.state = CircuitState.HALF_OPEN
+        return True
+
+    def record_success(self) -> bool:
+        """Close the circuit. Return True if the state changed."""
+        changed = self.state is not CircuitState.CLOSED
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        return changed
+
+    def record_failure(self, now: float) -> bool:
+        """Count a failure and open the circuit. Return True if the state changed."""
+        self.failures += 1
+        if self.failures < self.failure_threshold:
+            return False
+        changed = self.state is not CircuitState.OPEN
+        self.state = CircuitState.OPEN
+        self._retry_at = now + self.retry_delay
+        return changed
+
+    @property
+    def retry_delay(self) -> float:
+        """Return the jittered delay before the next probe."""
+        exponent = max(self.failures - self.failure_threshold, 0)
+        delay = min(self.base_delay * 2**exponent, self.max_delay)
+        return delay * uniform(1 - POLL_JITTER, 1 + POLL_JITTER)  # noqa: S311
+
+    def seconds_until_retry(self, now: float) -> float:
+        """Return the seconds left until the next probe is allowed."""
+        return max(self._retry_at - now, 0.0)
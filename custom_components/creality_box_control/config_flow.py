@@ -2,14 +2,102 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from creality_wifi_box_client.creality_wifi_box_client import (
-    CrealityWifiBoxClient,
-)
 from homeassistant import config_entries
+from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, HOST, LOGGER, MODEL, PORT
+from .const import (
+    CONF_BACKOFF_INTERVAL,
+    CONF_BOXES,
+    CONF_DEADBAND,
+    CONF_ENTITY_GROUPS,
+    CONF_ETA_DRIFT,
+    CONF_FAILURE_THRESHOLD,
+    CONF_FARM_SCHEDULER,
+    CONF_FAST_INTERVAL,
+    CONF_HISTORY_SIZE,
+    CONF_HYSTERESIS,
+    CONF_MIN_INTERVAL,
+    CONF_NETWORK,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_INTERVAL,
+    DEFAULT_BACKOFF_INTERVAL,
+    DEFAULT_DEADBAND,
+    DEFAULT_ETA_DRIFT,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_SLOW_INTERVAL,
+    DOMAIN,
+    ENTITY_GROUP_JOBS,
+    ENTITY_GROUP_METRICS,
+    ENTITY_GROUP_TOOLHEAD,
+    ENTITY_GROUPS,
+    FILTERED_SENSORS,
+    HOST,
+    LOGGER,
+    MAX_HISTORY_SIZE,
+    MODEL,
+    PORT,
+    REQUEST_TIMEOUT,
+)
+from .discovery import DiscoveredBox, async_discover_boxes, network_hosts
+
+if TYPE_CHECKING:
+    import asyncio
+
+_INTERVAL = vol.All(cv.positive_int, vol.Range(min=1, max=3600))
+_TEMPERATURE_DELTA = vol.All(vol.Coerce(float), vol.Range(min=0, max=50))
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_FAST_INTERVAL, default=DEFAULT_FAST_INTERVAL): _INTERVAL,
+        vol.Required(CONF_SLOW_INTERVAL, default=DEFAULT_SLOW_INTERVAL): _INTERVAL,
+        vol.Required(
+            CONF_BACKOFF_INTERVAL, default=DEFAULT_BACKOFF_INTERVAL
+        ): _INTERVAL,
+        vol.Required(
+            CONF_FAILURE_THRESHOLD, default=DEFAULT_FAILURE_THRESHOLD
+        ): vol.All(cv.positive_int, vol.Range(min=1, max=20)),
+        vol.Required(CONF_REQUEST_TIMEOUT, default=REQUEST_TIMEOUT): vol.All(
+            cv.positive_int, vol.Range(min=1, max=60)
+        ),
+        vol.Required(CONF_FARM_SCHEDULER, default=False): cv.boolean,
+        vol.Required(CONF_ETA_DRIFT, default=DEFAULT_ETA_DRIFT): _INTERVAL,
+        **{
+            vol.Required(
+                f"{key}_{CONF_DEADBAND}", default=DEFAULT_DEADBAND
+            ): _TEMPERATURE_DELTA
+            for key in FILTERED_SENSORS
+        },
+        **{
+            vol.Required(
+                f"{key}_{CONF_MIN_INTERVAL}", default=DEFAULT_MIN_INTERVAL
+            ): vol.All(cv.positive_int, vol.Range(max=3600))
+            for key in FILTERED_SENSORS
+        },
+        vol.Required(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): _TEMPERATURE_DELTA,
+        vol.Required(CONF_HISTORY_SIZE, default=DEFAULT_HISTORY_SIZE): vol.All(
+            cv.positive_int, vol.Range(min=10, max=MAX_HISTORY_SIZE)
+        ),
+        vol.Required(CONF_ENTITY_GROUPS, default=list(ENTITY_GROUPS)): cv.multi_select(
+            {
+                ENTITY_GROUP_TOOLHEAD: "Toolhead",
+                ENTITY_GROUP_JOBS: "Job history",
+                ENTITY_GROUP_METRICS: "Poll metrics",
+            }
+        ),
+    }
+)
 
 
 class CrealityBoxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -17,15 +105,38 @@ class CrealityBoxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> CrealityBoxOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return CrealityBoxOptionsFlowHandler()
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: dict[str, DiscoveredBox] = {}
+        self._scan_input: dict = {}
+        self._scan_hosts: list[str] = []
+
+        self._scan_task: asyncio.Task[list[DiscoveredBox]] | None = None
+
     async def async_step_user(
         self,
-        user_input: dict | None = None,
+        user_input: dict | None = None,  # noqa: ARG002
     ) -> config_entries.ConfigFlowResult:
         """Handle a flow initialized by the user."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Add a box by its address."""
         _errors = {}
         if user_input is not None:
             try:
-                model = await self._test_connect_and_get_model(
+                box = await self._async_get_box(
                     host=user_input[HOST],
                     port=user_input[PORT],
                 )
@@ -33,18 +144,23 @@ class CrealityBoxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception("Connection failed: %s", exception)
                 _errors["base"] = "unknown"
             else:
-                user_input[MODEL] = model
+                # The same box may be entered by another address, or have
+                # moved to a new one, so entries are keyed on its device id
+                await self.async_set_unique_id(box.did_string)
+                self._abort_if_unique_id_configured(
+                    updates={HOST: box.host, PORT: box.port}
+                )
                 return self.async_create_entry(
-                    title=f"{model}@{user_input[HOST]}",
-                    data=user_input,
+                    title=f"{box.model}@{box.host}",
+                    data=_entry_data(box),
                 )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(HOST): cv.string,
-                    vol.Required(PORT, default=81): cv.port,
+                    vol.Required(PORT, default=DEFAULT_PORT): cv.port,
                 },
             ),
             errors=_errors,
@@ -53,12 +169,198 @@ class CrealityBoxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
-    async def _test_connect_and_get_model(self, host: str, port: int) -> str:
-        """Validate input and get model."""
-        client = CrealityWifiBoxClient(box_ip=host, box_port=port)
+    async def async_step_scan(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Scan a network range for boxes that are not configured yet."""
+        _errors = {}
+        if user_input is not None:
+            try:
+                hosts = network_hosts(user_input[CONF_NETWORK])
+            except ValueError:
+                _errors[CONF_NETWORK] = "invalid_network"
+            else:
+                # Configured hosts are probed too, a box found at another
+                # host than its entry has moved or swapped with another box
+                self._scan_input = user_input
+                self._scan_hosts = hosts
+                return await self.async_step_scan_progress()
+        elif self._scan_input:
+            # Back from a scan that found no new box
+            user_input = self._scan_input
+            _errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=self.add_suggested_values_to_schema(
+                vol.Schema(
+                    {
+                        vol.Required(CONF_NETWORK): cv.string,
+                        vol.Required(PORT, default=DEFAULT_PORT): cv.port,
+                    },
+                ),
+                user_input,
+            ),
+            errors=_errors,
+        )
+
+    async def async_step_scan_progress(
+        self,
+        user_input: dict | None = None,  # noqa: ARG002
+    ) -> config_entries.ConfigFlowResult:
+        """Show the progress of the network scan."""
+        if self._scan_task is None:
+            # A large range takes a while, the scan runs as a task so the
+            # user sees its progress instead of a hanging request
+            self._scan_task = self.hass.async_create_task(
+                async_discover_boxes(
+                    self.hass, self._scan_hosts, self._scan_input[PORT]
+                ),
+                f"{DOMAIN} network scan",
+                eager_start=False,
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="scan_progress",
+                progress_action="scan",
+                progress_task=self._scan_task,
+            )
+        boxes = self._async_update_moved_boxes(self._scan_task.result())
+        self._scan_task = None
+        if not boxes:
+            return self.async_show_progress_done(next_step_id="scan")
+        self._discovered = {box.host: box for box in boxes}
+        return self.async_show_progress_done(next_step_id="select")
+
+    async def async_step_select(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Pick the discovered boxes to add."""
+        _errors = {}
+        if user_input is not None:
+            boxes = [self._discovered[host] for host in user_input[CONF_BOXES]]
+            if boxes:
+                # This flow creates the first entry, the others get a
+                # discovery flow each that creates theirs right away
+                for box in boxes[1:]:
+                    result = await self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                        data=asdict(box),
+                    )
+                    if result["type"] is not FlowResultType.CREATE_ENTRY:
+                        LOGGER.warning(
+                            "Could not add %s@%s: %s",
+                            box.model,
+                            box.host,
+                            result.get("reason"),
+                        )
+                return await self.async_step_integration_discovery(asdict(boxes[0]))
+            _errors["base"] = "no_boxes_selected"
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_BOXES, default=list(self._discovered)): (
+                        cv.multi_select(
+                            {
+                                host: f"{box.model}@{host} ({box.did_string})"
+                                for host, box in self._discovered.items()
+                            }
+                        )
+                    ),
+                },
+            ),
+            errors=_errors,
+        )
+
+    async def async_step_integration_discovery(
+        self,
+        discovery_info: dict,
+    ) -> config_entries.ConfigFlowResult:
+        """Create an entry for a box found by the scan and selected by the user."""
+        box = DiscoveredBox(**discovery_info)
+        await self.async_set_unique_id(box.did_string)
+        self._abort_if_unique_id_configured(updates={HOST: box.host, PORT: box.port})
+        self._async_abort_entries_match({HOST: box.host})
+        return self.async_create_entry(
+            title=f"{box.model}@{box.host}",
+            data=_entry_data(box),
+        )
+
+    @callback
+    def _async_update_moved_boxes(
+        self, boxes: list[DiscoveredBox]
+    ) -> list[DiscoveredBox]:
+        """Update the address of configured boxes found again, return the others."""
+        entries = {
+            entry.unique_id: entry
+            for entry in self._async_current_entries(include_ignore=False)
+            if entry.unique_id is not None
+        }
+        # Entries from before the device id keys claim their box on setup
+        unkeyed_hosts = {
+            entry.data[HOST]
+            for entry in self._async_current_entries(include_ignore=False)
+            if entry.unique_id is None
+        }
+        new_boxes = []
+        for box in boxes:
+            if (entry := entries.get(box.did_string)) is None:
+                if box.host not in unkeyed_hosts:
+                    new_boxes.append(box)
+                continue
+            title = entry.title
+            if title == f"{entry.data[MODEL]}@{entry.data[HOST]}":
+                # The title follows the address unless the user renamed it
+                title = f"{box.model}@{box.host}"
+            moved_from = entry.title
+            if self.hass.config_entries.async_update_entry(
+                entry, title=title, data={**entry.data, HOST: box.host, PORT: box.port}
+            ):
+                LOGGER.info("%s moved to %s:%s", moved_from, box.host, box.port)
+                self.hass.config_entries.async_schedule_reload(entry.entry_id)
+        return new_boxes
+
+    async def _async_get_box(self, host: str, port: int) -> DiscoveredBox:
+        """Validate input and get the model and device id of the box."""
+        from .api import CrealityBoxClient  # noqa: PLC0415
+
+        client = CrealityBoxClient(
+            session=async_get_clientsession(self.hass), box_ip=host, box_port=port
+        )
         info = await client.get_info()
         model = info.model.strip()
         if model == "":
             msg = "Model was blank."
             raise ValueError(msg)
-        return model
+        return DiscoveredBox(
+            host=host, port=port, model=model, did_string=info.did_string
+        )
+
+
+def _entry_data(box: DiscoveredBox) -> dict:
+    """Return the config entry data of a discovered box."""
+    return {HOST: box.host, PORT: box.port, MODEL: box.model}
+
+
+class CrealityBoxOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Creality Box."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
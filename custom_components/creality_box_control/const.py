@@ -8,7 +8,121 @@ DOMAIN = "creality_box_control"
 ATTRIBUTION = "Data provided by Creality Box"
 HOST = "host"
 PORT = "port"
+DEFAULT_PORT = 81
 MODEL = "model"
 PRINT_PAUSE = "print_pause"
 PRINT_RESUME = "print_resume"
 PRINT_STOP = "print_stop"
+
+# HTTP requests to a box share the Home Assistant session
+CONF_REQUEST_TIMEOUT = "request_timeout"
+REQUEST_TIMEOUT = 10
+MAX_REQUESTS_PER_BOX = 2
+
+# Printer states reported by the box
+STATE_PRINTING = 1
+STATE_STOPPING = 4
+STATE_SUSPENDING = 5
+ACTIVE_STATES = frozenset({STATE_PRINTING, STATE_STOPPING, STATE_SUSPENDING})
+PROGRESS_COMPLETE = 100
+
+# State shown right after a command until the box confirms the transition
+COMMAND_STATES = {
+    PRINT_PAUSE: STATE_SUSPENDING,
+    PRINT_RESUME: STATE_PRINTING,
+    PRINT_STOP: STATE_STOPPING,
+}
+COMMAND_POLL_INTERVAL = 0.5
+COMMAND_CONFIRM_TIMEOUT = 10
+
+# Print lifecycle events fired on the bus
+EVENT_PRINT_STARTED = f"{DOMAIN}_print_started"
+EVENT_PRINT_FINISHED = f"{DOMAIN}_print_finished"
+EVENT_PRINT_CANCELLED = f"{DOMAIN}_print_cancelled"
+EVENT_PRINT_ERROR = f"{DOMAIN}_print_error"
+EVENT_CONNECTION_LOST = f"{DOMAIN}_connection_lost"
+
+# Jobs are recorded when they end
+JOB_OUTCOME_FINISHED = "finished"
+JOB_OUTCOME_CANCELLED = "cancelled"
+JOBS_STORAGE_VERSION = 1
+JOBS_SAVE_DELAY = 10
+
+# A hotend or bed above this temperature is treated as heating or cooling down
+HEATING_THRESHOLD = 40
+
+# Adaptive polling
+CONF_FAST_INTERVAL = "fast_interval"
+CONF_SLOW_INTERVAL = "slow_interval"
+CONF_BACKOFF_INTERVAL = "backoff_interval"
+DEFAULT_FAST_INTERVAL = 5
+DEFAULT_SLOW_INTERVAL = 30
+DEFAULT_BACKOFF_INTERVAL = 60
+POLL_JITTER = 0.1
+
+# Poll latency percentiles are taken over this many recent responses, the
+# metric sensors refresh on their own interval as well as with new data
+METRICS_WINDOW = 120
+METRICS_UPDATE_INTERVAL = 60
+
+# Circuit breaker
+CONF_FAILURE_THRESHOLD = "failure_threshold"
+DEFAULT_FAILURE_THRESHOLD = 3
+MAX_BACKOFF_INTERVAL = 900
+
+# Farm scheduler
+CONF_FARM_SCHEDULER = "farm_scheduler"
+FARM_CYCLE_INTERVAL = 5
+FARM_MAX_CONCURRENT = 8
+
+# Print time estimates are only rewritten when they drift by more than this
+CONF_ETA_DRIFT = "eta_drift"
+DEFAULT_ETA_DRIFT = 60
+
+# The predicted finish fits the print rate over this many recent samples
+ETA_WINDOW = 60
+ETA_MIN_SAMPLES = 5
+# Its confidence is rewritten when it moves into another step of this many points
+ETA_CONFIDENCE_STEP = 5
+
+
+# Temperature filtering, the option keys are prefixed with the sensor key
+CONF_DEADBAND = "deadband"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_HYSTERESIS = "temp_hysteresis"
+DEFAULT_DEADBAND = 1.0
+DEFAULT_MIN_INTERVAL = 0
+DEFAULT_HYSTERESIS = 1.0
+FILTERED_SENSORS = ("nozzle_temp", "bed_temp")
+
+# The last good info payload is kept so setup does not wait for the box
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Subnet discovery in the config flow
+CONF_NETWORK = "network"
+CONF_BOXES = "boxes"
+DISCOVERY_MAX_HOSTS = 1024
+DISCOVERY_MAX_PROBES = 32
+DISCOVERY_TIMEOUT = 2
+
+# Bulk command services
+BULK_MAX_CONCURRENT = 50
+BULK_COMMAND_TIMEOUT = 5
+
+# Recent samples kept in memory for dashboards and diagnostics
+CONF_HISTORY_SIZE = "history_size"
+DEFAULT_HISTORY_SIZE = 720
+MAX_HISTORY_SIZE = 17280
+DIAGNOSTICS_HISTORY_POINTS = 100
+
+# Optional groups of entities, all are created unless deselected
+CONF_ENTITY_GROUPS = "entity_groups"
+ENTITY_GROUP_TOOLHEAD = "toolhead"
+ENTITY_GROUP_JOBS = "jobs"
+ENTITY_GROUP_METRICS = "metrics"
+ENTITY_GROUPS = (ENTITY_GROUP_TOOLHEAD, ENTITY_GROUP_JOBS, ENTITY_GROUP_METRICS)
+
+# Options that change which entities exist or who polls the box are applied
+# by reloading the entry, all others are applied to the running box
+RELOAD_OPTIONS = {CONF_ENTITY_GROUPS: list(ENTITY_GROUPS), CONF_FARM_SCHEDULER: False}
@@ -2,21 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import cached_property
+from random import uniform
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
 
-from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from creality_wifi_box_client.exceptions import CrealityWifiBoxError
+from homeassistant.core import callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER, PRINT_PAUSE, PRINT_RESUME, PRINT_STOP
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .const import (
+    ACTIVE_STATES,
+    COMMAND_CONFIRM_TIMEOUT,
+    COMMAND_POLL_INTERVAL,
+    COMMAND_STATES,
+    CONF_BACKOFF_INTERVAL,
+    CONF_FAILURE_THRESHOLD,
+    CONF_FAST_INTERVAL,
+    CONF_HISTORY_SIZE,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_INTERVAL,
+    DEFAULT_BACKOFF_INTERVAL,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_SLOW_INTERVAL,
+    DOMAIN,
+    ETA_MIN_SAMPLES,
+    ETA_WINDOW,
+    EVENT_PRINT_CANCELLED,
+    EVENT_PRINT_FINISHED,
+    HEATING_THRESHOLD,
+    JOB_OUTCOME_CANCELLED,
+    JOB_OUTCOME_FINISHED,
+    LOGGER,
+    MAX_BACKOFF_INTERVAL,
+    METRICS_WINDOW,
+    POLL_JITTER,
+    PRINT_PAUSE,
+    PRINT_RESUME,
+    PRINT_STOP,
+    REQUEST_TIMEOUT,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    STATE_PRINTING,
+)
+from .eta import FinishEstimator, completion
+from .events import event_data, transition_events
+from .history import SampleHistory
+from .jobs import JobHistory, job_record, jobs_store
+from .metrics import PollMetrics
+from .snapshot import BoxSnapshot
+from .view import BoxView
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
 
     from .data import CrealityBoxControlConfigEntry
+    from .filters import DeadbandFilter
+
+
+JOB_OUTCOMES = {
+    EVENT_PRINT_FINISHED: JOB_OUTCOME_FINISHED,
+    EVENT_PRINT_CANCELLED: JOB_OUTCOME_CANCELLED,
+}
 
 
-class CrealityBoxDataUpdateCoordinator(DataUpdateCoordinator[BoxInfo]):
+class CrealityBoxDataUpdateCoordinator(DataUpdateCoordinator[BoxSnapshot]):
     """Class to manage fetching data from the API."""
 
     config_entry: CrealityBoxControlConfigEntry
@@ -30,14 +90,257 @@ class CrealityBoxDataUpdateCoordinator(DataUpdateCoordinator[BoxInfo]):
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            update_interval=timedelta(seconds=DEFAULT_SLOW_INTERVAL),
+            always_update=False,
+        )
+        self.farm_scheduled = False
+        self.next_poll = 0.0
+        self._command_lock = asyncio.Lock()
+        self._pending_commands: set[str] = set()
+        self._confirm_task: asyncio.Task[None] | None = None
+        self._confirm_state: tuple[int, int] | None = None
+        self._payload: BoxSnapshot | None = None
+        self._view: BoxView | None = None
+        self._view_data: BoxSnapshot | None = None
+        self.metrics = PollMetrics(METRICS_WINDOW)
+        self._filters: dict[DeadbandFilter, str] = {}
+
+    @cached_property
+    def breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding requests to the box."""
+        options = self.config_entry.options
+        return CircuitBreaker(
+            failure_threshold=options.get(
+                CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD
+            ),
+            base_delay=options.get(CONF_BACKOFF_INTERVAL, DEFAULT_BACKOFF_INTERVAL),
+            max_delay=MAX_BACKOFF_INTERVAL,
+        )
+
+    @cached_property
+    def history(self) -> SampleHistory:
+        """Return the recent samples of the box."""
+        return SampleHistory(
+            self.config_entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)
         )
 
-    async def _async_update_data(self) -> BoxInfo:
+    @cached_property
+    def estimator(self) -> FinishEstimator:
+        """Return the estimator of the finish time of the current print."""
+        return FinishEstimator(window=ETA_WINDOW, min_samples=ETA_MIN_SAMPLES)
+
+    @cached_property
+    def jobs(self) -> JobHistory:
+        """Return the history of the print jobs of the box."""
+        return JobHistory(jobs_store(self.hass, self.config_entry.entry_id))
+
+    @cached_property
+    def snapshot_store(self) -> Store[dict[str, Any]]:
+        """Return the store holding the last good data of the box."""
+        return snapshot_store(self.hass, self.config_entry.entry_id)
+
+    @property
+    def view(self) -> BoxView:
+        """
+        Return the entity values of the current data.
+
+        The view is derived on the first read after the data changed, once
+        for all entities, whichever path replaced the data.
+        """
+        if self._view is None or self._view_data is not self.data:
+            self._view = BoxView.from_snapshot(self.data)
+            self._view_data = self.data
+        return self._view
+
+    @callback
+    def async_apply_options(self) -> None:
+        """
+        Apply changed options to the running box without a reload.
+
+        The breaker, the history and the client are updated in place, so the
+        breaker state, the recent samples and the open session are kept. The
+        next poll is rescheduled with the new intervals right away.
+        """
+        options = self.config_entry.options
+        self.breaker.failure_threshold = options.get(
+            CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD
+        )
+        self.breaker.base_delay = options.get(
+            CONF_BACKOFF_INTERVAL, DEFAULT_BACKOFF_INTERVAL
+        )
+        self.history.resize(options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE))
+        for deadband_filter, key in self._filters.items():
+            deadband_filter.apply_options(options, key)
+        self.config_entry.runtime_data.client.set_timeout(
+            options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT)
+        )
+        self._schedule_next_poll(self.data if self.last_update_success else None)
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_add_filter(
+        self, key: str, deadband_filter: DeadbandFilter
+    ) -> Callable[[], None]:
+        """
+        Keep the deadband filter of a sensor in line with the options.
+
+        The settings of the given sensor key are applied with the other
+        options. Return a callback that stops it.
+        """
+        self._filters[deadband_filter] = key
+
+        @callback
+        def _async_remove_filter() -> None:
+            del self._filters[deadband_filter]
+
+        return _async_remove_filter
+
+    async def async_load_snapshot(self) -> bool:
+        """Seed the data from the last snapshot. Return True if one was loaded."""
+        if (snapshot := await self.snapshot_store.async_load()) is None:
+            return False
+        try:
+            self.data = BoxSnapshot(json_bytes(snapshot), projected_only=True)
+
+        except CrealityWifiBoxError:
+            LOGGER.warning(
+                "Ignoring the invalid snapshot of %s", self.config_entry.title
+            )
+            return False
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """
+        Return the data to persist in the snapshot store.
+
+        Only the fields the entities read are kept, so credentials and other
+        secrets of the payload never end up in the store.
+        """
+        return self._payload.projected()
+
+    async def _async_update_data(self) -> BoxSnapshot:
         """Update data via library."""
-        return await self.config_entry.runtime_data.client.get_info()
+        if not self.breaker.allow_request(monotonic()):
+            self._schedule_next_poll(None)
+            msg = "Box is unreachable, waiting before the next probe"
+            raise UpdateFailed(msg)
+        try:
+            start = perf_counter()
+            raw = await self.config_entry.runtime_data.client.get_info_raw()
+            self.metrics.record_response(perf_counter() - start, len(raw))
+            # An idle box sends the same bytes on every poll, reuse the last
+            # snapshot so nothing is decoded and no listener is called
+            changed = self._payload is None or raw != self._payload.raw
+            if changed:
+                start = perf_counter()
+                previous, self._payload = self._payload, BoxSnapshot(raw)
+                self.metrics.record_parse(perf_counter() - start)
+                self._record(previous, self._payload)
+        except (CrealityWifiBoxError, TimeoutError) as exception:
+            self.metrics.record_failure()
+            if self.breaker.record_failure(monotonic()):
+                self.async_update_listeners()
+            self._schedule_next_poll(None)
+            raise UpdateFailed(exception) from exception
+        data = self._confirmed(self._payload)
+        self.breaker.record_success()
+        self.metrics.record_success()
+        self._schedule_next_poll(data)
+        if changed:
+            self.snapshot_store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        return data
+
+    def _confirmed(self, data: BoxSnapshot) -> BoxSnapshot:
+        """Keep showing the expected state while the box has not left the old one."""
+        if self._confirm_state is None:
+            return data
+        state, expected = self._confirm_state
+        if data.state == state:
+            return data.replace(state=expected)
+        self._confirm_state = None
+        return data
+
+    def _record(self, previous: BoxSnapshot | None, data: BoxSnapshot) -> None:
+        """Feed a new payload to the histories, the estimator and the event bus."""
+        now = dt_util.utcnow().timestamp()
+        self.history.append(now, data)
+        if data.connect == 1 and data.state == STATE_PRINTING:
+            self.estimator.add(data.print_job_time, completion(data))
+        elif data.state not in ACTIVE_STATES:
+            self.estimator.reset()
+        if previous is None:
+            return
+        for event_type in transition_events(previous, data):
+            if outcome := JOB_OUTCOMES.get(event_type):
+                self.jobs.async_add(job_record(previous, data, now, outcome))
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "name": self.config_entry.title,
+                    **event_data(previous, data),
+                },
+            )
+
+    def _schedule_next_poll(self, data: BoxSnapshot | None) -> None:
+        """Pick the next poll interval from the state of the box."""
+        if self.breaker.state is CircuitState.OPEN:
+            self._set_poll_interval(
+                max(self.breaker.seconds_until_retry(monotonic()), 1)
+            )
+            return
+        options = self.config_entry.options
+        if data is None:
+            seconds = options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL)
+        elif data.connect != 1:
+            seconds = options.get(CONF_BACKOFF_INTERVAL, DEFAULT_BACKOFF_INTERVAL)
+        elif _is_active(data):
+            seconds = options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL)
+        else:
+            seconds = options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL)
+        jitter = uniform(1 - POLL_JITTER, 1 + POLL_JITTER)  # noqa: S311
+        self._set_poll_interval(seconds * jitter)
+
+    def _set_poll_interval(self, seconds: float) -> None:
+        """Schedule the next poll, leaving the timer to the farm scheduler if set."""
+        self.next_poll = monotonic() + seconds
+        if not self.farm_scheduled:
+            self.update_interval = timedelta(seconds=seconds)
+
+    @callback
+    def async_use_farm_scheduler(self) -> None:
+        """Leave the polls to the farm scheduler and drop the pending refresh."""
+        self.farm_scheduled = True
+        self.update_interval = None
+        self._unschedule_refresh()
+
+    def poll_due(self, now: float) -> bool:
+        """Return True if the next poll is due by the given monotonic time."""
+        return self.next_poll <= now
 
     async def send_command(self, command: str) -> None:
+        """
+        Queue a command for the printer.
+
+        A command that is already pending is dropped. Once the box accepted
+        it, the expected state is shown and the box is polled quickly until it
+        reports the transition.
+        """
+        if command in self._pending_commands:
+            LOGGER.debug("Dropping command %s, it is already pending", command)
+            return
+        self._pending_commands.add(command)
+        try:
+            async with self._command_lock:
+                await self._async_send_command(command)
+        finally:
+            self._pending_commands.discard(command)
+        if self.data is not None:
+            self._async_confirm_command(command)
+
+    async def _async_send_command(self, command: str) -> None:
         """Send a command to the printer."""
         try:
             client = self.config_entry.runtime_data.client
@@ -54,3 +357,56 @@ class CrealityBoxDataUpdateCoordinator(DataUpdateCoordinator[BoxInfo]):
             msg = f"Failed to send command {command}: {e}"
             LOGGER.error(msg)
             raise
+
+    @callback
+    def _async_confirm_command(self, command: str) -> None:
+        """Show the expected state and poll quickly until the box confirms it."""
+        expected = COMMAND_STATES[command]
+        if self.data.state == expected:
+            return
+        if self._confirm_state is None:
+            state = self.data.state
+        else:
+            # Keep waiting for the box to leave the state it last reported
+            state = self._confirm_state[0]
+            self._confirm_task.cancel()
+        self._confirm_state = (state, expected)
+        self.async_set_updated_data(self.data.replace(state=expected))
+        self._confirm_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_poll_until_changed(state),
+            name=f"{DOMAIN} confirm {command}",
+        )
+
+    async def _async_poll_until_changed(self, state: int) -> None:
+        """
+        Poll at the command interval until the box leaves the given state.
+
+        Until then every poll keeps the expected state. When the box does not
+        confirm in time, the state it reports is shown again.
+        """
+        try:
+            async with asyncio.timeout(COMMAND_CONFIRM_TIMEOUT):
+                while self._confirm_state is not None:
+                    await asyncio.sleep(COMMAND_POLL_INTERVAL)
+                    await self.async_refresh()
+        except TimeoutError:
+            LOGGER.debug(
+                "%s did not confirm the command in time", self.config_entry.title
+            )
+            self._confirm_state = None
+            self.data = self._payload or self.data.replace(state=state)
+            self.async_update_listeners()
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the snapshot store of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def _is_active(data: BoxSnapshot) -> bool:
+    """Return True when the printer is printing or heating."""
+    return (
+        data.state in ACTIVE_STATES
+        or max(data.nozzle_temp, data.bed_temp) >= HEATING_THRESHOLD
+    )
@@ -6,10 +6,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from creality_wifi_box_client.creality_wifi_box_client import CrealityWifiBoxClient
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
+    from .api import CrealityBoxClient
     from .coordinator import CrealityBoxDataUpdateCoordinator
 
 
@@ -20,6 +20,6 @@ type CrealityBoxControlConfigEntry = ConfigEntry[CrealityBoxData]
 class CrealityBoxData:
     """Data for the Creality Box integration."""
 
-    client: CrealityWifiBoxClient
+    client: CrealityBoxClient
     coordinator: CrealityBoxDataUpdateCoordinator
     integration: Integration
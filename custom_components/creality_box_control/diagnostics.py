@@ -0,0 +1,55 @@
+"""Diagnostics support for creality_box_control."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import DIAGNOSTICS_HISTORY_POINTS, HOST
+from .scheduler import DATA_FARM_SCHEDULER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import CrealityBoxControlConfigEntry
+
+TO_REDACT = {
+    HOST,
+    "APILicense",
+    "DIDString",
+    "apclimac",
+    "apclissid",
+    "netIP",
+    "ownerId",
+    "ssid",
+    "wanip",
+    "wifipasswd",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: CrealityBoxControlConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    farm_cycle = None
+    if coordinator.farm_scheduled and (scheduler := hass.data.get(DATA_FARM_SCHEDULER)):
+        farm_cycle = scheduler.last_cycle and scheduler.last_cycle.as_dict()
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "last_update_success": coordinator.last_update_success,
+        "breaker": coordinator.breaker.state.value,
+        "metrics": coordinator.metrics.as_dict(),
+        "data": (
+            None
+            if coordinator.data is None
+            else async_redact_data(coordinator.data.as_dict(), TO_REDACT)
+        ),
+        "history": coordinator.history.samples(DIAGNOSTICS_HISTORY_POINTS),
+        "farm_cycle": farm_cycle,
+    }
@@ -0,0 +1,74 @@
+"""Discover Creality boxes on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from ipaddress import ip_network
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DISCOVERY_MAX_HOSTS, DISCOVERY_MAX_PROBES, DISCOVERY_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredBox:
+    """A box that answered a discovery probe."""
+
+    host: str
+    port: int
+    model: str
+    did_string: str
+
+
+def network_hosts(network: str) -> list[str]:
+    """Return the host addresses of a CIDR range."""
+    hosts = ip_network(network, strict=False)
+    if hosts.num_addresses > DISCOVERY_MAX_HOSTS:
+        msg = f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses"
+        raise ValueError(msg)
+    return [str(host) for host in hosts.hosts()]
+
+
+async def async_discover_boxes(
+    hass: HomeAssistant, hosts: Iterable[str], port: int
+) -> list[DiscoveredBox]:
+    """Probe the hosts concurrently and return the boxes that answered."""
+    # The client library is only needed once a scan actually runs
+    from creality_wifi_box_client.exceptions import (  # noqa: PLC0415
+        CrealityWifiBoxError,
+    )
+
+    from .api import CrealityBoxClient  # noqa: PLC0415
+
+    session = async_get_clientsession(hass)
+    probes = asyncio.Semaphore(DISCOVERY_MAX_PROBES)
+
+    async def _async_probe(host: str) -> DiscoveredBox | None:
+        client = CrealityBoxClient(
+            session=session, box_ip=host, box_port=port, timeout=DISCOVERY_TIMEOUT
+        )
+        async with probes:
+            try:
+                info = await client.get_info()
+            # The library only wraps some client errors, a host answering
+            # with garbage must not fail the whole scan
+            except CrealityWifiBoxError, TimeoutError, aiohttp.ClientError:
+                return None
+
+        model = info.model.strip()
+        if not model or not info.did_string:
+            return None
+        return DiscoveredBox(
+            host=host, port=port, model=model, did_string=info.did_string
+        )
+
+    results = await asyncio.gather(*(_async_probe(host) for host in hosts))
+    return [box for box in results if box is not None]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -38,3 +39,17 @@ class CrealityBoxEntity(CoordinatorEntity[CrealityBoxDataUpdateCoordinator]):
             manufacturer="Creality",
             model=coordinator.data.model,
         )
+        self._last_available = self.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value or the availability changed."""
+        changed = self._update_value()
+        available = self.available
+        if changed or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    def _update_value(self) -> bool:
+        """Recompute the value from the coordinator. Return True if it changed."""
+        return False
@@ -0,0 +1,92 @@
+"""Finish time estimate from the observed print rate."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .snapshot import BoxSnapshot
+
+# The completed fraction is stored in steps of 1/10000, so the running sums
+# are integers and stay exact as samples enter and leave the window
+_SCALE = 10000
+
+
+def completion(data: BoxSnapshot) -> float:
+    """Return the completed fraction of the print from progress and layers."""
+    done = data.print_progress / 100
+    if data.total_layer > 0:
+        done = (done + min(data.layer / data.total_layer, 1)) / 2
+    return done
+
+
+class FinishEstimator:
+    """
+    Least squares fit of the completed fraction against the job time.
+
+    The fit runs over a sliding window of samples. Running sums are updated
+    as samples enter and leave the window, so every update costs the same
+    regardless of the window size.
+    """
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        """Initialize the estimator."""
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: deque[tuple[int, int]] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples, for example when a new print starts."""
+        self._samples.clear()
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = self._sum_yy = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, job_time: int, done: float) -> None:
+        """Add a sample, dropping the oldest one once the window is full."""
+        done_steps = round(done * _SCALE)
+        if self._samples:
+            last_time = self._samples[-1][0]
+            if job_time == last_time:
+                return
+            if job_time < last_time:
+                # The job time went back, a new print started
+                self.reset()
+        if len(self._samples) == self.window:
+            self._update_sums(*self._samples.popleft(), sign=-1)
+        self._samples.append((job_time, done_steps))
+        self._update_sums(job_time, done_steps, sign=1)
+
+    def _update_sums(self, x: int, y: int, sign: int) -> None:
+        self._sum_x += sign * x
+        self._sum_y += sign * y
+        self._sum_xx += sign * x * x
+        self._sum_xy += sign * x * y
+        self._sum_yy += sign * y * y
+
+    def estimate(self) -> tuple[float, float] | None:
+        """
+        Return the seconds left and the confidence between 0 and 1.
+
+        The confidence is the coefficient of determination of the fit,
+        scaled down while the window is still filling up. None is returned
+        until there are enough samples and the print is advancing.
+        """
+        count = len(self._samples)
+        if count < self.min_samples:
+            return None
+        var_x = count * self._sum_xx - self._sum_x**2
+        var_y = count * self._sum_yy - self._sum_y**2
+        cov = count * self._sum_xy - self._sum_x * self._sum_y
+        if var_x == 0 or cov <= 0:
+            return None
+        rate = cov / var_x
+        job_time = self._samples[-1][0]
+        fitted = (self._sum_y - rate * self._sum_x) / count + rate * job_time
+        seconds_left = max(_SCALE - fitted, 0) / rate
+        fit = cov * cov / (var_x * var_y)
+        return seconds_left, fit * count / self.window
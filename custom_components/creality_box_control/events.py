@@ -0,0 +1,51 @@
+"""Print lifecycle events derived from consecutive payloads."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    ACTIVE_STATES,
+    EVENT_CONNECTION_LOST,
+    EVENT_PRINT_CANCELLED,
+    EVENT_PRINT_ERROR,
+    EVENT_PRINT_FINISHED,
+    EVENT_PRINT_STARTED,
+    PROGRESS_COMPLETE,
+    STATE_PRINTING,
+)
+
+if TYPE_CHECKING:
+    from .snapshot import BoxSnapshot
+
+
+def transition_events(previous: BoxSnapshot, data: BoxSnapshot) -> list[str]:
+    """Return the events of the transition from the previous payload."""
+    events = []
+    if previous.connect == 1 and data.connect != 1:
+        events.append(EVENT_CONNECTION_LOST)
+    if not previous.error and data.error:
+        events.append(EVENT_PRINT_ERROR)
+    if previous.state not in ACTIVE_STATES and data.state == STATE_PRINTING:
+        events.append(EVENT_PRINT_STARTED)
+    elif previous.state in ACTIVE_STATES and data.state not in ACTIVE_STATES:
+        events.append(
+            EVENT_PRINT_FINISHED
+            if data.print_progress >= PROGRESS_COMPLETE
+            else EVENT_PRINT_CANCELLED
+        )
+    return events
+
+
+def event_data(previous: BoxSnapshot, data: BoxSnapshot) -> dict[str, Any]:
+    """Return the job metadata sent with the events."""
+    return {
+        # The box clears the file name once the print is over
+        "print_name": data.print_name or previous.print_name,
+        "progress": data.print_progress,
+        "job_time": data.print_job_time,
+        "layer": data.layer,
+        "total_layer": data.total_layer,
+        "state": data.state,
+        "error": data.error,
+    }
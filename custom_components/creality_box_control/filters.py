@@ -0,0 +1,77 @@
+"""Deadband filter for noisy sensor values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_HYSTERESIS,
+    CONF_MIN_INTERVAL,
+    DEFAULT_DEADBAND,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def filter_options(options: Mapping[str, Any], key: str) -> dict[str, float]:
+    """Return the settings of the deadband filter of a sensor from the options."""
+    return {
+        "deadband": options.get(f"{key}_{CONF_DEADBAND}", DEFAULT_DEADBAND),
+        "min_interval": options.get(f"{key}_{CONF_MIN_INTERVAL}", DEFAULT_MIN_INTERVAL),
+        "hysteresis": options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+    }
+
+
+class DeadbandFilter:
+    """Suppress jitter around the last published value."""
+
+    def __init__(
+        self,
+        deadband: float,
+        min_interval: float,
+        hysteresis: float,
+    ) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.hysteresis = hysteresis
+        self._value: float | None = None
+        self._published_at = 0.0
+        self._direction = 0
+        # When the last value was only held back by the minimum interval,
+        # the time it may be published
+        self.held_until: float | None = None
+
+    def apply_options(self, options: Mapping[str, Any], key: str) -> None:
+        """Apply changed settings, keeping the last published value."""
+        for name, value in filter_options(options, key).items():
+            setattr(self, name, value)
+
+    def accept(self, value: float | None, now: float) -> bool:
+        """Return True if the value should be published and remember it."""
+        self.held_until = None
+        if value is None or self._value is None:
+            return self._publish(value, now, 0)
+        delta = value - self._value
+        direction = (delta > 0) - (delta < 0)
+        threshold = self.deadband
+        if direction == -self._direction:
+            # Turning around needs a larger step, so values hovering around
+            # the last published value do not flap up and down
+            threshold += self.hysteresis
+        if abs(delta) <= threshold:
+            return False
+        if now - self._published_at < self.min_interval:
+            self.held_until = self._published_at + self.min_interval
+            return False
+        return self._publish(value, now, direction)
+
+    def _publish(self, value: float | None, now: float, direction: int) -> bool:
+        self._value = value
+        self._published_at = now
+        self._direction = direction
+        return True
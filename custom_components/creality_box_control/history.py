@@ -0,0 +1,82 @@
+"""In-memory history of the recent temperatures and progress of a box."""
+
+from __future__ import annotations
+
+from array import array
+from math import ceil
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .snapshot import BoxSnapshot
+
+# Snapshot attributes recorded with every sample
+HISTORY_FIELDS = ("nozzle_temp", "bed_temp", "print_progress", "layer")
+
+
+class SampleHistory:
+    """
+    Fixed-size ring buffer of samples, one array per field.
+
+    Once full the oldest sample is overwritten, so memory use does not grow
+    with the uptime of Home Assistant.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Allocate the buffer for the given number of samples."""
+        self.size = size
+        self._time = array("d", bytes(8 * size))
+        self._values = {field: array("d", bytes(8 * size)) for field in HISTORY_FIELDS}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def append(self, time: float, data: BoxSnapshot) -> None:
+        """Record the fields of a snapshot taken at the given timestamp."""
+        index = self._next
+        self._time[index] = time
+        for field, values in self._values.items():
+            values[index] = getattr(data, field)
+        self._next = (index + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def resize(self, size: int) -> None:
+        """Change the number of samples held, keeping the newest ones."""
+        if size == self.size:
+            return
+        count = min(self._count, size)
+        # Oldest kept sample first, so it lands at the start of the new buffer
+        indexes = [(self._next - count + offset) % self.size for offset in range(count)]
+        padding = bytes(8 * (size - count))
+        self._time = array("d", [self._time[index] for index in indexes])
+        self._time.frombytes(padding)
+        for field, values in self._values.items():
+            resized = array("d", [values[index] for index in indexes])
+            resized.frombytes(padding)
+            self._values[field] = resized
+        self.size = size
+        self._next = count % size
+        self._count = count
+
+    def samples(self, max_points: int | None = None) -> dict[str, list[float]]:
+        """
+        Return the samples oldest first, one list per field.
+
+        With max_points the samples are thinned out evenly, always keeping
+        the newest one.
+        """
+        count = self._count
+        step = 1 if not max_points else max(ceil(count / max_points), 1)
+        newest = self._next - 1
+        # Walk back from the newest sample so it is always included
+        indexes = [(newest - offset) % self.size for offset in range(0, count, step)]
+        indexes.reverse()
+        return {
+            "time": [self._time[index] for index in indexes],
+            **{
+                field: [values[index] for index in indexes]
+                for field, values in self._values.items()
+            },
+        }
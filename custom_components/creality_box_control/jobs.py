@@ -0,0 +1,125 @@
+"""Persistent history of the print jobs of a box."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    JOB_OUTCOME_FINISHED,
+    JOBS_SAVE_DELAY,
+    JOBS_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .snapshot import BoxSnapshot
+
+
+class JobRecord(TypedDict):
+    """One print job that ended."""
+
+    print_name: str
+    started: float
+    ended: float
+    duration: int
+    filament_length: int
+    filament_type: str
+    outcome: str
+
+
+class JobHistory:
+    """
+    Append-only list of the jobs of a box with running totals.
+
+    Jobs are appended in the order they end, so the list is sorted by end
+    time and date ranges are found by bisection. The totals and the file
+    name index are updated as jobs are added, never by rescanning.
+    """
+
+    def __init__(self, store: Store[dict[str, Any]]) -> None:
+        """Initialize an empty history."""
+        self._store = store
+        self.jobs: list[JobRecord] = []
+        self._ended: list[float] = []
+        self._by_name: dict[str, list[int]] = {}
+        self.finished = 0
+        self.print_seconds = 0
+        self.filament_length = 0
+
+    async def async_load(self) -> None:
+        """Load the stored jobs."""
+        if (stored := await self._store.async_load()) is not None:
+            for job in stored["jobs"]:
+                self._index(job)
+
+    @callback
+    def async_add(self, job: JobRecord) -> None:
+        """Append a job that ended and schedule saving the history."""
+        self._index(job)
+        self._store.async_delay_save(self._data_to_save, JOBS_SAVE_DELAY)
+
+    def _index(self, job: JobRecord) -> None:
+        self._by_name.setdefault(job["print_name"], []).append(len(self.jobs))
+        self.jobs.append(job)
+        self._ended.append(job["ended"])
+        self.finished += job["outcome"] == JOB_OUTCOME_FINISHED
+        self.print_seconds += job["duration"]
+        self.filament_length += job["filament_length"]
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"jobs": self.jobs}
+
+    @property
+    def success_rate(self) -> float | None:
+        """Return the percentage of jobs that finished, None without jobs."""
+        if not self.jobs:
+            return None
+        return round(self.finished / len(self.jobs) * 100, 1)
+
+    def query(
+        self,
+        print_name: str | None = None,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[JobRecord]:
+        """Return the jobs with the file name that ended between start and end."""
+        first = 0 if start is None else bisect_left(self._ended, start)
+        last = len(self.jobs) if end is None else bisect_right(self._ended, end)
+        if print_name is None:
+            return self.jobs[first:last]
+        indexes = self._by_name.get(print_name, [])
+        return [
+            self.jobs[index]
+            for index in indexes[
+                bisect_left(indexes, first) : bisect_left(indexes, last)
+            ]
+        ]
+
+
+def job_record(
+    previous: BoxSnapshot, data: BoxSnapshot, ended: float, outcome: str
+) -> JobRecord:
+    """Return the record of the job that ended between two payloads."""
+    # The box may reset the job once it ends, take what the last poll saw
+    duration = max(previous.print_job_time, data.print_job_time)
+    return {
+        "print_name": data.print_name or previous.print_name,
+        "started": ended - duration,
+        "ended": ended,
+        "duration": duration,
+        "filament_length": previous.consumables_len,
+        "filament_type": previous.filament_type,
+        "outcome": outcome,
+    }
+
+
+def jobs_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the job history store of a config entry."""
+    return Store(hass, JOBS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.jobs")
@@ -0,0 +1,55 @@
+"""Poll instrumentation of a box."""
+
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+from typing import Any
+
+
+class PollMetrics:
+    """Latency, failure and payload figures of the recent polls of a box."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the metrics with a rolling window of latencies."""
+        self._latencies: deque[float] = deque(maxlen=window)
+        self.last_latency: float | None = None
+        self.last_parse_time: float | None = None
+        self.consecutive_failures = 0
+        self.bytes_received = 0
+
+    def record_response(self, latency: float, size: int) -> None:
+        """Record a response and the seconds it took."""
+        self._latencies.append(latency)
+        self.last_latency = latency
+        self.bytes_received += size
+
+    def record_parse(self, seconds: float) -> None:
+        """Record the seconds it took to decode a new payload."""
+        self.last_parse_time = seconds
+
+    def record_success(self) -> None:
+        """Record a poll that produced data."""
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a poll that failed."""
+        self.consecutive_failures += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the latency percentile over the window, nearest rank."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[max(ceil(len(latencies) * percent / 100), 1) - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of the metrics, times in seconds."""
+        return {
+            "last_latency": self.last_latency,
+            "p50_latency": self.percentile(50),
+            "p95_latency": self.percentile(95),
+            "consecutive_failures": self.consecutive_failures,
+            "bytes_received": self.bytes_received,
+            "last_parse_time": self.last_parse_time,
+        }
@@ -0,0 +1,165 @@
+"""Farm-level poll scheduler shared by every opted-in box."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, FARM_CYCLE_INTERVAL, FARM_MAX_CONCURRENT, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .coordinator import CrealityBoxDataUpdateCoordinator
+
+DATA_FARM_SCHEDULER: HassKey[CrealityBoxFarmScheduler] = HassKey(
+    f"{DOMAIN}_farm_scheduler"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CycleStats:
+    """Timing of one scheduler cycle."""
+
+    boxes: int
+    polled: int
+    duration: float
+    poll_time: float
+
+    @property
+    def capacity(self) -> int | None:
+        """Estimate how many boxes fit into one interval at this poll cost."""
+        if not self.polled:
+            return None
+        average = self.poll_time / self.polled
+        return int(FARM_CYCLE_INTERVAL / average * FARM_MAX_CONCURRENT)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing of the cycle and its capacity, times in seconds."""
+        return {
+            "boxes": self.boxes,
+            "polled": self.polled,
+            "duration": self.duration,
+            "poll_time": self.poll_time,
+            "capacity": self.capacity,
+        }
+
+
+@callback
+def async_get_farm_scheduler(hass: HomeAssistant) -> CrealityBoxFarmScheduler:
+    """Return the farm scheduler, creating it on first use."""
+    if (scheduler := hass.data.get(DATA_FARM_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_FARM_SCHEDULER] = CrealityBoxFarmScheduler(hass)
+    return scheduler
+
+
+class CrealityBoxFarmScheduler:
+    """Spread the polls of many boxes evenly over one shared timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.last_cycle: CycleStats | None = None
+        self._coordinators: list[CrealityBoxDataUpdateCoordinator] = []
+        self._slots = asyncio.Semaphore(FARM_MAX_CONCURRENT)
+        self._unsub_timer: Callable[[], None] | None = None
+        self._cycle: asyncio.Task[None] | None = None
+        self._overrun_reported = False
+
+    @callback
+    def async_register(
+        self, coordinator: CrealityBoxDataUpdateCoordinator
+    ) -> Callable[[], None]:
+        """Take over polling of a coordinator. Return a callback to release it."""
+        coordinator.async_use_farm_scheduler()
+        self._coordinators.append(coordinator)
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass,
+                self._async_start_cycle,
+                timedelta(seconds=FARM_CYCLE_INTERVAL),
+                name=f"{DOMAIN} farm scheduler",
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.remove(coordinator)
+            if not self._coordinators and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return _async_unregister
+
+    @callback
+    def _async_start_cycle(self, _now: datetime | None = None) -> None:
+        """Start a cycle unless the previous one is still running."""
+        if self._cycle is not None and not self._cycle.done():
+            # Reported once until a cycle fits again, not on every tick
+            if not self._overrun_reported:
+                self._overrun_reported = True
+                LOGGER.warning(
+                    "Farm poll cycle is still running, "
+                    "%s boxes do not fit into %s seconds",
+                    len(self._coordinators),
+                    FARM_CYCLE_INTERVAL,
+                )
+            return
+        self._overrun_reported = False
+
+        self._cycle = self.hass.async_create_background_task(
+            self.async_run_cycle(), name=f"{DOMAIN} farm poll cycle"
+        )
+
+    async def async_run_cycle(self) -> None:
+        """Poll every due box, staggered evenly across the interval."""
+        coordinators = list(self._coordinators)
+        if not coordinators:
+            return
+        start = monotonic()
+        deadline = start + FARM_CYCLE_INTERVAL
+        step = FARM_CYCLE_INTERVAL / len(coordinators)
+        results = await asyncio.gather(
+            *(
+                self._async_poll(coordinator, index * step, deadline)
+                for index, coordinator in enumerate(coordinators)
+            )
+        )
+        polls = [result for result in results if result is not None]
+        self.last_cycle = CycleStats(
+            boxes=len(coordinators),
+            polled=len(polls),
+            duration=monotonic() - start,
+            poll_time=sum(polls),
+        )
+        LOGGER.debug(
+            "Farm poll cycle polled %s of %s boxes in %.2f seconds, "
+            "polls took %.2f seconds, capacity %s boxes",
+            self.last_cycle.polled,
+            self.last_cycle.boxes,
+            self.last_cycle.duration,
+            self.last_cycle.poll_time,
+            self.last_cycle.capacity,
+        )
+
+    async def _async_poll(
+        self,
+        coordinator: CrealityBoxDataUpdateCoordinator,
+        delay: float,
+        deadline: float,
+    ) -> float | None:
+        """Refresh one coordinator if due. Return the time the poll took."""
+        await asyncio.sleep(delay)
+        if not coordinator.poll_due(deadline):
+            return None
+        async with self._slots:
+            start = monotonic()
+            await coordinator.async_refresh()
+            return monotonic() - start
@@ -4,26 +4,56 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from time import monotonic
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.components.sensor.const import SensorDeviceClass
-from homeassistant.const import UnitOfTemperature
+from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfLength,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from custom_components.creality_box_control.const import LOGGER
+from custom_components.creality_box_control.const import (
+    ACTIVE_STATES,
+    CONF_ENTITY_GROUPS,
+    CONF_ETA_DRIFT,
+    DEFAULT_ETA_DRIFT,
+    ENTITY_GROUP_JOBS,
+    ENTITY_GROUP_METRICS,
+    ENTITY_GROUP_TOOLHEAD,
+    ENTITY_GROUPS,
+    ETA_CONFIDENCE_STEP,
+    FILTERED_SENSORS,
+    METRICS_UPDATE_INTERVAL,
+)
 
+from .circuit_breaker import CircuitState
 from .entity import CrealityBoxEntity
+from .filters import DeadbandFilter, filter_options
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from datetime import time
 
-    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
     from .coordinator import CrealityBoxDataUpdateCoordinator
     from .data import CrealityBoxControlConfigEntry
+    from .jobs import JobHistory
+    from .snapshot import BoxSnapshot
+    from .view import BoxView
+
+
+ATTR_CONFIDENCE = "confidence"
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -32,37 +62,61 @@ class CrealityBoxSensorEntityDescription(
 ):
     """A class that describes sensor entities."""
 
-    value_fn: Callable[[BoxInfo], float | str | datetime | time | None]
+    # The sensor whose deadband options apply, when not the sensor itself
+    filter_key: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class CrealityBoxTimestampSensorEntityDescription(
+    SensorEntityDescription, frozen_or_thawed=True
+):
+    """A class that describes timestamp sensor entities."""
+
+    device_class: SensorDeviceClass = SensorDeviceClass.TIMESTAMP
+    value_fn: Callable[[BoxSnapshot, datetime], datetime | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CrealityBoxDiagnosticSensorEntityDescription(
+    SensorEntityDescription, frozen_or_thawed=True
+):
+    """A class that describes diagnostic sensor entities."""
+
+    value_fn: Callable[[CrealityBoxDataUpdateCoordinator], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CrealityBoxJobSensorEntityDescription(
+    SensorEntityDescription, frozen_or_thawed=True
+):
+    """A class that describes sensor entities of the job history."""
+
+    value_fn: Callable[[JobHistory], StateType]
 
 
 ENTITY_DESCRIPTIONS = (
-    CrealityBoxSensorEntityDescription(
-        key="wanip", name="IP Address", value_fn=lambda x: x.wanip
-    ),
+    CrealityBoxSensorEntityDescription(key="wanip", name="IP Address"),
     CrealityBoxSensorEntityDescription(
         key="state",
         name="Current State",
-        value_fn=lambda x: _map_state(x.state, x.connect),
     ),
     CrealityBoxSensorEntityDescription(
         key="print_job_time",
         name="Time Running",
-        value_fn=lambda x: _to_time_left(x.print_job_time),
+        entity_registry_enabled_default=False,
     ),
     CrealityBoxSensorEntityDescription(
         key="print_left_time",
         name="Time Left",
-        value_fn=lambda x: _to_time_left(x.print_left_time),
+        entity_registry_enabled_default=False,
     ),
     CrealityBoxSensorEntityDescription(
         key="print_name",
         name="Currently Printing",
-        value_fn=lambda x: x.print_name,
     ),
     CrealityBoxSensorEntityDescription(
         key="nozzle_temp",
         name="Nozzle Temp",
-        value_fn=lambda x: x.nozzle_temp,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -70,7 +124,6 @@ ENTITY_DESCRIPTIONS = (
     CrealityBoxSensorEntityDescription(
         key="bed_temp",
         name="Bed Temp",
-        value_fn=lambda x: x.bed_temp,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -78,33 +131,228 @@ ENTITY_DESCRIPTIONS = (
     CrealityBoxSensorEntityDescription(
         key="print_progress",
         name="Job Percentage",
-        value_fn=lambda x: x.print_progress,
         native_unit_of_measurement="%",
     ),
 )
 
+TOOLHEAD_ENTITY_DESCRIPTIONS = (
+    CrealityBoxSensorEntityDescription(
+        key="position_x",
+        name="Position X",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="position_y",
+        name="Position Y",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="position_z",
+        name="Position Z",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+        suggested_display_precision=2,
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="layer",
+        name="Current Layer",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="layer_progress",
+        name="Layer Percentage",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="feed_rate",
+        name="Feed Rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+)
 
-def _map_state(state: int, connect: int) -> str:
-    # Map the state
-    # Pieced together from
-    # https://github.com/CrealityOfficial/CrealityPrint/tree/release-v5.0.3/plugins/CrealityUI/CrealityUI/lanprinterqml
-    LOGGER.debug(f"State:{state} Connect:{connect}")
-    if connect != 1:
-        return "Offline"
-    printing = 1
-    stopping = 4
-    suspending = 5
-    if state == printing:
-        return "Printing"
-    if state == stopping:
-        return "Stopping"
-    if state == suspending:
-        return "Suspending"
-    return "Idle"
+# Only created once the channel reports a temperature, most boxes have none
+TEMPERATURE_CHANNEL_ENTITY_DESCRIPTIONS = (
+    CrealityBoxSensorEntityDescription(
+        key="the_1_st_nozzle_temp",
+        name="Nozzle 1 Temp",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        filter_key="nozzle_temp",
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="the_2_nd_nozzle_temp",
+        name="Nozzle 2 Temp",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        filter_key="nozzle_temp",
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="nozzle_temp2",
+        name="Nozzle Temp 2",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        filter_key="nozzle_temp",
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="bed_temp2",
+        name="Bed Temp 2",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        filter_key="bed_temp",
+    ),
+    CrealityBoxSensorEntityDescription(
+        key="chamber_temp",
+        name="Chamber Temp",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        filter_key="bed_temp",
+    ),
+)
 
+TIMESTAMP_ENTITY_DESCRIPTIONS = (
+    CrealityBoxTimestampSensorEntityDescription(
+        key="print_start",
+        name="Print Started",
+        value_fn=lambda x, now: (
+            now - timedelta(seconds=x.print_job_time) if _is_printing(x) else None
+        ),
+    ),
+    CrealityBoxTimestampSensorEntityDescription(
+        key="print_finish",
+        name="Estimated Finish",
+        value_fn=lambda x, now: (
+            now + timedelta(seconds=x.print_left_time) if _is_printing(x) else None
+        ),
+    ),
+)
 
-def _to_time_left(seconds_left: int) -> str:
-    return str(timedelta(seconds=seconds_left))
+PREDICTED_FINISH_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="predicted_finish",
+    name="Predicted Finish",
+    device_class=SensorDeviceClass.TIMESTAMP,
+)
+
+JOB_ENTITY_DESCRIPTIONS = (
+    CrealityBoxJobSensorEntityDescription(
+        key="jobs_printed",
+        name="Jobs Printed",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: len(x.jobs),
+    ),
+    CrealityBoxJobSensorEntityDescription(
+        key="total_print_time",
+        name="Total Print Time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: round(x.print_seconds / 3600, 2),
+    ),
+    CrealityBoxJobSensorEntityDescription(
+        key="filament_used",
+        name="Filament Used",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.filament_length,
+    ),
+    CrealityBoxJobSensorEntityDescription(
+        key="success_rate",
+        name="Success Rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.success_rate,
+    ),
+)
+
+DIAGNOSTIC_ENTITY_DESCRIPTIONS = (
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="connection_state",
+        name="Connection State",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(CircuitState),
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x.breaker.state,
+    ),
+)
+
+METRIC_ENTITY_DESCRIPTIONS = (
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="poll_latency",
+        name="Poll Latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: _to_milliseconds(x.metrics.last_latency),
+    ),
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="poll_latency_p50",
+        name="Poll Latency P50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: _to_milliseconds(x.metrics.percentile(50)),
+    ),
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll Latency P95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: _to_milliseconds(x.metrics.percentile(95)),
+    ),
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="consecutive_failures",
+        name="Consecutive Failures",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x.metrics.consecutive_failures,
+    ),
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="bytes_received",
+        name="Bytes Received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x.metrics.bytes_received,
+    ),
+    CrealityBoxDiagnosticSensorEntityDescription(
+        key="parse_time",
+        name="Parse Time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: _to_milliseconds(x.metrics.last_parse_time),
+    ),
+)
+
+
+def _to_milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _is_printing(data: BoxSnapshot) -> bool:
+    return data.connect == 1 and data.state in ACTIVE_STATES
 
 
 async def async_setup_entry(
@@ -113,15 +361,102 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    async_add_entities(
-        CrealityBoxSensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
+    coordinator = entry.runtime_data.coordinator
+    groups = entry.options.get(CONF_ENTITY_GROUPS, ENTITY_GROUPS)
+    entities: list[SensorEntity] = [
+        *(
+            CrealityBoxSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in ENTITY_DESCRIPTIONS
+        ),
+        *(
+            CrealityBoxTimestampSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in TIMESTAMP_ENTITY_DESCRIPTIONS
+        ),
+        CrealityBoxPredictedFinishSensor(
+            coordinator=coordinator,
+            entity_description=PREDICTED_FINISH_ENTITY_DESCRIPTION,
+        ),
+        *(
+            CrealityBoxDiagnosticSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in DIAGNOSTIC_ENTITY_DESCRIPTIONS
+        ),
+    ]
+    if ENTITY_GROUP_TOOLHEAD in groups:
+        entities.extend(
+            CrealityBoxSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in TOOLHEAD_ENTITY_DESCRIPTIONS
+        )
+    if ENTITY_GROUP_JOBS in groups:
+        entities.extend(
+            CrealityBoxJobSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in JOB_ENTITY_DESCRIPTIONS
+        )
+    if ENTITY_GROUP_METRICS in groups:
+        entities.extend(
+            CrealityBoxMetricSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in METRIC_ENTITY_DESCRIPTIONS
+        )
+    async_add_entities(entities)
+
+    added_channels: set[str] = set()
+
+    @callback
+    def _async_add_temperature_channels() -> None:
+        """Add the sensors of the temperature channels that started reporting."""
+        entity_descriptions = [
+            entity_description
+            for entity_description in TEMPERATURE_CHANNEL_ENTITY_DESCRIPTIONS
+            if entity_description.key not in added_channels
+            and _reports_channel(coordinator.view, entity_description.key)
+        ]
+        if not entity_descriptions:
+            return
+        added_channels.update(
+            entity_description.key for entity_description in entity_descriptions
+        )
+        async_add_entities(
+            CrealityBoxSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in entity_descriptions
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+
+    _async_add_temperature_channels()
+    entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_temperature_channels)
     )
 
 
+def _reports_channel(view: BoxView, key: str) -> bool:
+    """Return True if the box reports a temperature on the channel."""
+    if key == "the_1_st_nozzle_temp":
+        # Single nozzle boxes mirror the nozzle temperature on the first channel
+        return bool(view.the_2_nd_nozzle_temp) or view.the_1_st_nozzle_temp not in (
+            0,
+            view.nozzle_temp,
+        )
+    return bool(getattr(view, key))
+
+
 class CrealityBoxSensor(CrealityBoxEntity, SensorEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
     """creality_box_control Sensor class."""
 
@@ -132,8 +467,189 @@ class CrealityBoxSensor(CrealityBoxEntity, SensorEntity):  # pyright: ignore[rep
     ) -> None:
         """Initialize the sensor class."""
         super().__init__(coordinator, entity_description)
+        self._filter: DeadbandFilter | None = None
+        self._unsub_held: Callable[[], None] | None = None
+        self._filter_key = entity_description.filter_key or entity_description.key
+        if self._filter_key in FILTERED_SENSORS:
+            self._filter = DeadbandFilter(
+                **filter_options(coordinator.config_entry.options, self._filter_key)
+            )
+        self._update_value()
+
+    async def async_added_to_hass(self) -> None:
+        """Follow changes of the deadband options while added."""
+        await super().async_added_to_hass()
+        if self._filter is not None:
+            self.async_on_remove(
+                self.coordinator.async_add_filter(self._filter_key, self._filter)
+            )
+            self.async_on_remove(self._cancel_held)
+
+    def _update_value(self) -> bool:
+        """Update the _attr_native_value based on the coordinator view."""
+        self._cancel_held()
+        value = getattr(self.coordinator.view, self.entity_description.key)
+        if value == self._attr_native_value:
+            return False
+        now = monotonic()
+        if self._filter is not None and not self._filter.accept(value, now):
+            if self._filter.held_until is not None:
+                # An idle box sends no further updates, so publish the value
+                # once the minimum interval ends
+                self._unsub_held = async_call_later(
+                    self.hass, self._filter.held_until - now, self._async_publish_held
+                )
+            return False
+        self._attr_native_value = value
+        return True
+
+    @callback
+    def _async_publish_held(self, _now: datetime) -> None:
+        """Publish the value held back by the minimum interval."""
+        self._unsub_held = None
+        if self._update_value():
+            self.async_write_ha_state()
+
+    @callback
+    def _cancel_held(self) -> None:
+        """Cancel the pending publish of a held value."""
+        if self._unsub_held is not None:
+            self._unsub_held()
+            self._unsub_held = None
+
+
+class CrealityBoxTimestampSensor(CrealityBoxEntity, SensorEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
+    """creality_box_control timestamp Sensor class."""
+
+    def __init__(
+        self,
+        coordinator: CrealityBoxDataUpdateCoordinator,
+        entity_description: CrealityBoxTimestampSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description)
+        self._update_value()
+
+    def _value(self, now: datetime) -> datetime | None:
+        """Return the current estimate of the timestamp."""
+        return self.entity_description.value_fn(self.coordinator.data, now)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _update_value(self) -> bool:
+        """Update the timestamp when the estimate drifted past the threshold."""
+        value = self._value(dt_util.utcnow())
+        previous = self._attr_native_value
+        if value is None or not isinstance(previous, datetime):
+            changed = value != previous
+        else:
+            drift = self.coordinator.config_entry.options.get(
+                CONF_ETA_DRIFT, DEFAULT_ETA_DRIFT
+            )
+            changed = abs(value - previous) > timedelta(seconds=drift)
+        if changed:
+            self._attr_native_value = value
+        return changed
+
+
+class CrealityBoxPredictedFinishSensor(CrealityBoxTimestampSensor):
+    """Finish time fitted to the observed print rate, with its confidence."""
+
+    _attr_extra_state_attributes: dict[str, float | None]
+    _confidence_step: int | None = None
+
+    def _update_value(self) -> bool:
+        """Update the finish time, or the confidence when it moved a step."""
+        changed = super()._update_value()
+        confidence = self._attr_extra_state_attributes[ATTR_CONFIDENCE]
+        step = None if confidence is None else int(confidence // ETA_CONFIDENCE_STEP)
+        if step == self._confidence_step:
+            return changed
+        self._confidence_step = step
+        return True
+
+    def _value(self, now: datetime) -> datetime | None:
+        """Return the finish time predicted by the estimator of the coordinator."""
+        estimate = None
+        if _is_printing(self.coordinator.data):
+            estimate = self.coordinator.estimator.estimate()
+        if estimate is None:
+            self._attr_extra_state_attributes = {ATTR_CONFIDENCE: None}
+            return None
+        seconds_left, confidence = estimate
+        self._attr_extra_state_attributes = {ATTR_CONFIDENCE: round(confidence * 100)}
+        return now + timedelta(seconds=seconds_left)
+
+
+class CrealityBoxJobSensor(CrealityBoxEntity, SensorEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
+    """creality_box_control job history Sensor class."""
+
+    def __init__(
+        self,
+        coordinator: CrealityBoxDataUpdateCoordinator,
+        entity_description: CrealityBoxJobSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description)
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Update the _attr_native_value from the job history."""
+        value = self.entity_description.value_fn(self.coordinator.jobs)  # pyright: ignore[reportAttributeAccessIssue]
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
+
+
+class CrealityBoxDiagnosticSensor(CrealityBoxEntity, SensorEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
+    """creality_box_control diagnostic Sensor class."""
+
+    def __init__(
+        self,
+        coordinator: CrealityBoxDataUpdateCoordinator,
+        entity_description: CrealityBoxDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description)
+        self._update_value()
 
     @property
-    def native_value(self) -> Any:  # pyright: ignore[reportIncompatibleVariableOverride] # noqa: ANN401
-        """Return the native value of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)  # pyright: ignore[reportAttributeAccessIssue]
+    def available(self) -> bool:
+        """Return True, diagnostics report on the box even when it is unreachable."""
+        return True
+
+    def _update_value(self) -> bool:
+        """Update the _attr_native_value based on the coordinator."""
+        value = self.entity_description.value_fn(self.coordinator)  # pyright: ignore[reportAttributeAccessIssue]
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
+
+
+class CrealityBoxMetricSensor(CrealityBoxDiagnosticSensor):
+    """
+    creality_box_control poll metric Sensor class.
+
+    The metrics change on every poll, so they are written on an interval
+    instead of with every coordinator update.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Start refreshing on the metrics interval."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_refresh,
+                timedelta(seconds=METRICS_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Ignore coordinator updates."""
+
+    @callback
+    def _async_refresh(self, _now: datetime) -> None:
+        """Write the state if a metric changed."""
+        super()._handle_coordinator_update()
@@ -0,0 +1,120 @@
+"""Services sending commands to many boxes at once."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    BULK_COMMAND_TIMEOUT,
+    BULK_MAX_CONCURRENT,
+    DOMAIN,
+    PRINT_PAUSE,
+    PRINT_RESUME,
+    PRINT_STOP,
+)
+
+if TYPE_CHECKING:
+    from .data import CrealityBoxControlConfigEntry
+
+SERVICE_COMMANDS = {
+    "pause": PRINT_PAUSE,
+    "resume": PRINT_RESUME,
+    "stop": PRINT_STOP,
+}
+
+SELECTED_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the bulk command services."""
+    for action, command in SERVICE_COMMANDS.items():
+        hass.services.async_register(
+            DOMAIN,
+            f"{action}_all",
+            partial(_async_command_all, command),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            f"{action}_selected",
+            partial(_async_command_selected, command),
+            schema=SELECTED_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+
+async def _async_command_all(command: str, call: ServiceCall) -> ServiceResponse:
+    """Send the command to every loaded box."""
+    entries = call.hass.config_entries.async_loaded_entries(DOMAIN)
+    return await _async_send_to_boxes(command, entries)
+
+
+async def _async_command_selected(command: str, call: ServiceCall) -> ServiceResponse:
+    """Send the command to the boxes of the selected devices."""
+    device_registry = dr.async_get(call.hass)
+    entries: dict[str, CrealityBoxControlConfigEntry] = {}
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        entry = None
+        if device := device_registry.async_get(device_id):
+            entry = next(
+                (
+                    entry
+                    for entry in call.hass.config_entries.async_loaded_entries(DOMAIN)
+                    if entry.entry_id in device.config_entries
+                ),
+                None,
+            )
+        if entry is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="unknown_device",
+                translation_placeholders={"device_id": device_id},
+            )
+        entries[entry.entry_id] = entry
+    return await _async_send_to_boxes(command, list(entries.values()))
+
+
+async def _async_send_to_boxes(
+    command: str, entries: list[CrealityBoxControlConfigEntry]
+) -> dict[str, Any]:
+    """Send the command to all boxes concurrently and collect the results."""
+    slots = asyncio.Semaphore(BULK_MAX_CONCURRENT)
+
+    async def _async_send(entry: CrealityBoxControlConfigEntry) -> dict[str, Any]:
+        async with slots:
+            try:
+                async with asyncio.timeout(BULK_COMMAND_TIMEOUT):
+                    await entry.runtime_data.coordinator.send_command(command)
+            except TimeoutError:
+                error = "timeout"
+            except Exception as exception:  # noqa: BLE001
+                error = str(exception) or type(exception).__name__
+            else:
+                error = None
+        return {"title": entry.title, "success": error is None, "error": error}
+
+    results = await asyncio.gather(*(_async_send(entry) for entry in entries))
+    return {
+        "boxes": {
+            entry.entry_id: result
+            for entry, result in zip(entries, results, strict=True)
+        }
+    }
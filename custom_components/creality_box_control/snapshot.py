@@ -0,0 +1,147 @@
+"""Compact view of the info payload of a box."""
+
+from __future__ import annotations
+
+import re
+from copy import copy
+from typing import Any
+
+from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+from creality_wifi_box_client.exceptions import InvalidResponseError
+from homeassistant.util.json import json_loads_object
+
+# Attribute name, payload key and type of the fields the entities read
+PROJECTED_FIELDS: tuple[tuple[str, str, type], ...] = (
+    ("state", "state", int),
+    ("connect", "connect", int),
+    ("error", "error", bool),
+    ("upgrade_status", "upgradeStatus", int),
+    ("nozzle_temp", "nozzleTemp", int),
+    ("bed_temp", "bedTemp", int),
+    ("the_1_st_nozzle_temp", "_1st_nozzleTemp", int),
+    ("the_2_nd_nozzle_temp", "_2nd_nozzleTemp", int),
+    ("chamber_temp", "chamberTemp", int),
+    ("nozzle_temp2", "nozzleTemp2", int),
+    ("bed_temp2", "bedTemp2", int),
+    ("print_progress", "printProgress", int),
+    ("print_job_time", "printJobTime", int),
+    ("print_left_time", "printLeftTime", int),
+    ("layer", "layer", int),
+    ("total_layer", "TotalLayer", int),
+    ("cur_position", "curPosition", str),
+    ("cur_feedrate_pct", "curFeedratePct", int),
+    ("fan", "fan", int),
+    ("print_name", "print", str),
+    ("wanip", "wanip", str),
+    ("model", "model", str),
+    ("did_string", "DIDString", str),
+)
+
+# Axis letter and coordinate, as in "X:100.0 Y:100.0 Z:5.0"
+_POSITION = re.compile(r"([XYZ]):\s*(-?\d+(?:\.\d*)?)")
+
+
+def parse_position(text: str) -> tuple[float | None, float | None, float | None]:
+    """Return the X, Y and Z coordinates of a position, None for missing axes."""
+    axes = dict(_POSITION.findall(text))
+    x, y, z = (float(axes[axis]) if axis in axes else None for axis in "XYZ")
+    return x, y, z
+
+
+class BoxSnapshot:
+    """
+    The fields of one poll that the entities read, decoded up front.
+
+    The raw payload is kept and any other BoxInfo attribute is decoded from
+    it on first access.
+    """
+
+    __slots__ = (
+        "_info",
+        "_projected_only",
+        "position",
+        "raw",
+        *(name for name, _, _ in PROJECTED_FIELDS),
+    )
+
+    state: int
+    connect: int
+    error: bool
+    upgrade_status: int
+    nozzle_temp: int
+    bed_temp: int
+    the_1_st_nozzle_temp: int
+    the_2_nd_nozzle_temp: int
+    chamber_temp: int
+    nozzle_temp2: int
+    bed_temp2: int
+    print_progress: int
+    print_job_time: int
+    print_left_time: int
+    layer: int
+    total_layer: int
+    cur_position: str
+    cur_feedrate_pct: int
+    fan: int
+    print_name: str
+    wanip: str
+    model: str
+    did_string: str
+
+    def __init__(self, raw: bytes, *, projected_only: bool = False) -> None:
+        """
+        Decode the projected fields of a raw info payload.
+
+        A payload restored from the snapshot store only holds the projected
+        fields, other attributes of it are missing instead of decoded.
+        """
+        self._projected_only = projected_only
+        try:
+            payload = json_loads_object(raw)
+            for name, key, kind in PROJECTED_FIELDS:
+                setattr(self, name, kind(payload[key]))
+        except (KeyError, TypeError, ValueError) as e:
+            msg = f"Invalid response from WiFi Box: {e!r}"
+            raise InvalidResponseError(msg) from e
+        self.raw = raw
+        # Parsed once here and shared by the entities of all three axes
+        self.position = parse_position(self.cur_position)
+        self._info: BoxInfo | None = None
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Decode the full payload for attributes that are not projected."""
+        if name.startswith("_") or self._projected_only:
+            raise AttributeError(name)
+
+        if self._info is None:
+            self._info = BoxInfo.model_validate(json_loads_object(self.raw))
+        return getattr(self._info, name)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the other snapshot has the same values."""
+        if not isinstance(other, BoxSnapshot):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        """Hash the values of the snapshot."""
+        return hash(self._values())
+
+    def _values(self) -> tuple:
+        """Return the raw payload and the projected values."""
+        return (self.raw, *(getattr(self, name) for name, _, _ in PROJECTED_FIELDS))
+
+    def replace(self, **changes: Any) -> BoxSnapshot:  # noqa: ANN401
+        """Return a copy with some projected fields changed."""
+        snapshot = copy(self)
+        for name, value in changes.items():
+            setattr(snapshot, name, value)
+        return snapshot
+
+    def projected(self) -> dict[str, Any]:
+        """Return the projected fields under their payload keys."""
+        return {key: getattr(self, name) for name, key, _ in PROJECTED_FIELDS}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the decoded raw payload."""
+        return json_loads_object(self.raw)
@@ -0,0 +1,101 @@
+"""Entity values derived from a snapshot in one pass."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .const import LOGGER, STATE_PRINTING, STATE_STOPPING, STATE_SUSPENDING
+
+if TYPE_CHECKING:
+    from .snapshot import BoxSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class BoxView:
+    """
+    The values of the sensors and binary sensors of a box.
+
+    Every field is named after the key of the entity showing it, so an
+    entity only reads its own slot. A view is derived once per snapshot and
+    shared by all entities of the box.
+    """
+
+    wanip: str
+    state: str
+    print_job_time: str
+    print_left_time: str
+    print_name: str
+    nozzle_temp: int
+    bed_temp: int
+    print_progress: int
+    position_x: float | None
+    position_y: float | None
+    position_z: float | None
+    layer: int
+    layer_progress: float | None
+    feed_rate: int
+    the_1_st_nozzle_temp: int
+    the_2_nd_nozzle_temp: int
+    nozzle_temp2: int
+    bed_temp2: int
+    chamber_temp: int
+    upgrade_status: bool
+    error: bool
+    fan: bool
+
+    @classmethod
+    def from_snapshot(cls, data: BoxSnapshot) -> BoxView:
+        """Derive the values of all entities from a snapshot."""
+        position_x, position_y, position_z = data.position
+        return cls(
+            wanip=data.wanip,
+            state=_map_state(data.state, data.connect),
+            print_job_time=_to_time_left(data.print_job_time),
+            print_left_time=_to_time_left(data.print_left_time),
+            print_name=data.print_name,
+            nozzle_temp=data.nozzle_temp,
+            bed_temp=data.bed_temp,
+            print_progress=data.print_progress,
+            position_x=position_x,
+            position_y=position_y,
+            position_z=position_z,
+            layer=data.layer,
+            layer_progress=_to_layer_progress(data.layer, data.total_layer),
+            feed_rate=data.cur_feedrate_pct,
+            the_1_st_nozzle_temp=data.the_1_st_nozzle_temp,
+            the_2_nd_nozzle_temp=data.the_2_nd_nozzle_temp,
+            nozzle_temp2=data.nozzle_temp2,
+            bed_temp2=data.bed_temp2,
+            chamber_temp=data.chamber_temp,
+            upgrade_status=bool(data.upgrade_status),
+            error=data.error,
+            fan=bool(data.fan),
+        )
+
+
+def _map_state(state: int, connect: int) -> str:
+    # Map the state
+    # Pieced together from
+    # https://github.com/CrealityOfficial/CrealityPrint/tree/release-v5.0.3/plugins/CrealityUI/CrealityUI/lanprinterqml
+    LOGGER.debug(f"State:{state} Connect:{connect}")
+    if connect != 1:
+        return "Offline"
+    if state == STATE_PRINTING:
+        return "Printing"
+    if state == STATE_STOPPING:
+        return "Stopping"
+    if state == STATE_SUSPENDING:
+        return "Suspending"
+    return "Idle"
+
+
+def _to_time_left(seconds_left: int) -> str:
+    return str(timedelta(seconds=seconds_left))
+
+
+def _to_layer_progress(layer: int, total_layer: int) -> float | None:
+    if total_layer <= 0:
+        return None
+    return round(min(layer / total_layer, 1) * 100, 1)
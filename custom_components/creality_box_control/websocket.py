@@ -0,0 +1,95 @@
+"""Websocket commands for dashboards."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .data import CrealityBoxControlConfigEntry
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_history)
+    websocket_api.async_register_command(hass, websocket_jobs)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/history",
+        vol.Required("entry_id"): str,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the recent samples of a box."""
+    if (entry := _async_get_loaded_entry(hass, connection, msg)) is None:
+        return
+    history = entry.runtime_data.coordinator.history
+    connection.send_result(msg["id"], history.samples(msg.get("max_points")))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/jobs",
+        vol.Required("entry_id"): str,
+        vol.Optional("print_name"): str,
+        vol.Optional("start"): vol.Coerce(float),
+        vol.Optional("end"): vol.Coerce(float),
+    }
+)
+@callback
+def websocket_jobs(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the jobs of a box, filtered by file name and end time."""
+    if (entry := _async_get_loaded_entry(hass, connection, msg)) is None:
+        return
+    jobs = entry.runtime_data.coordinator.jobs
+    connection.send_result(
+        msg["id"],
+        {
+            "jobs": jobs.query(
+                print_name=msg.get("print_name"),
+                start=msg.get("start"),
+                end=msg.get("end"),
+            )
+        },
+    )
+
+
+@callback
+def _async_get_loaded_entry(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> CrealityBoxControlConfigEntry | None:
+    """Return the loaded entry of the message or send an error."""
+    entry: CrealityBoxControlConfigEntry | None = hass.config_entries.async_get_entry(
+        msg["entry_id"]
+    )
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Box is not loaded"
+        )
+        return None
+    return entry
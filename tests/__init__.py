@@ -1,11 +1,19 @@
 """Tests for the Creality Box Control integration."""
 
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.json import json_bytes
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
 __all__ = [
     "TEST_CONFIG_ENTRY_ID",
     "TEST_HOST",
     "TEST_MODEL",
     "TEST_PORT",
     "TEST_TITLE",
+    "box_payload",
 ]
 
 TEST_HOST = "192.168.1.50"
@@ -13,3 +21,10 @@ TEST_MODEL = "CR-Box"
 TEST_CONFIG_ENTRY_ID = "test_entry_id"
 TEST_TITLE = "CR-Box"
 TEST_PORT = 81
+
+
+def box_payload(info: BoxInfo, **changes: Any) -> bytes:  # noqa: ANN401
+    """Return the raw payload the box sends for the info with some fields changed."""
+    return json_bytes(
+        info.model_copy(update=changes).model_dump(mode="json", by_alias=True)
+    )
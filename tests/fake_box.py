@@ -0,0 +1,133 @@
+"""Local stand-in for the HTTP API of Creality Wifi Boxes."""
+
+import asyncio
+import itertools
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from aiohttp import web
+
+FAKE_HOST = "127.0.0.1"
+
+_INFO = json.loads(
+    (Path(__file__).parent / "fixtures" / "mock_box_info.json").read_text(
+        encoding="utf-8"
+    )
+)
+_DID_STRINGS = itertools.count()
+
+
+def _info() -> dict[str, Any]:
+    """Return a copy of the fixture info with a DIDString unique to the box."""
+    return {**_INFO, "DIDString": f"FAKE{next(_DID_STRINGS):05d}"}
+
+
+@dataclass
+class FakeBox:
+    """
+    One simulated box.
+
+    Every info request advances the print by `progress_step` percent until the
+    job finishes. Requests wait `latency` seconds and fail with an HTTP 500 at
+    `failure_rate`.
+    """
+
+    latency: float = 0.0
+    failure_rate: float = 0.0
+    progress_step: int = 1
+    seed: int | None = None
+    info: dict[str, Any] = field(default_factory=_info)
+    requests: int = 0
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        """Seed the failure generator so runs are repeatable."""
+        self._random = random.Random(self.seed)  # noqa: S311
+
+    def advance(self) -> None:
+        """Move the simulated print forward by one step."""
+        info = self.info
+        if info["state"] != 1:
+            return
+        info["printProgress"] = min(info["printProgress"] + self.progress_step, 100)
+        info["printJobTime"] += 10
+        info["printLeftTime"] = max(info["printLeftTime"] - 10, 0)
+        info["layer"] = min(info["layer"] + 1, info["TotalLayer"])
+        if info["printProgress"] == 100:  # noqa: PLR2004
+            info["state"] = 0
+            info["print"] = ""
+
+    def command(self, query: dict[str, str]) -> None:
+        """Apply a pause, resume or stop command."""
+        if query.get("stop") == "1":
+            self.info["state"] = 4
+        elif query.get("pause") == "1":
+            self.info["state"] = 5
+        elif query.get("pause") == "0":
+            self.info["state"] = 1
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Answer one request to the box."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            return web.Response(status=500)
+        query = request.query
+        if query.get("fname") == "Info" and query.get("function") == "get":
+            self.advance()
+            return web.json_response(self.info)
+        if query.get("fname") == "net" and query.get("function") == "set":
+            self.command(query)
+            return web.json_response({"error": 0})
+        return web.Response(status=404)
+
+
+class FakeBoxServer:
+    """Serve fake boxes, one port each, from a thread with its own event loop."""
+
+    def __init__(self, boxes: list[FakeBox]) -> None:
+        """Initialize the server."""
+        self.boxes = boxes
+        self._by_port: dict[int, FakeBox] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="fake-box-server", daemon=True
+        )
+        self._runner: web.AppRunner | None = None
+
+    def __enter__(self) -> Self:
+        """Start serving and assign a port to every box."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._async_start(), self._loop).result()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop serving and join the thread."""
+        asyncio.run_coroutine_threadsafe(self._async_stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _async_start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/protocal.csp", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for box in self.boxes:
+            site = web.TCPSite(self._runner, FAKE_HOST, 0)
+            await site.start()
+            box.port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001 # pyright: ignore[reportOptionalMemberAccess]
+            self._by_port[box.port] = box
+
+    async def _async_stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        port = request.transport.get_extra_info("sockname")[1]  # pyright: ignore[reportOptionalMemberAccess]
+        return await self._by_port[port].handle(request)
@@ -5,11 +5,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.const import Platform
+from homeassistant.exceptions import ConfigEntryError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.creality_box_control import (
+    _async_claim_box,
     async_reload_entry,
+    async_remove_entry,
+    async_setup,
     async_setup_entry,
     async_unload_entry,
+    async_update_options,
+)
+from custom_components.creality_box_control.const import (
+    CONF_ENTITY_GROUPS,
+    CONF_FARM_SCHEDULER,
+    CONF_HISTORY_SIZE,
+    DOMAIN,
+    ENTITY_GROUP_JOBS,
+    ENTITY_GROUPS,
 )
 
 if TYPE_CHECKING:
@@ -36,29 +50,118 @@ def skip_first_refresh() -> Generator:
         yield mock
 
 
+async def test_async_setup(hass: HomeAssistant) -> None:
+    """Test the bulk command services are registered."""
+    assert await async_setup(hass, {}) is True
+    assert hass.services.has_service(DOMAIN, "stop_all")
+    assert hass.services.has_service(DOMAIN, "stop_selected")
+
+
 async def test_async_setup_entry(hass: HomeAssistant) -> None:
     """Test the async_setup_entry function."""
-    entry = MagicMock()
+    entry = MagicMock(options={})
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     entry.add_update_listener = MagicMock()
 
     with (
         patch(
-            "custom_components.creality_box_control.CrealityBoxDataUpdateCoordinator"
+            "custom_components.creality_box_control.coordinator.CrealityBoxDataUpdateCoordinator"
         ) as mock_coordinator,
         patch(
             "custom_components.creality_box_control.async_get_loaded_integration"
         ) as mock_get_loaded_integration,
     ):
+        mock_coordinator.return_value.async_load_snapshot = AsyncMock(
+            return_value=False
+        )
         mock_coordinator.return_value.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.return_value.jobs.async_load = AsyncMock()
         mock_get_loaded_integration.return_value = MagicMock()
         result = await async_setup_entry(hass, entry)
         assert result is True
         mock_coordinator.return_value.async_config_entry_first_refresh.assert_called_once()
+        mock_coordinator.return_value.jobs.async_load.assert_awaited_once()
         hass.config_entries.async_forward_entry_setups.assert_called_once_with(
             entry, [Platform.BUTTON, Platform.SENSOR, Platform.BINARY_SENSOR]
         )
-        entry.add_update_listener.assert_called_once_with(async_reload_entry)
+        listener = entry.add_update_listener.call_args[0][0]
+        assert listener.func is async_update_options
+        assert listener.keywords == {
+            "reload_options": {
+                CONF_ENTITY_GROUPS: set(ENTITY_GROUPS),
+                CONF_FARM_SCHEDULER: False,
+            }
+        }
+
+
+async def test_async_setup_entry_farm_scheduler(hass: HomeAssistant) -> None:
+    """Test the coordinator joins the farm scheduler when enabled."""
+    entry = MagicMock(options={CONF_FARM_SCHEDULER: True})
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+
+    with (
+        patch(
+            "custom_components.creality_box_control.coordinator.CrealityBoxDataUpdateCoordinator"
+        ) as mock_coordinator,
+        patch("custom_components.creality_box_control.async_get_loaded_integration"),
+        patch(
+            "custom_components.creality_box_control.async_get_farm_scheduler"
+        ) as mock_scheduler,
+    ):
+        mock_coordinator.return_value.async_load_snapshot = AsyncMock(
+            return_value=False
+        )
+        mock_coordinator.return_value.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.return_value.jobs.async_load = AsyncMock()
+        assert await async_setup_entry(hass, entry) is True
+
+    register = mock_scheduler.return_value.async_register
+    register.assert_called_once_with(mock_coordinator.return_value)
+    entry.async_on_unload.assert_any_call(register.return_value)
+
+
+async def test_async_setup_entry_from_snapshot(hass: HomeAssistant) -> None:
+    """Test setup does not wait for the box when a snapshot was loaded."""
+    entry = MagicMock(options={})
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+
+    with (
+        patch(
+            "custom_components.creality_box_control.coordinator.CrealityBoxDataUpdateCoordinator"
+        ) as mock_coordinator,
+        patch("custom_components.creality_box_control.async_get_loaded_integration"),
+    ):
+        coordinator = mock_coordinator.return_value
+        coordinator.async_load_snapshot = AsyncMock(return_value=True)
+        coordinator.async_config_entry_first_refresh = AsyncMock()
+        coordinator.jobs.async_load = AsyncMock()
+        assert await async_setup_entry(hass, entry) is True
+
+    coordinator.async_config_entry_first_refresh.assert_not_called()
+    hass.config_entries.async_forward_entry_setups.assert_called_once()
+    entry.async_create_background_task.assert_called_once()
+    assert (
+        entry.async_create_background_task.call_args[0][1]
+        is coordinator.async_refresh.return_value
+    )
+
+
+async def test_async_remove_entry(hass: HomeAssistant) -> None:
+    """Test the snapshot and the job history are removed with the entry."""
+    entry = MagicMock(entry_id="test_entry_id")
+    with (
+        patch(
+            "custom_components.creality_box_control.coordinator.snapshot_store"
+        ) as snapshot,
+        patch("custom_components.creality_box_control.jobs_store") as jobs,
+    ):
+        snapshot.return_value.async_remove = AsyncMock()
+        jobs.return_value.async_remove = AsyncMock()
+        await async_remove_entry(hass, entry)
+
+    for mock_store in (snapshot, jobs):
+        mock_store.assert_called_once_with(hass, "test_entry_id")
+        mock_store.return_value.async_remove.assert_awaited_once()
 
 
 async def test_async_unload_entry(hass: HomeAssistant) -> None:
@@ -83,3 +186,71 @@ async def test_async_reload_entry(hass: HomeAssistant) -> None:
     hass.config_entries.async_reload = AsyncMock()
     await async_reload_entry(hass, entry)
     hass.config_entries.async_reload.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_async_update_options_in_place(hass: HomeAssistant) -> None:
+    """Test options that keep the entities are applied without a reload."""
+    entry = MagicMock(
+        options={
+            CONF_HISTORY_SIZE: 100,
+            CONF_ENTITY_GROUPS: list(reversed(ENTITY_GROUPS)),
+        }
+    )
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_options(
+        hass,
+        entry,
+        reload_options={
+            CONF_ENTITY_GROUPS: set(ENTITY_GROUPS),
+            CONF_FARM_SCHEDULER: False,
+        },
+    )
+
+    hass.config_entries.async_reload.assert_not_awaited()
+    entry.runtime_data.coordinator.async_apply_options.assert_called_once_with()
+
+
+async def test_async_update_options_reload(hass: HomeAssistant) -> None:
+    """Test changing the entity groups reloads the entry."""
+    entry = MagicMock(options={CONF_ENTITY_GROUPS: [ENTITY_GROUP_JOBS]})
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_options(
+        hass,
+        entry,
+        reload_options={
+            CONF_ENTITY_GROUPS: set(ENTITY_GROUPS),
+            CONF_FARM_SCHEDULER: False,
+        },
+    )
+
+    hass.config_entries.async_reload.assert_awaited_once_with(entry.entry_id)
+    entry.runtime_data.coordinator.async_apply_options.assert_not_called()
+
+
+@pytest.mark.parametrize("unique_id", [None, "12345"])
+async def test_claim_box(hass: HomeAssistant, unique_id: str | None) -> None:
+    """Test entries without a unique ID are keyed on the device id."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Box", unique_id=unique_id)
+    entry.add_to_hass(hass)
+    entry.runtime_data = MagicMock()
+    entry.runtime_data.coordinator.data.did_string = "12345"
+
+    _async_claim_box(hass, entry)
+
+    assert entry.unique_id == "12345"
+
+
+async def test_claim_box_duplicate(hass: HomeAssistant) -> None:
+    """Test a second entry of a configured box is not set up."""
+    MockConfigEntry(domain=DOMAIN, title="First", unique_id="12345").add_to_hass(hass)
+    entry = MockConfigEntry(domain=DOMAIN, title="Second")
+    entry.add_to_hass(hass)
+    entry.runtime_data = MagicMock()
+    entry.runtime_data.coordinator.data.did_string = "12345"
+
+    with pytest.raises(ConfigEntryError, match="Second is the same box as First"):
+        _async_claim_box(hass, entry)
+
+    assert entry.unique_id is None
@@ -0,0 +1,119 @@
+"""Tests for the shared session client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from creality_wifi_box_client.exceptions import (
+    ClientConnectionError,
+    RequestTimeoutError,
+)
+
+from custom_components.creality_box_control.api import CrealityBoxClient
+from tests import TEST_HOST, TEST_PORT
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Mock the shared session."""
+    return MagicMock(closed=False, close=AsyncMock())
+
+
+@pytest.fixture
+def client(session: MagicMock) -> CrealityBoxClient:
+    """Create a client bound to the mock session."""
+    return CrealityBoxClient(
+        session=session, box_ip=TEST_HOST, box_port=TEST_PORT, timeout=1
+    )
+
+
+async def test_uses_shared_session(
+    client: CrealityBoxClient, session: MagicMock
+) -> None:
+    """Test the client reuses the shared session and never closes it."""
+    assert await client._get_session() is session  # noqa: SLF001
+
+    await client.close()
+
+    session.close.assert_not_called()
+
+
+async def test_get_info(client: CrealityBoxClient) -> None:
+    """Test get_info is delegated to the library."""
+    with patch(
+        "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient.get_info",
+        return_value="info",
+    ) as mock_get_info:
+        assert await client.get_info() == "info"
+        mock_get_info.assert_awaited_once()
+
+
+async def test_get_info_timeout(client: CrealityBoxClient) -> None:
+    """Test get_info gives up after the request timeout."""
+    client._timeout = MagicMock(total=0.01)  # noqa: SLF001
+
+    async def _hang() -> None:
+        await asyncio.sleep(1)
+
+    with (
+        patch(
+            "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient.get_info",
+            side_effect=_hang,
+        ),
+        pytest.raises(TimeoutError),
+    ):
+        await client.get_info()
+
+
+async def test_set_timeout(client: CrealityBoxClient) -> None:
+    """Test the timeout of the following requests can be changed."""
+    client.set_timeout(15)
+
+    assert client._timeout.total == 15  # noqa: SLF001, PLR2004
+
+
+async def test_get_info_raw(client: CrealityBoxClient, session: MagicMock) -> None:
+    """Test get_info_raw returns the undecoded payload."""
+    response = session.get.return_value.__aenter__.return_value
+    response.raise_for_status = MagicMock()
+    response.read = AsyncMock(return_value=b'{"state": 1}')
+
+    assert await client.get_info_raw() == b'{"state": 1}'
+    session.get.assert_called_once_with(
+        f"http://{TEST_HOST}:{TEST_PORT}/protocal.csp?fname=Info&opt=main&function=get"
+    )
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "expected"),
+    [
+        (aiohttp.ServerTimeoutError(), RequestTimeoutError),
+        (
+            aiohttp.ClientResponseError(MagicMock(), (), status=500),
+            ClientConnectionError,
+        ),
+        (aiohttp.ClientConnectionError(), ClientConnectionError),
+    ],
+)
+async def test_get_info_raw_errors(
+    client: CrealityBoxClient,
+    session: MagicMock,
+    side_effect: Exception,
+    expected: type[Exception],
+) -> None:
+    """Test request errors are raised as library errors."""
+    session.get.side_effect = side_effect
+
+    with pytest.raises(expected):
+        await client.get_info_raw()
+
+
+async def test_send_command(client: CrealityBoxClient) -> None:
+    """Test commands are delegated to the library."""
+    with patch(
+        "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient._send_command",
+        return_value=True,
+    ) as mock_send:
+        assert await client.pause_print() is True
+        mock_send.assert_awaited_once()
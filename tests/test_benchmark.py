@@ -0,0 +1,204 @@
+"""
+Benchmarks against fake boxes served over HTTP.
+
+They are deselected by default, run `pytest -m benchmark -s --no-cov` to print
+the results.
+"""
+
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.creality_box_control.const import (
+    DEFAULT_FAST_INTERVAL,
+    DOMAIN,
+    HOST,
+    MODEL,
+    PORT,
+)
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.view import BoxView
+from tests import TEST_MODEL, box_payload
+from tests.fake_box import FAKE_HOST, FakeBox, FakeBoxServer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.creality_box_control.coordinator import (
+        CrealityBoxDataUpdateCoordinator,
+    )
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.usefixtures("socket_enabled")]
+
+ROUNDS = 5
+VIEW_ROUNDS = 10000
+
+# Imports the modules Home Assistant has loaded by the time it sets up an
+# integration, then times importing the integration and its config flow
+IMPORT_SCRIPT = """
+import json, sys, time
+import homeassistant.components.websocket_api
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+start = time.perf_counter()
+import custom_components.creality_box_control
+import custom_components.creality_box_control.config_flow
+print(json.dumps({
+    "import_ms": (time.perf_counter() - start) * 1000,
+    "client_loaded": "creality_wifi_box_client" in sys.modules,
+}))
+"""
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None):  # noqa: ANN201, ARG001
+    """Enable custom integrations."""
+    return
+
+
+async def _async_setup_boxes(
+    hass: HomeAssistant, server: FakeBoxServer
+) -> list[CrealityBoxDataUpdateCoordinator]:
+    """Set up one config entry per fake box."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            title=f"{TEST_MODEL}@{FAKE_HOST}:{box.port}",
+            data={HOST: FAKE_HOST, PORT: box.port, MODEL: TEST_MODEL},
+        )
+        for box in server.boxes
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return [entry.runtime_data.coordinator for entry in entries]
+
+
+async def _async_timed(refresh: Callable, latencies: list[float]) -> None:
+    start = time.perf_counter()
+    await refresh()
+    latencies.append(time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("box_count", [1, 10, 200])
+async def test_poll_benchmark(
+    hass: HomeAssistant,
+    box_count: int,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Measure poll latency, event loop time and state writes per box count."""
+    boxes = [FakeBox(latency=0.005, seed=index) for index in range(box_count)]
+    with FakeBoxServer(boxes) as server:
+        coordinators = await _async_setup_boxes(hass, server)
+        latencies: list[float] = []
+        writes = 0
+
+        def _count_write(entity: Entity) -> None:
+            nonlocal writes
+            writes += 1
+            write_ha_state(entity)
+
+        write_ha_state = Entity.async_write_ha_state
+        with patch.object(Entity, "async_write_ha_state", _count_write):
+            loop_start = time.thread_time()
+            for _ in range(ROUNDS):
+                await asyncio.gather(
+                    *(
+                        _async_timed(coordinator.async_refresh, latencies)
+                        for coordinator in coordinators
+                    )
+                )
+            loop_time = time.thread_time() - loop_start
+
+        assert all(coordinator.last_update_success for coordinator in coordinators)
+        assert all(box.info["printProgress"] > 56 for box in boxes)  # noqa: PLR2004
+
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    polls = ROUNDS * box_count
+    latencies.sort()
+    results = {
+        "poll_p50_ms": statistics.median(latencies) * 1000,
+        "poll_p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "loop_ms_per_update": loop_time / polls * 1000,
+        "writes_per_minute": writes / ROUNDS * 60 / DEFAULT_FAST_INTERVAL,
+    }
+    for name, value in results.items():
+        record_property(name, value)
+    print(  # noqa: T201
+        f"{box_count} boxes:",
+        " ".join(f"{name}={value:.2f}" for name, value in results.items()),
+    )
+    assert writes > 0
+
+
+async def test_fake_box_commands(hass: HomeAssistant) -> None:
+    """Test commands change the state served by the fake box."""
+    box = FakeBox()
+    with FakeBoxServer([box]) as server:
+        (coordinator,) = await _async_setup_boxes(hass, server)
+
+        await coordinator.send_command("print_pause")
+        await coordinator.async_refresh()
+        assert coordinator.data.state == 5  # noqa: PLR2004
+
+        await coordinator.send_command("print_resume")
+        await coordinator.send_command("print_stop")
+        await coordinator.async_refresh()
+        assert coordinator.data.state == 4  # noqa: PLR2004
+
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+def test_import_time(record_property: Callable[[str, object], None]) -> None:
+    """Measure the import time and check the client library is loaded lazily."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    results = json.loads(result.stdout)
+
+    record_property("import_ms", results["import_ms"])
+    print(f"import_ms={results['import_ms']:.2f}")  # noqa: T201
+    assert not results["client_loaded"]
+
+
+def test_view_benchmark(
+    mock_box_info: BoxInfo, record_property: Callable[[str, object], None]
+) -> None:
+    """Measure deriving the values of all entities from a snapshot."""
+    snapshots = [
+        BoxSnapshot(box_payload(mock_box_info, print_progress=progress))
+        for progress in range(100)
+    ]
+    start = time.perf_counter()
+    for index in range(VIEW_ROUNDS):
+        BoxView.from_snapshot(snapshots[index % len(snapshots)])
+    view_us = (time.perf_counter() - start) / VIEW_ROUNDS * 1_000_000
+
+    record_property("view_us", view_us)
+    print(f"view_us={view_us:.2f}")  # noqa: T201
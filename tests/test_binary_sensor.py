@@ -1,17 +1,31 @@
 """Tests for the binary sensor platform."""
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
 from custom_components.creality_box_control.binary_sensor import (
     ENTITY_DESCRIPTIONS,
+    TOOLHEAD_ENTITY_DESCRIPTIONS,
     CrealityBoxBinarySensor,
     async_setup_entry,
 )
-from custom_components.creality_box_control.const import DOMAIN, HOST, MODEL
-from tests import TEST_CONFIG_ENTRY_ID, TEST_HOST, TEST_MODEL, TEST_TITLE
+from custom_components.creality_box_control.const import (
+    CONF_ENTITY_GROUPS,
+    DOMAIN,
+    HOST,
+    MODEL,
+)
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.view import BoxView
+from tests import (
+    TEST_CONFIG_ENTRY_ID,
+    TEST_HOST,
+    TEST_MODEL,
+    TEST_TITLE,
+    box_payload,
+)
 
 if TYPE_CHECKING:
     from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
@@ -21,8 +35,8 @@ if TYPE_CHECKING:
 @pytest.fixture
 def coordinator(mock_box_info: BoxInfo) -> MagicMock:
     """Mock the coordinator."""
-    return MagicMock(
-        data=mock_box_info,
+    coordinator = MagicMock(
+        data=BoxSnapshot(box_payload(mock_box_info)),
         config_entry=MagicMock(
             data={HOST: TEST_HOST, MODEL: TEST_MODEL},
             entry_id=TEST_CONFIG_ENTRY_ID,
@@ -30,40 +44,28 @@ def coordinator(mock_box_info: BoxInfo) -> MagicMock:
             domain=DOMAIN,
         ),
     )
+    type(coordinator).view = PropertyMock(
+        side_effect=lambda: BoxView.from_snapshot(coordinator.data)
+    )
+    return coordinator
 
 
 @pytest.mark.parametrize(
-    ("entity_description", "expected_state"),
-    [
-        (
-            MagicMock(
-                key="upgrade_status",
-                name="Upgrade Available",
-                value_fn=lambda x: bool(x.upgrade_status),
-            ),
-            False,
-        ),
-        (
-            MagicMock(key="error", name="error", value_fn=lambda x: x.error),
-            False,
-        ),
-        (
-            MagicMock(
-                key="none",
-                name="None",
-                value_fn=lambda x: None,  # noqa: ARG005
-            ),
-            None,
-        ),
-    ],
+    ("key", "expected_state"),
+    [("upgrade_status", False), ("error", False), ("fan", False)],
 )
 async def test_binary_sensor(
     coordinator: MagicMock,
-    entity_description: MagicMock,
-    expected_state: bool | None,  # noqa: FBT001
+    key: str,
+    expected_state: bool,  # noqa: FBT001
 ) -> None:
     """Test the binary sensor."""
     # Arrange
+    entity_description = next(
+        entity_description
+        for entity_description in ENTITY_DESCRIPTIONS + TOOLHEAD_ENTITY_DESCRIPTIONS
+        if entity_description.key == key
+    )
     # Act
     sensor = CrealityBoxBinarySensor(
         coordinator=coordinator, entity_description=entity_description
@@ -74,7 +76,7 @@ async def test_binary_sensor(
 
 async def test_binary_sensor_setup_entry(hass: HomeAssistant) -> None:
     """Test the async_setup_entry function."""
-    entry = MagicMock()
+    entry = MagicMock(options={})
     coordinator = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
     entry.runtime_data = MagicMock(coordinator=coordinator)
@@ -87,18 +89,19 @@ async def test_binary_sensor_setup_entry(hass: HomeAssistant) -> None:
 
     # Assert that async_add_entities was called with a list of the expected sensors
     assert async_add_entities.call_count == 1
+    assert len(sensors) == len(ENTITY_DESCRIPTIONS) + len(TOOLHEAD_ENTITY_DESCRIPTIONS)
+
+    # Without the toolhead group the fan is not created
+    entry.options = {CONF_ENTITY_GROUPS: []}
+    await async_setup_entry(hass, entry, async_add_entities)
+    sensors = list(async_add_entities.call_args[0][0])
     assert len(sensors) == len(ENTITY_DESCRIPTIONS)
 
 
 async def test_binary_sensor_update(coordinator: MagicMock) -> None:
     """Test the binary sensor update."""
-    entity_description = MagicMock(
-        key="upgrade_status",
-        name="Upgrade Available",
-        value_fn=lambda x: bool(x.upgrade_status),
-    )
     sensor = CrealityBoxBinarySensor(
-        coordinator=coordinator, entity_description=entity_description
+        coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[0]
     )
     sensor.async_write_ha_state = MagicMock()
 
@@ -106,7 +109,7 @@ async def test_binary_sensor_update(coordinator: MagicMock) -> None:
     assert sensor.is_on is False
 
     # Update data
-    coordinator.data = MagicMock(upgrade_status=1)
+    coordinator.data = coordinator.data.replace(upgrade_status=1)
 
     # Act
     sensor._handle_coordinator_update()  # noqa: SLF001
@@ -114,3 +117,20 @@ async def test_binary_sensor_update(coordinator: MagicMock) -> None:
     # Assert
     assert sensor.is_on is True
     sensor.async_write_ha_state.assert_called_once()
+
+
+async def test_binary_sensor_writes_only_changes(coordinator: MagicMock) -> None:
+    """Test the binary sensor skips the state write when nothing changed."""
+    sensor = CrealityBoxBinarySensor(
+        coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[1]
+    )
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    sensor.async_write_ha_state.assert_not_called()
+
+    # Losing the connection still writes the unavailable state once
+    coordinator.last_update_success = False
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    sensor.async_write_ha_state.assert_called_once()
@@ -0,0 +1,63 @@
+"""Tests for the circuit breaker."""
+
+import pytest
+
+from custom_components.creality_box_control.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from custom_components.creality_box_control.const import POLL_JITTER
+
+
+@pytest.fixture
+def breaker() -> CircuitBreaker:
+    """Create a breaker that opens after two failures."""
+    return CircuitBreaker(failure_threshold=2, base_delay=10, max_delay=35)
+
+
+def test_opens_after_threshold(breaker: CircuitBreaker) -> None:
+    """Test the circuit opens after consecutive failures."""
+    assert breaker.record_failure(0) is False
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.record_failure(0) is True
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow_request(1) is False
+
+
+def test_probe_after_delay(breaker: CircuitBreaker) -> None:
+    """Test the circuit half opens once the retry delay has passed."""
+    breaker.record_failure(0)
+    breaker.record_failure(0)
+    retry_in = breaker.seconds_until_retry(0)
+    assert 10 * (1 - POLL_JITTER) <= retry_in <= 10 * (1 + POLL_JITTER)
+
+    assert breaker.allow_request(retry_in) is True
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.seconds_until_retry(retry_in) == 0
+
+
+def test_failed_probe_backs_off(breaker: CircuitBreaker) -> None:
+    """Test failed probes double the delay up to the maximum."""
+    breaker.record_failure(0)
+    breaker.record_failure(0)
+    breaker.allow_request(100)
+
+    assert breaker.record_failure(100) is True
+    assert breaker.state is CircuitState.OPEN
+    retry_in = breaker.seconds_until_retry(100)
+    assert 20 * (1 - POLL_JITTER) <= retry_in <= 20 * (1 + POLL_JITTER)
+
+    breaker.record_failure(200)
+    assert breaker.seconds_until_retry(200) <= 35 * (1 + POLL_JITTER)
+
+
+def test_success_closes(breaker: CircuitBreaker) -> None:
+    """Test a success closes the circuit and resets the failures."""
+    assert breaker.record_success() is False
+    breaker.record_failure(0)
+    breaker.record_failure(0)
+
+    assert breaker.record_success() is True
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow_request(0) is True
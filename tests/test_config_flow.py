@@ -1,19 +1,44 @@
 """Tests for the config flow."""
 
 import pathlib
+from dataclasses import asdict
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_INTEGRATION_DISCOVERY
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.loader import Integration
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.creality_box_control.config_flow import CrealityBoxFlowHandler
-from custom_components.creality_box_control.const import DOMAIN, HOST, MODEL, PORT
+from custom_components.creality_box_control.const import (
+    CONF_BACKOFF_INTERVAL,
+    CONF_BOXES,
+    CONF_ENTITY_GROUPS,
+    CONF_ETA_DRIFT,
+    CONF_FAILURE_THRESHOLD,
+    CONF_FARM_SCHEDULER,
+    CONF_FAST_INTERVAL,
+    CONF_HISTORY_SIZE,
+    CONF_HYSTERESIS,
+    CONF_NETWORK,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_INTERVAL,
+    DOMAIN,
+    ENTITY_GROUP_JOBS,
+    HOST,
+    MODEL,
+    PORT,
+)
+from custom_components.creality_box_control.discovery import DiscoveredBox
 from tests import TEST_HOST, TEST_MODEL, TEST_PORT
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.config_entries import ConfigFlowResult
     from homeassistant.core import HomeAssistant
 
 pytestmark = pytest.mark.asyncio
@@ -68,9 +93,42 @@ async def test_show_form(hass: HomeAssistant) -> None:
     )
     assert "type" in result
     assert "step_id" in result
-    assert result["type"] == FlowResultType.FORM
+    assert result["type"] == FlowResultType.MENU
     assert result["step_id"] == "user"
 
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "manual"
+
+
+async def _async_configure_step(
+    hass: HomeAssistant, step_id: str, user_input: dict
+) -> ConfigFlowResult:
+    """Pick a step from the user menu and submit its form."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": step_id}
+    )
+    return await hass.config_entries.flow.async_configure(result["flow_id"], user_input)
+
+
+async def _async_scan(
+    hass: HomeAssistant, user_input: dict, flow_id: str | None = None
+) -> ConfigFlowResult:
+    """Submit the scan form and wait for the scan to finish."""
+    if flow_id is None:
+        result = await _async_configure_step(hass, "scan", user_input)
+    else:
+        result = await hass.config_entries.flow.async_configure(flow_id, user_input)
+    assert result["type"] == FlowResultType.SHOW_PROGRESS
+    assert result["progress_action"] == "scan"
+    await hass.async_block_till_done()
+    return await hass.config_entries.flow.async_configure(result["flow_id"])
+
 
 async def test_create_entry(
     hass: HomeAssistant, mock_client: AsyncMock, mock_box_info: BoxInfo
@@ -85,16 +143,40 @@ async def test_create_entry(
         return_value=mock_box_info,
     ):
         # Act
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": "user"},
-            data={HOST: TEST_HOST, PORT: TEST_PORT},
+        result = await _async_configure_step(
+            hass, "manual", {HOST: TEST_HOST, PORT: TEST_PORT}
         )
 
         # Assert
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["title"] == f"{TEST_MODEL}@{TEST_HOST}"
         assert result["data"] == {HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL}
+        assert result["result"].unique_id == mock_box_info.did_string
+
+
+async def test_manual_already_configured(
+    hass: HomeAssistant, mock_box_info: BoxInfo
+) -> None:
+    """Test adding a configured box by another address updates its address."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=mock_box_info.did_string,
+        data={HOST: "192.168.1.20", PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient.get_info",
+        return_value=mock_box_info,
+    ):
+        result = await _async_configure_step(
+            hass, "manual", {HOST: TEST_HOST, PORT: TEST_PORT}
+        )
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data[HOST] == TEST_HOST
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 1
 
 
 async def test_cannot_connect(hass: HomeAssistant) -> None:
@@ -105,10 +187,8 @@ async def test_cannot_connect(hass: HomeAssistant) -> None:
         side_effect=Exception("Connection error"),
     ):
         # Act
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": "user"},
-            data={HOST: TEST_HOST, PORT: TEST_PORT},
+        result = await _async_configure_step(
+            hass, "manual", {HOST: TEST_HOST, PORT: TEST_PORT}
         )
 
     # Assert
@@ -125,10 +205,8 @@ async def test_blank_model(hass: HomeAssistant) -> None:
         return_value=info,
     ):
         # Act
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": "user"},
-            data={HOST: TEST_HOST, PORT: TEST_PORT},
+        result = await _async_configure_step(
+            hass, "manual", {HOST: TEST_HOST, PORT: TEST_PORT}
         )
 
     # Assert - It should error and show the form again
@@ -136,27 +214,342 @@ async def test_blank_model(hass: HomeAssistant) -> None:
     assert result["errors"] == {"base": "unknown"}
 
 
-async def test__test_connect_and_get_model_success(mock_box_info: BoxInfo) -> None:
+@pytest.fixture
+def mock_discover() -> Generator[AsyncMock]:
+    """Mock the network scan."""
+    with patch(
+        "custom_components.creality_box_control.config_flow.async_discover_boxes"
+    ) as mock:
+        yield mock
+
+
+async def test_scan(hass: HomeAssistant, mock_discover: AsyncMock) -> None:
+    """Test adding every box found by a scan."""
+    MockConfigEntry(
+        domain=DOMAIN,
+        title="CR-Box@192.168.1.1",
+        data={HOST: "192.168.1.1", PORT: TEST_PORT, MODEL: TEST_MODEL},
+    ).add_to_hass(hass)
+    mock_discover.return_value = [
+        DiscoveredBox(host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1"),
+        DiscoveredBox(host="192.168.1.51", port=TEST_PORT, model="K1", did_string="2"),
+        DiscoveredBox(host="192.168.1.1", port=TEST_PORT, model="K1", did_string="3"),
+    ]
+
+    with patch(
+        "custom_components.creality_box_control.async_setup_entry", return_value=True
+    ):
+        result = await _async_scan(
+            hass, {CONF_NETWORK: "192.168.1.0/30", PORT: TEST_PORT}
+        )
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "select"
+        # The box of the entry without a device id is not offered again
+        assert list(result["data_schema"].schema[CONF_BOXES].options) == [
+            TEST_HOST,
+            "192.168.1.51",
+        ]
+
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_BOXES: [TEST_HOST, "192.168.1.51"]}
+        )
+        await hass.async_block_till_done()
+
+    # Configured hosts are probed too
+    assert list(mock_discover.call_args[0][1]) == ["192.168.1.1", "192.168.1.2"]
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"] == {HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL}
+    assert sorted(
+        (entry.title, entry.unique_id)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ) == [
+        ("CR-Box@192.168.1.1", None),
+        (f"{TEST_MODEL}@{TEST_HOST}", "1"),
+        ("K1@192.168.1.51", "2"),
+    ]
+
+
+async def test_scan_moved_box(hass: HomeAssistant, mock_discover: AsyncMock) -> None:
+    """Test a configured box found at a new address is updated, not added."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1",
+        data={HOST: "192.168.1.20", PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    entry.add_to_hass(hass)
+    mock_discover.return_value = [
+        DiscoveredBox(host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1"),
+        DiscoveredBox(host="192.168.1.51", port=TEST_PORT, model="K1", did_string="2"),
+    ]
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        result = await _async_scan(
+            hass, {CONF_NETWORK: "192.168.1.0/24", PORT: TEST_PORT}
+        )
+
+    assert entry.data[HOST] == TEST_HOST
+    mock_schedule_reload.assert_called_once_with(entry.entry_id)
+    assert result["step_id"] == "select"
+    assert list(result["data_schema"].schema[CONF_BOXES].options) == ["192.168.1.51"]
+
+
+async def test_scan_swapped_boxes(
+    hass: HomeAssistant, mock_discover: AsyncMock
+) -> None:
+    """Test two configured boxes that swapped their addresses are both updated."""
+    first = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1",
+        title=f"{TEST_MODEL}@192.168.1.20",
+        data={HOST: "192.168.1.20", PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    second = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="2",
+        title="Workshop",
+        data={HOST: "192.168.1.21", PORT: TEST_PORT, MODEL: "K1"},
+    )
+    first.add_to_hass(hass)
+    second.add_to_hass(hass)
+    mock_discover.return_value = [
+        DiscoveredBox(
+            host="192.168.1.21", port=TEST_PORT, model=TEST_MODEL, did_string="1"
+        ),
+        DiscoveredBox(host="192.168.1.20", port=TEST_PORT, model="K1", did_string="2"),
+    ]
+
+    with patch.object(hass.config_entries, "async_schedule_reload"):
+        result = await _async_scan(
+            hass, {CONF_NETWORK: "192.168.1.0/24", PORT: TEST_PORT}
+        )
+
+    assert "192.168.1.20" in mock_discover.call_args[0][1]
+    assert (first.data[HOST], first.title) == (
+        "192.168.1.21",
+        f"{TEST_MODEL}@192.168.1.21",
+    )
+    # A title the user picked is kept
+    assert (second.data[HOST], second.title) == ("192.168.1.20", "Workshop")
+    assert result["errors"] == {"base": "no_devices_found"}
+
+
+async def test_scan_moved_box_unchanged(
+    hass: HomeAssistant, mock_discover: AsyncMock
+) -> None:
+    """Test a configured box found again without changes is not reloaded."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1",
+        data={HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    entry.add_to_hass(hass)
+    mock_discover.return_value = [
+        DiscoveredBox(host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1")
+    ]
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        result = await _async_scan(hass, {CONF_NETWORK: "192.168.1.0/24", PORT: 8080})
+
+    mock_schedule_reload.assert_not_called()
+    assert result["errors"] == {"base": "no_devices_found"}
+
+
+async def test_scan_errors(hass: HomeAssistant, mock_discover: AsyncMock) -> None:
+    """Test the scan form reports invalid ranges and empty results."""
+    result = await _async_configure_step(
+        hass, "scan", {CONF_NETWORK: "not a network", PORT: TEST_PORT}
+    )
+    assert result["errors"] == {CONF_NETWORK: "invalid_network"}
+
+    mock_discover.return_value = []
+    user_input = {CONF_NETWORK: "192.168.1.0/24", PORT: TEST_PORT}
+    result = await _async_scan(hass, user_input, result["flow_id"])
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "scan"
+    assert result["errors"] == {"base": "no_devices_found"}
+    # The form keeps the range that was scanned
+    assert {
+        key.schema: key.description["suggested_value"]
+        for key in result["data_schema"].schema
+    } == user_input
+
+
+async def test_select_nothing(hass: HomeAssistant, mock_discover: AsyncMock) -> None:
+    """Test selecting no box shows the selection again."""
+    mock_discover.return_value = [
+        DiscoveredBox(host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1")
+    ]
+    result = await _async_scan(hass, {CONF_NETWORK: "192.168.1.0/24", PORT: TEST_PORT})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_BOXES: []}
+    )
+
+    assert result["step_id"] == "select"
+    assert result["errors"] == {"base": "no_boxes_selected"}
+
+
+async def test_select_box_not_added(
+    hass: HomeAssistant,
+    mock_discover: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a selected box that cannot be added is reported."""
+    # The user ignored the box before, it is still offered by the scan
+    MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_IGNORE,
+        unique_id="2",
+        data={},
+    ).add_to_hass(hass)
+    mock_discover.return_value = [
+        DiscoveredBox(host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1"),
+        DiscoveredBox(host="192.168.1.51", port=TEST_PORT, model="K1", did_string="2"),
+    ]
+
+    with patch(
+        "custom_components.creality_box_control.async_setup_entry", return_value=True
+    ):
+        result = await _async_scan(
+            hass, {CONF_NETWORK: "192.168.1.0/30", PORT: TEST_PORT}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_BOXES: [TEST_HOST, "192.168.1.51"]}
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert "Could not add K1@192.168.1.51: already_configured" in caplog.text
+
+
+async def test_discovery_unique_id_configured(hass: HomeAssistant) -> None:
+    """Test discovering a box configured at another address updates it."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1",
+        data={HOST: "192.168.1.20", PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_INTEGRATION_DISCOVERY},
+        data=asdict(
+            DiscoveredBox(
+                host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1"
+            )
+        ),
+    )
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data[HOST] == TEST_HOST
+
+
+async def test_discovery_already_configured(hass: HomeAssistant) -> None:
+    """Test discovering a box configured without a device id aborts."""
+    MockConfigEntry(
+        domain=DOMAIN, data={HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL}
+    ).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_INTEGRATION_DISCOVERY},
+        data=asdict(
+            DiscoveredBox(
+                host=TEST_HOST, port=TEST_PORT, model=TEST_MODEL, did_string="1"
+            )
+        ),
+    )
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+
+
+async def test__async_get_box_success(
+    hass: HomeAssistant, mock_box_info: BoxInfo
+) -> None:
     """Test successful credential validation."""
     with patch(
         "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient.get_info",
         return_value=mock_box_info,
     ) as mock_test_connection:
         handler = CrealityBoxFlowHandler()
-        result = await handler._test_connect_and_get_model(TEST_HOST, TEST_PORT)  # noqa: SLF001
-        assert result == TEST_MODEL
+        handler.hass = hass
+        result = await handler._async_get_box(TEST_HOST, TEST_PORT)  # noqa: SLF001
+        assert result == DiscoveredBox(
+            host=TEST_HOST,
+            port=TEST_PORT,
+            model=TEST_MODEL,
+            did_string=mock_box_info.did_string,
+        )
         mock_test_connection.assert_called_once_with()
 
 
-async def test__test_connect_and_get_model_error() -> None:
+async def test__async_get_box_error(hass: HomeAssistant) -> None:
     """Test failed credential validation."""
     with patch(
         "creality_wifi_box_client.creality_wifi_box_client.CrealityWifiBoxClient.get_info",
         return_value=MagicMock(model=""),
     ) as mock_test_connection:
         handler = CrealityBoxFlowHandler()
+        handler.hass = hass
         with pytest.raises(ValueError) as exc_info:  # noqa: PT011
-            await handler._test_connect_and_get_model(TEST_HOST, TEST_PORT)  # noqa: SLF001
+            await handler._async_get_box(TEST_HOST, TEST_PORT)  # noqa: SLF001
 
         assert str(exc_info.value) == "Model was blank."
         mock_test_connection.assert_called_once_with()
+
+
+async def test_options_flow(hass: HomeAssistant) -> None:
+    """Test updating the polling options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FAST_INTERVAL: 3,
+            CONF_SLOW_INTERVAL: 45,
+            CONF_BACKOFF_INTERVAL: 90,
+            CONF_FAILURE_THRESHOLD: 5,
+            CONF_FARM_SCHEDULER: True,
+            CONF_ETA_DRIFT: 120,
+            "nozzle_temp_deadband": 2.0,
+            "nozzle_temp_min_interval": 30,
+            "bed_temp_deadband": 0.5,
+            "bed_temp_min_interval": 60,
+            CONF_HYSTERESIS: 1.5,
+            CONF_HISTORY_SIZE: 100,
+            CONF_REQUEST_TIMEOUT: 15,
+            CONF_ENTITY_GROUPS: [ENTITY_GROUP_JOBS],
+        },
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_FAST_INTERVAL: 3,
+        CONF_SLOW_INTERVAL: 45,
+        CONF_BACKOFF_INTERVAL: 90,
+        CONF_FAILURE_THRESHOLD: 5,
+        CONF_FARM_SCHEDULER: True,
+        CONF_ETA_DRIFT: 120,
+        "nozzle_temp_deadband": 2.0,
+        "nozzle_temp_min_interval": 30,
+        "bed_temp_deadband": 0.5,
+        "bed_temp_min_interval": 60,
+        CONF_HYSTERESIS: 1.5,
+        CONF_HISTORY_SIZE: 100,
+        CONF_REQUEST_TIMEOUT: 15,
+        CONF_ENTITY_GROUPS: [ENTITY_GROUP_JOBS],
+    }
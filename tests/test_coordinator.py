@@ -1,30 +1,67 @@
 """Tests for the coordinator."""
 
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from creality_wifi_box_client.exceptions import ClientConnectionError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
 
+from custom_components.creality_box_control.circuit_breaker import CircuitState
 from custom_components.creality_box_control.const import (
+    CONF_BACKOFF_INTERVAL,
+    CONF_DEADBAND,
+    CONF_FAILURE_THRESHOLD,
+    CONF_FAST_INTERVAL,
+    CONF_HISTORY_SIZE,
+    CONF_MIN_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_INTERVAL,
+    DEFAULT_BACKOFF_INTERVAL,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_SLOW_INTERVAL,
+    DOMAIN,
+    EVENT_PRINT_FINISHED,
+    POLL_JITTER,
     PRINT_PAUSE,
     PRINT_RESUME,
     PRINT_STOP,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    STATE_PRINTING,
+    STATE_SUSPENDING,
 )
 from custom_components.creality_box_control.coordinator import (
     CrealityBoxDataUpdateCoordinator,
 )
-from tests import TEST_CONFIG_ENTRY_ID, TEST_TITLE
+from custom_components.creality_box_control.filters import DeadbandFilter
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.view import BoxView
+from tests import TEST_CONFIG_ENTRY_ID, TEST_TITLE, box_payload
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
     from homeassistant.core import HomeAssistant
 
+SNAPSHOT_KEY = f"{DOMAIN}.{TEST_CONFIG_ENTRY_ID}"
+
 
 @pytest.fixture
 def mock_client(mock_box_info: BoxInfo) -> AsyncMock:
     """Mock the client."""
     client = AsyncMock()
-    client.get_info = AsyncMock(return_value=mock_box_info)
+    client.get_info_raw = AsyncMock(return_value=box_payload(mock_box_info))
     return client
 
 
@@ -37,6 +74,7 @@ def coordinator(
         data={"host": "1.2.3.4", "port": 81, "model": "CR-10"},
         entry_id=TEST_CONFIG_ENTRY_ID,
         title=TEST_TITLE,
+        options={},
     )
     coordinator = CrealityBoxDataUpdateCoordinator(
         hass=hass,
@@ -70,3 +108,498 @@ async def test_send_command(
         getattr(
             coordinator.config_entry.runtime_data.client, client_method
         ).assert_awaited_once()
+
+
+@pytest.fixture
+def confirm_task(coordinator: CrealityBoxDataUpdateCoordinator) -> Generator[None]:
+    """Run confirmation polls as background tasks without delay."""
+    coordinator.config_entry.async_create_background_task = lambda hass, target, name: (
+        hass.async_create_background_task(target, name)
+    )
+    with patch(
+        "custom_components.creality_box_control.coordinator.COMMAND_POLL_INTERVAL", 0
+    ):
+        yield
+
+
+async def test_send_command_drops_duplicates(
+    coordinator: CrealityBoxDataUpdateCoordinator, mock_client: AsyncMock
+) -> None:
+    """Test a command is dropped while the same command is pending."""
+    release = asyncio.Event()
+    mock_client.pause_print.side_effect = release.wait
+
+    first = asyncio.create_task(coordinator.send_command(PRINT_PAUSE))
+    await asyncio.sleep(0)
+    await coordinator.send_command(PRINT_PAUSE)
+    release.set()
+    await first
+
+    mock_client.pause_print.assert_awaited_once()
+
+
+@pytest.mark.usefixtures("confirm_task")
+async def test_send_command_confirms(
+    hass: HomeAssistant,
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the expected state is shown until the box confirms it."""
+    coordinator.data = BoxSnapshot(box_payload(mock_box_info))
+    paused = box_payload(mock_box_info, state=STATE_SUSPENDING)
+    unconfirmed = box_payload(mock_box_info)
+    mock_client.get_info_raw.side_effect = [unconfirmed, unconfirmed, paused]
+    states = []
+    unsub = coordinator.async_add_listener(
+        lambda: states.append(coordinator.data.state)
+    )
+
+    await coordinator.send_command(PRINT_PAUSE)
+    assert coordinator.data.state == STATE_SUSPENDING
+
+    await hass.async_block_till_done(wait_background_tasks=True)
+    unsub()
+    # The polls before the box confirmed did not show the old state again,
+    # only the confirming payload was dispatched after the expected state
+    assert states == [STATE_SUSPENDING, STATE_SUSPENDING]
+
+    assert coordinator.data == BoxSnapshot(paused)
+    assert mock_client.get_info_raw.await_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("confirm_task")
+async def test_send_command_not_confirmed(
+    hass: HomeAssistant,
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the box state wins when the box never confirms the command."""
+    coordinator.data = BoxSnapshot(box_payload(mock_box_info))
+    with patch(
+        "custom_components.creality_box_control.coordinator.COMMAND_CONFIRM_TIMEOUT",
+        0.05,
+    ):
+        await coordinator.send_command(PRINT_STOP)
+        # A second command replaces the running confirmation
+        await coordinator.send_command(PRINT_PAUSE)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data == BoxSnapshot(box_payload(mock_box_info))
+
+
+@pytest.mark.usefixtures("confirm_task")
+async def test_send_command_not_confirmed_unreachable(
+    hass: HomeAssistant,
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the last known state is shown again when the box is not reachable."""
+    coordinator.data = BoxSnapshot(box_payload(mock_box_info))
+    mock_client.get_info_raw.side_effect = ClientConnectionError
+    with patch(
+        "custom_components.creality_box_control.coordinator.COMMAND_CONFIRM_TIMEOUT",
+        0.05,
+    ):
+        await coordinator.send_command(PRINT_PAUSE)
+        assert coordinator.data.state == STATE_SUSPENDING
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data.state == STATE_PRINTING
+    assert not coordinator.last_update_success
+
+
+async def test_send_command_state_unchanged(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test no confirmation polls run when the box is already in the state."""
+    coordinator.data = BoxSnapshot(box_payload(mock_box_info))
+    await coordinator.send_command(PRINT_RESUME)
+
+    coordinator.config_entry.async_create_background_task.assert_not_called()
+    mock_client.get_info_raw.assert_not_awaited()
+
+
+def _assert_interval(
+    coordinator: CrealityBoxDataUpdateCoordinator, seconds: float
+) -> None:
+    """Assert the update interval is within the jitter of the given seconds."""
+    assert coordinator.update_interval is not None
+    actual = coordinator.update_interval.total_seconds()
+    assert seconds * (1 - POLL_JITTER) <= actual <= seconds * (1 + POLL_JITTER)
+
+
+async def test_update_data(
+    coordinator: CrealityBoxDataUpdateCoordinator, mock_box_info: BoxInfo
+) -> None:
+    """Test fetching data from the box."""
+    data = await coordinator._async_update_data()  # noqa: SLF001
+    assert data == BoxSnapshot(box_payload(mock_box_info))
+
+
+async def test_unchanged_payload_skipped(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test an identical payload is neither decoded again nor dispatched."""
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    data = coordinator.data
+    with patch(
+        "custom_components.creality_box_control.coordinator.BoxSnapshot"
+    ) as mock_snapshot:
+        await coordinator.async_refresh()
+    mock_snapshot.assert_not_called()
+    assert coordinator.data is data
+    assert coordinator.last_update_success
+    listener.assert_called_once()
+
+    mock_client.get_info_raw.return_value = box_payload(mock_box_info, state=0)
+    await coordinator.async_refresh()
+    assert coordinator.data.state == 0
+    assert listener.call_count == 2  # noqa: PLR2004
+    unsub()
+
+
+async def test_view_derived_once(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the entity values are derived once per data, on the first read."""
+    await coordinator.async_refresh()
+    view = coordinator.view
+    assert view.state == "Printing"
+    assert coordinator.view is view
+
+    # An unchanged payload keeps the view
+    await coordinator.async_refresh()
+    assert coordinator.view is view
+
+    mock_client.get_info_raw.return_value = box_payload(mock_box_info, state=0)
+    await coordinator.async_refresh()
+    assert coordinator.view.state == "Idle"
+
+    # So does data replaced without polling
+    coordinator.async_set_updated_data(coordinator.data.replace(state=5))
+    assert coordinator.view.state == "Suspending"
+
+
+async def test_metrics_recorded(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the latency, size and parse time of polls are recorded."""
+    raw = box_payload(mock_box_info)
+    await coordinator.async_refresh()
+    metrics = coordinator.metrics
+    assert metrics.bytes_received == len(raw)
+    assert metrics.last_latency is not None
+    parse_time = metrics.last_parse_time
+    assert parse_time is not None
+
+    mock_client.get_info_raw.side_effect = ClientConnectionError
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert metrics.consecutive_failures == 2  # noqa: PLR2004
+
+    mock_client.get_info_raw.side_effect = None
+    await coordinator.async_refresh()
+    assert metrics.consecutive_failures == 0
+    assert metrics.bytes_received == 2 * len(raw)
+    # The payload did not change, so it was not decoded again
+    assert metrics.last_parse_time == parse_time
+
+
+async def test_history_recorded(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test a sample is recorded for every new payload."""
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    mock_client.get_info_raw.return_value = box_payload(mock_box_info, layer=11)
+    await coordinator.async_refresh()
+
+    samples = coordinator.history.samples()
+    assert samples["layer"] == [10, 11]
+    assert samples["nozzle_temp"] == [212, 212]
+    assert coordinator.history.size == DEFAULT_HISTORY_SIZE
+
+
+async def test_estimator_fed(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test printing payloads feed the estimator and an idle box resets it."""
+    for step in range(3):
+        mock_client.get_info_raw.return_value = box_payload(
+            mock_box_info, print_job_time=7200 + step * 60
+        )
+        await coordinator.async_refresh()
+    assert len(coordinator.estimator) == 3  # noqa: PLR2004
+
+    mock_client.get_info_raw.return_value = box_payload(
+        mock_box_info, state=STATE_SUSPENDING, print_job_time=7400
+    )
+    await coordinator.async_refresh()
+    assert len(coordinator.estimator) == 3  # noqa: PLR2004
+
+    mock_client.get_info_raw.return_value = box_payload(mock_box_info, state=0)
+    await coordinator.async_refresh()
+    assert len(coordinator.estimator) == 0
+
+
+async def test_lifecycle_events(
+    hass: HomeAssistant,
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test transitions are fired on the bus and ended jobs are recorded."""
+    events = async_capture_events(hass, EVENT_PRINT_FINISHED)
+
+    await coordinator.async_refresh()
+    mock_client.get_info_raw.return_value = box_payload(
+        mock_box_info, state=0, print_progress=100, print_name=""
+    )
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["entry_id"] == TEST_CONFIG_ENTRY_ID
+    assert events[0].data["name"] == TEST_TITLE
+    assert events[0].data["print_name"] == "MyPrint.gcode"
+    assert events[0].data["progress"] == 100  # noqa: PLR2004
+
+    (job,) = coordinator.jobs.jobs
+    assert job["print_name"] == "MyPrint.gcode"
+    assert job["outcome"] == "finished"
+    assert job["duration"] == 7200  # noqa: PLR2004
+
+
+async def test_snapshot_saved(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test a successful update is persisted without the secrets of the box."""
+    await coordinator.async_refresh()
+    assert SNAPSHOT_KEY not in hass_storage
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    snapshot = hass_storage[SNAPSHOT_KEY]["data"]
+    assert snapshot == BoxSnapshot(box_payload(mock_box_info)).projected()
+    for key in ("APILicense", "apclimac", "ownerId", "ssid", "wifipasswd"):
+        assert key not in snapshot
+
+
+@pytest.mark.parametrize("projected", [True, False])
+async def test_load_snapshot(
+    hass_storage: dict[str, Any],
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_box_info: BoxInfo,
+    projected: bool,  # noqa: FBT001
+) -> None:
+    """Test the coordinator is seeded from the snapshot, also a full old one."""
+    assert await coordinator.async_load_snapshot() is False
+
+    hass_storage[SNAPSHOT_KEY] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": SNAPSHOT_KEY,
+        "data": (
+            BoxSnapshot(box_payload(mock_box_info)).projected()
+            if projected
+            else mock_box_info.model_dump(mode="json", by_alias=True)
+        ),
+    }
+    assert await coordinator.async_load_snapshot() is True
+    assert coordinator.view == BoxView.from_snapshot(
+        BoxSnapshot(box_payload(mock_box_info))
+    )
+    assert not hasattr(coordinator.data, "filament_type")
+
+
+async def test_load_invalid_snapshot(
+    hass_storage: dict[str, Any], coordinator: CrealityBoxDataUpdateCoordinator
+) -> None:
+    """Test an invalid snapshot is ignored."""
+    hass_storage[SNAPSHOT_KEY] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": SNAPSHOT_KEY,
+        "data": {"model": "CR-Box"},
+    }
+    assert await coordinator.async_load_snapshot() is False
+    assert coordinator.data is None
+
+
+@pytest.mark.parametrize(
+    ("changes", "expected_seconds"),
+    [
+        ({}, DEFAULT_FAST_INTERVAL),
+        ({"state": 0, "nozzle_temp": 200}, DEFAULT_FAST_INTERVAL),
+        ({"state": 0, "nozzle_temp": 25, "bed_temp": 25}, DEFAULT_SLOW_INTERVAL),
+        ({"connect": 0}, DEFAULT_BACKOFF_INTERVAL),
+    ],
+)
+async def test_adaptive_interval(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+    changes: dict,
+    expected_seconds: int,
+) -> None:
+    """Test the poll interval follows the state of the box."""
+    mock_client.get_info_raw.return_value = box_payload(mock_box_info, **changes)
+
+    await coordinator._async_update_data()  # noqa: SLF001
+
+    _assert_interval(coordinator, expected_seconds)
+
+
+async def test_adaptive_interval_options(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test the poll intervals come from the entry options."""
+    coordinator.config_entry.options = {
+        CONF_FAST_INTERVAL: 2,
+        CONF_SLOW_INTERVAL: 120,
+        CONF_BACKOFF_INTERVAL: 300,
+    }
+
+    await coordinator._async_update_data()  # noqa: SLF001
+    _assert_interval(coordinator, 2)
+
+    mock_client.get_info_raw.return_value = box_payload(
+        mock_box_info, state=0, nozzle_temp=25, bed_temp=25
+    )
+    await coordinator._async_update_data()  # noqa: SLF001
+    _assert_interval(coordinator, 120)
+
+
+async def test_apply_options(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+    mock_client: AsyncMock,
+    mock_box_info: BoxInfo,
+) -> None:
+    """Test changed options are applied to the running coordinator."""
+    mock_client.set_timeout = MagicMock()
+    mock_client.get_info_raw.return_value = box_payload(
+        mock_box_info, state=0, nozzle_temp=25, bed_temp=25
+    )
+    unsub = coordinator.async_add_listener(MagicMock())
+    await coordinator.async_refresh()
+    _assert_interval(coordinator, DEFAULT_SLOW_INTERVAL)
+    coordinator.history.append(1.0, coordinator.data)
+    nozzle_filter = DeadbandFilter(deadband=1, min_interval=0, hysteresis=1)
+    removed_filter = DeadbandFilter(deadband=1, min_interval=0, hysteresis=1)
+    coordinator.async_add_filter("nozzle_temp", nozzle_filter)
+    coordinator.async_add_filter("bed_temp", removed_filter)()
+
+    coordinator.config_entry.options = {
+        CONF_SLOW_INTERVAL: 120,
+        CONF_BACKOFF_INTERVAL: 300,
+        CONF_FAILURE_THRESHOLD: 5,
+        CONF_HISTORY_SIZE: 100,
+        CONF_REQUEST_TIMEOUT: 15,
+        f"nozzle_temp_{CONF_DEADBAND}": 3,
+        f"nozzle_temp_{CONF_MIN_INTERVAL}": 30,
+        f"bed_temp_{CONF_DEADBAND}": 3,
+    }
+    with patch.object(coordinator, "_schedule_refresh") as mock_schedule:
+        coordinator.async_apply_options()
+        mock_schedule.assert_called_once_with()
+
+    _assert_interval(coordinator, 120)
+    assert coordinator.breaker.failure_threshold == 5  # noqa: PLR2004
+    assert coordinator.breaker.base_delay == 300  # noqa: PLR2004
+    assert coordinator.history.size == 100  # noqa: PLR2004
+    assert len(coordinator.history) == 2  # noqa: PLR2004
+    mock_client.set_timeout.assert_called_once_with(15)
+    assert nozzle_filter.deadband == 3  # noqa: PLR2004
+    assert nozzle_filter.min_interval == 30  # noqa: PLR2004
+    assert removed_filter.deadband == 1
+
+    # Without listeners no refresh is scheduled
+    unsub()
+    with patch.object(coordinator, "_schedule_refresh") as mock_schedule:
+        coordinator.async_apply_options()
+        mock_schedule.assert_not_called()
+
+
+async def test_update_data_failure_retries(
+    coordinator: CrealityBoxDataUpdateCoordinator, mock_client: AsyncMock
+) -> None:
+    """Test a single failure raises UpdateFailed and retries quickly."""
+    mock_client.get_info_raw.side_effect = ClientConnectionError("unreachable")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()  # noqa: SLF001
+
+    assert coordinator.breaker.state is CircuitState.CLOSED
+    _assert_interval(coordinator, DEFAULT_FAST_INTERVAL)
+
+
+async def test_circuit_breaker_opens(
+    coordinator: CrealityBoxDataUpdateCoordinator, mock_client: AsyncMock
+) -> None:
+    """Test the breaker opens, skips requests and closes on recovery."""
+    mock_client.get_info_raw.side_effect = ClientConnectionError("unreachable")
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    for _ in range(DEFAULT_FAILURE_THRESHOLD):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()  # noqa: SLF001
+
+    assert coordinator.breaker.state is CircuitState.OPEN
+    listener.assert_called_once()
+    _assert_interval(coordinator, DEFAULT_BACKOFF_INTERVAL)
+
+    with pytest.raises(UpdateFailed, match="waiting before the next probe"):
+        await coordinator._async_update_data()  # noqa: SLF001
+    assert mock_client.get_info_raw.await_count == DEFAULT_FAILURE_THRESHOLD
+
+    coordinator.breaker._retry_at = 0  # noqa: SLF001
+    mock_client.get_info_raw.side_effect = None
+    await coordinator._async_update_data()  # noqa: SLF001
+    assert coordinator.breaker.state is CircuitState.CLOSED
+
+
+async def test_farm_scheduled_poll(
+    coordinator: CrealityBoxDataUpdateCoordinator,
+) -> None:
+    """Test a farm scheduled coordinator leaves its timer alone."""
+    coordinator.config_entry.pref_disable_polling = False
+    unsub = coordinator.async_add_listener(MagicMock())
+
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
+
+    coordinator.async_use_farm_scheduler()
+    assert coordinator.farm_scheduled is True
+    # The refresh the coordinator already scheduled for itself is dropped
+    assert coordinator._unsub_refresh is None  # noqa: SLF001
+
+    await coordinator._async_update_data()  # noqa: SLF001
+    unsub()
+
+    assert coordinator.update_interval is None
+    assert coordinator.poll_due(coordinator.next_poll) is True
+    assert coordinator.poll_due(coordinator.next_poll - 1) is False
@@ -0,0 +1,100 @@
+"""Tests for the diagnostics."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from homeassistant.components.diagnostics import REDACTED
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.creality_box_control.circuit_breaker import CircuitBreaker
+from custom_components.creality_box_control.const import (
+    CONF_FAST_INTERVAL,
+    DIAGNOSTICS_HISTORY_POINTS,
+    DOMAIN,
+    HOST,
+    MODEL,
+    PORT,
+)
+from custom_components.creality_box_control.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.creality_box_control.history import SampleHistory
+from custom_components.creality_box_control.metrics import PollMetrics
+from custom_components.creality_box_control.scheduler import (
+    CycleStats,
+    async_get_farm_scheduler,
+)
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from tests import TEST_HOST, TEST_MODEL, TEST_PORT, box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.core import HomeAssistant
+
+
+async def test_diagnostics(hass: HomeAssistant, mock_box_info: BoxInfo) -> None:
+    """Test the diagnostics are redacted and the history is downsampled."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL},
+        options={CONF_FAST_INTERVAL: 3},
+    )
+    coordinator = MagicMock(
+        last_update_success=True,
+        breaker=CircuitBreaker(failure_threshold=3, base_delay=60, max_delay=900),
+        history=SampleHistory(1000),
+        metrics=PollMetrics(10),
+        farm_scheduled=False,
+    )
+    data = BoxSnapshot(box_payload(mock_box_info))
+    for index in range(300):
+        coordinator.history.append(float(index), data)
+    coordinator.data = data
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"] == {
+        "data": {HOST: REDACTED, PORT: TEST_PORT, MODEL: TEST_MODEL},
+        "options": {CONF_FAST_INTERVAL: 3},
+    }
+    assert diagnostics["last_update_success"] is True
+    assert diagnostics["breaker"] == "closed"
+    assert diagnostics["metrics"]["consecutive_failures"] == 0
+    assert diagnostics["data"]["state"] == 1
+    for key in ("wanip", "netIP", "ssid", "wifipasswd", "DIDString", "APILicense"):
+        assert diagnostics["data"][key] == REDACTED
+    history = diagnostics["history"]
+    assert len(history["time"]) <= DIAGNOSTICS_HISTORY_POINTS
+    assert history["time"][-1] == 299  # noqa: PLR2004
+    assert diagnostics["farm_cycle"] is None
+
+    coordinator.data = None
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["data"] is None
+
+
+async def test_diagnostics_farm_cycle(
+    hass: HomeAssistant, mock_box_info: BoxInfo
+) -> None:
+    """Test the last farm poll cycle is included for a farm scheduled box."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={HOST: TEST_HOST, PORT: TEST_PORT, MODEL: TEST_MODEL}
+    )
+    coordinator = MagicMock(
+        breaker=CircuitBreaker(failure_threshold=3, base_delay=60, max_delay=900),
+        history=SampleHistory(10),
+        metrics=PollMetrics(10),
+        data=BoxSnapshot(box_payload(mock_box_info)),
+        farm_scheduled=True,
+    )
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+    scheduler = async_get_farm_scheduler(hass)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["farm_cycle"] is None
+
+    scheduler.last_cycle = CycleStats(boxes=4, polled=2, duration=1.5, poll_time=1)
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["farm_cycle"] == scheduler.last_cycle.as_dict()
+    assert diagnostics["farm_cycle"]["capacity"] == scheduler.last_cycle.capacity
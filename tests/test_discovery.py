@@ -0,0 +1,66 @@
+"""Tests for the network discovery."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientPayloadError
+from creality_wifi_box_client.exceptions import ClientConnectionError
+from yarl import URL
+
+from custom_components.creality_box_control.const import DISCOVERY_TIMEOUT
+from custom_components.creality_box_control.discovery import (
+    DiscoveredBox,
+    async_discover_boxes,
+    network_hosts,
+)
+from tests import TEST_HOST, TEST_MODEL, TEST_PORT
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.core import HomeAssistant
+
+
+def test_network_hosts() -> None:
+    """Test a range is expanded to its host addresses."""
+    assert network_hosts("192.168.1.5/30") == ["192.168.1.5", "192.168.1.6"]
+
+
+@pytest.mark.parametrize("network", ["192.168.1.300/24", "10.0.0.0/16"])
+def test_network_hosts_invalid(network: str) -> None:
+    """Test invalid and oversized ranges are rejected."""
+    with pytest.raises(ValueError, match=r"10\.0\.0\.0/16|does not appear"):
+        network_hosts(network)
+
+
+async def test_discover_boxes(hass: HomeAssistant, mock_box_info: BoxInfo) -> None:
+    """Test only hosts answering with a Creality box are returned."""
+    answers = {
+        TEST_HOST: mock_box_info,
+        "192.168.1.51": mock_box_info.model_copy(update={"model": " "}),
+        "192.168.1.52": ClientConnectionError("refused"),
+        "192.168.1.53": TimeoutError(),
+        "192.168.1.54": ClientPayloadError("truncated"),
+    }
+
+    async def _get_info(self) -> BoxInfo:  # noqa: ANN001
+        assert self._timeout.total == DISCOVERY_TIMEOUT
+        answer = answers[URL(self.base_url).host]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    with patch(
+        "custom_components.creality_box_control.api.CrealityBoxClient.get_info",
+        _get_info,
+    ):
+        boxes = await async_discover_boxes(hass, answers, TEST_PORT)
+
+    assert boxes == [
+        DiscoveredBox(
+            host=TEST_HOST,
+            port=TEST_PORT,
+            model=TEST_MODEL,
+            did_string=mock_box_info.did_string,
+        )
+    ]
@@ -54,3 +54,18 @@ async def test_entity_attributes(coordinator: MagicMock) -> None:
 
     assert entity.icon == "mdi:printer-3d"
     assert entity.has_entity_name is True
+
+
+async def test_entity_writes_availability_changes(coordinator: MagicMock) -> None:
+    """Test the entity only writes its state when the availability changes."""
+    coordinator.last_update_success = True
+    entity_description = MagicMock(key="test_key", name="Test Name")
+    entity = CrealityBoxEntity(coordinator=coordinator, description=entity_description)
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()  # noqa: SLF001
+    entity.async_write_ha_state.assert_not_called()
+
+    coordinator.last_update_success = False
+    entity._handle_coordinator_update()  # noqa: SLF001
+    entity.async_write_ha_state.assert_called_once()
@@ -0,0 +1,117 @@
+"""Tests for the finish time estimator."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.creality_box_control.eta import FinishEstimator, completion
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from tests import box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+@pytest.mark.parametrize(
+    ("progress", "layer", "total_layer", "expected"),
+    [(56, 10, 0, 0.56), (50, 100, 200, 0.5), (40, 30, 100, 0.35), (100, 400, 350, 1)],
+)
+def test_completion(
+    mock_box_info: BoxInfo,
+    progress: int,
+    layer: int,
+    total_layer: int,
+    expected: float,
+) -> None:
+    """Test the completed fraction averages the progress and the layers."""
+    data = BoxSnapshot(
+        box_payload(
+            mock_box_info,
+            print_progress=progress,
+            layer=layer,
+            total_layer=total_layer,
+        )
+    )
+
+    assert completion(data) == pytest.approx(expected)
+
+
+def test_linear_print() -> None:
+    """Test a print advancing at a steady rate is predicted exactly."""
+    estimator = FinishEstimator(window=10, min_samples=3)
+    # One percent every 60 seconds, starting at 10 percent
+    for step in range(25):
+        estimator.add(600 + step * 60, (10 + step) / 100)
+        if step < 2:  # noqa: PLR2004
+            assert estimator.estimate() is None
+
+    assert len(estimator) == 10  # noqa: PLR2004
+    seconds_left, confidence = estimator.estimate()
+    assert seconds_left == pytest.approx(66 * 60)
+    assert confidence == pytest.approx(1)
+
+
+def test_confidence() -> None:
+    """Test the confidence grows with the window and drops with the noise."""
+    estimator = FinishEstimator(window=10, min_samples=3)
+    for step in range(5):
+        estimator.add(step * 60, step / 100)
+
+    _, confidence = estimator.estimate()
+    assert confidence == pytest.approx(0.5)
+
+    for step, jitter in zip(range(5, 10), (3, -3, 3, -3, 3), strict=True):
+        estimator.add(step * 60, (step + jitter) / 100)
+
+    _, confidence = estimator.estimate()
+    assert 0.1 < confidence < 0.9  # noqa: PLR2004
+
+
+def test_sliding_window_matches_full_fit() -> None:
+    """Test the running sums match a fit over the samples in the window."""
+    estimator = FinishEstimator(window=4, min_samples=2)
+    samples = [(0, 0.0), (60, 0.02), (120, 0.02), (180, 0.10), (240, 0.11), (300, 0.12)]
+    for job_time, done in samples:
+        estimator.add(job_time, done)
+
+    fresh = FinishEstimator(window=4, min_samples=2)
+    for job_time, done in samples[-4:]:
+        fresh.add(job_time, done)
+    assert estimator.estimate() == fresh.estimate()
+
+
+def test_repeated_job_time_ignored() -> None:
+    """Test a sample with the same job time as the last one is ignored."""
+    estimator = FinishEstimator(window=10, min_samples=2)
+    estimator.add(60, 0.01)
+    estimator.add(60, 0.02)
+
+    assert len(estimator) == 1
+
+
+def test_new_print_resets() -> None:
+    """Test the job time going back starts a new fit."""
+    estimator = FinishEstimator(window=10, min_samples=2)
+    for step in range(5):
+        estimator.add(1000 + step * 60, 0.5 + step / 100)
+
+    estimator.add(30, 0.0)
+
+    assert len(estimator) == 1
+    assert estimator.estimate() is None
+
+
+@pytest.mark.parametrize(
+    "samples",
+    [
+        [(60, 0.5), (120, 0.5), (180, 0.5)],
+        [(60, 0.5), (120, 0.4), (180, 0.3)],
+    ],
+)
+def test_stalled_print(samples: list[tuple[int, float]]) -> None:
+    """Test nothing is predicted while the print does not advance."""
+    estimator = FinishEstimator(window=10, min_samples=2)
+    for job_time, done in samples:
+        estimator.add(job_time, done)
+
+    assert estimator.estimate() is None
@@ -0,0 +1,77 @@
+"""Tests for the print lifecycle events."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.creality_box_control.const import (
+    EVENT_CONNECTION_LOST,
+    EVENT_PRINT_CANCELLED,
+    EVENT_PRINT_ERROR,
+    EVENT_PRINT_FINISHED,
+    EVENT_PRINT_STARTED,
+)
+from custom_components.creality_box_control.events import (
+    event_data,
+    transition_events,
+)
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from tests import box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+@pytest.mark.parametrize(
+    ("previous", "current", "expected"),
+    [
+        ({"state": 0}, {"state": 1}, [EVENT_PRINT_STARTED]),
+        ({"state": 1}, {"state": 1, "print_progress": 57}, []),
+        ({"state": 1}, {"state": 5}, []),
+        ({"state": 5}, {"state": 1}, []),
+        ({"state": 1}, {"state": 0, "print_progress": 100}, [EVENT_PRINT_FINISHED]),
+        ({"state": 4}, {"state": 0}, [EVENT_PRINT_CANCELLED]),
+        ({"state": 0}, {"state": 0}, []),
+        ({}, {"error": True}, [EVENT_PRINT_ERROR]),
+        ({"error": True}, {"error": True}, []),
+        ({}, {"connect": 0}, [EVENT_CONNECTION_LOST]),
+        ({"connect": 0}, {"connect": 0}, []),
+        (
+            {},
+            {"connect": 0, "error": True, "state": 0},
+            [EVENT_CONNECTION_LOST, EVENT_PRINT_ERROR, EVENT_PRINT_CANCELLED],
+        ),
+    ],
+)
+def test_transition_events(
+    mock_box_info: BoxInfo,
+    previous: dict[str, Any],
+    current: dict[str, Any],
+    expected: list[str],
+) -> None:
+    """Test the events fired for transitions between payloads."""
+    assert (
+        transition_events(
+            BoxSnapshot(box_payload(mock_box_info, **previous)),
+            BoxSnapshot(box_payload(mock_box_info, **current)),
+        )
+        == expected
+    )
+
+
+def test_event_data(mock_box_info: BoxInfo) -> None:
+    """Test the job metadata keeps the name of a print that just ended."""
+    previous = BoxSnapshot(box_payload(mock_box_info))
+    data = BoxSnapshot(
+        box_payload(mock_box_info, state=0, print_progress=100, print_name="")
+    )
+
+    assert event_data(previous, data) == {
+        "print_name": "MyPrint.gcode",
+        "progress": 100,
+        "job_time": 7200,
+        "layer": 10,
+        "total_layer": 350,
+        "state": 0,
+        "error": False,
+    }
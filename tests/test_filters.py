@@ -0,0 +1,78 @@
+"""Tests for the deadband filter."""
+
+import pytest
+
+from custom_components.creality_box_control.filters import DeadbandFilter
+
+
+@pytest.fixture
+def temperature_filter() -> DeadbandFilter:
+    """Create a filter with a one degree deadband."""
+    return DeadbandFilter(deadband=1, min_interval=10, hysteresis=1)
+
+
+def test_first_value_passes(temperature_filter: DeadbandFilter) -> None:
+    """Test the first value and unavailable values always pass."""
+    assert temperature_filter.accept(200, 0) is True
+    assert temperature_filter.accept(None, 1) is True
+    assert temperature_filter.accept(201, 2) is True
+
+
+def test_deadband(temperature_filter: DeadbandFilter) -> None:
+    """Test jitter within the deadband is suppressed."""
+    temperature_filter.accept(200, 0)
+
+    assert temperature_filter.accept(201, 20) is False
+    assert temperature_filter.accept(199, 40) is False
+    assert temperature_filter.accept(202, 60) is True
+
+
+def test_min_interval(temperature_filter: DeadbandFilter) -> None:
+    """Test a ramp is published at most once per minimum interval."""
+    temperature_filter.accept(100, 0)
+
+    assert temperature_filter.accept(150, 5) is False
+    assert temperature_filter.accept(180, 10) is True
+    assert temperature_filter.accept(200, 15) is False
+    assert temperature_filter.accept(200, 20) is True
+
+
+def test_hysteresis(temperature_filter: DeadbandFilter) -> None:
+    """Test turning around needs the hysteresis on top of the deadband."""
+    temperature_filter.accept(100, 0)
+    temperature_filter.accept(200, 10)
+
+    # Dropping back after a rise has to move more than two degrees
+    assert temperature_filter.accept(198, 20) is False
+    assert temperature_filter.accept(197, 30) is True
+    # Continuing in the same direction only needs the deadband
+    assert temperature_filter.accept(195, 40) is True
+
+
+def test_held_until(temperature_filter: DeadbandFilter) -> None:
+    """Test a value held back by the minimum interval reports when it may pass."""
+    temperature_filter.accept(100, 0)
+
+    assert temperature_filter.accept(150, 4) is False
+    assert temperature_filter.held_until == 10  # noqa: PLR2004
+    # Jitter within the deadband is dropped, not held
+    assert temperature_filter.accept(100.5, 6) is False
+    assert temperature_filter.held_until is None
+    assert temperature_filter.accept(150, 10) is True
+    assert temperature_filter.held_until is None
+
+
+def test_apply_options(temperature_filter: DeadbandFilter) -> None:
+    """Test changed options apply to the filter of the sensor key."""
+    temperature_filter.accept(200, 0)
+
+    temperature_filter.apply_options(
+        {"nozzle_temp_deadband": 5, "bed_temp_deadband": 2, "temp_hysteresis": 0},
+        "nozzle_temp",
+    )
+
+    assert temperature_filter.deadband == 5  # noqa: PLR2004
+    assert temperature_filter.min_interval == 0
+    assert temperature_filter.hysteresis == 0
+    # The last published value is kept
+    assert temperature_filter.accept(204, 20) is False
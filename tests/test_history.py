@@ -0,0 +1,94 @@
+"""Tests for the sample history."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.creality_box_control.history import SampleHistory
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from tests import box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+@pytest.fixture
+def history(mock_box_info: BoxInfo) -> SampleHistory:
+    """Create a history of five samples holding seven layers."""
+    history = SampleHistory(5)
+    for layer in range(7):
+        history.append(
+            1000.0 + layer, BoxSnapshot(box_payload(mock_box_info, layer=layer))
+        )
+    return history
+
+
+def test_empty() -> None:
+    """Test an empty history has no samples."""
+    history = SampleHistory(3)
+
+    assert len(history) == 0
+    assert history.samples() == {
+        "time": [],
+        "nozzle_temp": [],
+        "bed_temp": [],
+        "print_progress": [],
+        "layer": [],
+    }
+    assert history.samples(2)["time"] == []
+
+
+def test_oldest_overwritten(history: SampleHistory) -> None:
+    """Test only the newest samples are kept, oldest first."""
+    samples = history.samples()
+
+    assert len(history) == 5  # noqa: PLR2004
+    assert samples["time"] == [1002.0, 1003.0, 1004.0, 1005.0, 1006.0]
+    assert samples["layer"] == [2, 3, 4, 5, 6]
+    assert samples["nozzle_temp"] == [212] * 5
+    assert samples["bed_temp"] == [60] * 5
+    assert samples["print_progress"] == [56] * 5
+
+
+@pytest.mark.parametrize(
+    ("size", "layers"),
+    [(3, [4, 5, 6]), (5, [2, 3, 4, 5, 6]), (8, [2, 3, 4, 5, 6])],
+)
+def test_resize(history: SampleHistory, size: int, layers: list[int]) -> None:
+    """Test resizing keeps the newest samples in order."""
+    history.resize(size)
+
+    assert history.size == size
+    assert history.samples()["layer"] == layers
+    assert history.samples()["time"] == [1000.0 + layer for layer in layers]
+
+
+def test_resize_then_append(history: SampleHistory, mock_box_info: BoxInfo) -> None:
+    """Test samples appended after resizing continue after the kept ones."""
+    history.resize(6)
+    for layer in range(7, 9):
+        history.append(
+            1000.0 + layer, BoxSnapshot(box_payload(mock_box_info, layer=layer))
+        )
+
+    assert history.samples()["layer"] == [3, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.parametrize(
+    ("max_points", "layers"),
+    [
+        (1, [6]),
+        (2, [3, 6]),
+        (3, [2, 4, 6]),
+        (5, [2, 3, 4, 5, 6]),
+        (10, [2, 3, 4, 5, 6]),
+    ],
+)
+def test_downsampled(
+    history: SampleHistory, max_points: int, layers: list[int]
+) -> None:
+    """Test downsampling thins out evenly and keeps the newest sample."""
+    samples = history.samples(max_points)
+
+    assert samples["layer"] == layers
+    assert len(samples["time"]) <= max_points
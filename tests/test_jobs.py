@@ -0,0 +1,142 @@
+"""Tests for the job history."""
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.creality_box_control.const import (
+    DOMAIN,
+    JOB_OUTCOME_CANCELLED,
+    JOB_OUTCOME_FINISHED,
+    JOBS_SAVE_DELAY,
+    JOBS_STORAGE_VERSION,
+)
+from custom_components.creality_box_control.jobs import (
+    JobHistory,
+    JobRecord,
+    job_record,
+    jobs_store,
+)
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from tests import TEST_CONFIG_ENTRY_ID, box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.core import HomeAssistant
+
+JOBS_KEY = f"{DOMAIN}.{TEST_CONFIG_ENTRY_ID}.jobs"
+
+
+def _job(name: str, ended: float, outcome: str = JOB_OUTCOME_FINISHED) -> JobRecord:
+    return {
+        "print_name": name,
+        "started": ended - 3600,
+        "ended": ended,
+        "duration": 3600,
+        "filament_length": 1500,
+        "filament_type": "PLA",
+        "outcome": outcome,
+    }
+
+
+@pytest.fixture
+def history(hass: HomeAssistant) -> JobHistory:
+    """Create a history of four jobs."""
+    history = JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID))
+    history.async_add(_job("a.gcode", 1000))
+    history.async_add(_job("b.gcode", 2000, JOB_OUTCOME_CANCELLED))
+    history.async_add(_job("a.gcode", 3000))
+    history.async_add(_job("a.gcode", 4000, JOB_OUTCOME_CANCELLED))
+    return history
+
+
+def test_totals(history: JobHistory) -> None:
+    """Test the totals are kept as jobs are added."""
+    assert len(history.jobs) == 4  # noqa: PLR2004
+    assert history.finished == 2  # noqa: PLR2004
+    assert history.print_seconds == 4 * 3600
+    assert history.filament_length == 4 * 1500
+    assert history.success_rate == 50  # noqa: PLR2004
+
+
+def test_success_rate_without_jobs(hass: HomeAssistant) -> None:
+    """Test there is no success rate before the first job."""
+    assert JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID)).success_rate is None
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ({}, [1000, 2000, 3000, 4000]),
+        ({"start": 2000}, [2000, 3000, 4000]),
+        ({"end": 2500}, [1000, 2000]),
+        ({"start": 1500, "end": 3000}, [2000, 3000]),
+        ({"print_name": "a.gcode"}, [1000, 3000, 4000]),
+        ({"print_name": "a.gcode", "start": 1500, "end": 3500}, [3000]),
+        ({"print_name": "b.gcode", "start": 2500}, []),
+        ({"print_name": "missing.gcode"}, []),
+    ],
+)
+def test_query(history: JobHistory, query: dict[str, Any], expected: list[int]) -> None:
+    """Test jobs are found by file name and end time."""
+    assert [job["ended"] for job in history.query(**query)] == expected
+
+
+async def test_saved(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test the jobs are saved after a delay."""
+    history = JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID))
+    history.async_add(_job("a.gcode", 1000))
+    assert JOBS_KEY not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=JOBS_SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert hass_storage[JOBS_KEY]["version"] == JOBS_STORAGE_VERSION
+    assert hass_storage[JOBS_KEY]["data"] == {"jobs": history.jobs}
+
+
+async def test_loaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any], history: JobHistory
+) -> None:
+    """Test the stored jobs are loaded with their totals and index."""
+    hass_storage[JOBS_KEY] = {
+        "version": JOBS_STORAGE_VERSION,
+        "key": JOBS_KEY,
+        "data": {"jobs": history.jobs},
+    }
+
+    loaded = JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID))
+    await loaded.async_load()
+    assert loaded.jobs == history.jobs
+    assert loaded.success_rate == 50  # noqa: PLR2004
+    assert [job["ended"] for job in loaded.query(print_name="b.gcode")] == [2000]
+
+
+async def test_load_empty(hass: HomeAssistant) -> None:
+    """Test loading without a stored history."""
+    history = JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID))
+    await history.async_load()
+
+    assert history.jobs == []
+
+
+def test_job_record(mock_box_info: BoxInfo) -> None:
+    """Test the record takes the job details from the last poll of the job."""
+    previous = BoxSnapshot(box_payload(mock_box_info))
+    data = BoxSnapshot(
+        box_payload(
+            mock_box_info, state=0, print_name="", print_job_time=0, consumables_len=0
+        )
+    )
+
+    assert job_record(previous, data, 10000.0, JOB_OUTCOME_CANCELLED) == {
+        "print_name": "MyPrint.gcode",
+        "started": 2800.0,
+        "ended": 10000.0,
+        "duration": 7200,
+        "filament_length": 1500,
+        "filament_type": "PLA",
+        "outcome": JOB_OUTCOME_CANCELLED,
+    }
@@ -0,0 +1,51 @@
+"""Tests for the poll metrics."""
+
+import pytest
+
+from custom_components.creality_box_control.metrics import PollMetrics
+
+
+def test_empty() -> None:
+    """Test the metrics before the first poll."""
+    assert PollMetrics(10).as_dict() == {
+        "last_latency": None,
+        "p50_latency": None,
+        "p95_latency": None,
+        "consecutive_failures": 0,
+        "bytes_received": 0,
+        "last_parse_time": None,
+    }
+
+
+def test_record() -> None:
+    """Test responses, parses and failures are recorded."""
+    metrics = PollMetrics(10)
+    metrics.record_response(0.2, 1500)
+    metrics.record_response(0.1, 1500)
+    metrics.record_parse(0.001)
+    metrics.record_failure()
+    metrics.record_failure()
+
+    assert metrics.as_dict() == {
+        "last_latency": 0.1,
+        "p50_latency": 0.1,
+        "p95_latency": 0.2,
+        "consecutive_failures": 2,
+        "bytes_received": 3000,
+        "last_parse_time": 0.001,
+    }
+
+    metrics.record_success()
+    assert metrics.consecutive_failures == 0
+
+
+@pytest.mark.parametrize(
+    ("percent", "expected"), [(0, 11), (50, 15), (95, 20), (100, 20)]
+)
+def test_percentile_window(percent: float, expected: float) -> None:
+    """Test the percentiles only cover the latencies in the window."""
+    metrics = PollMetrics(10)
+    for latency in range(1, 21):
+        metrics.record_response(latency, 0)
+
+    assert metrics.percentile(percent) == expected
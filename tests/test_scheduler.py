@@ -0,0 +1,148 @@
+"""Tests for the farm scheduler."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.creality_box_control.const import (
+    FARM_CYCLE_INTERVAL,
+    FARM_MAX_CONCURRENT,
+)
+from custom_components.creality_box_control.scheduler import (
+    CrealityBoxFarmScheduler,
+    CycleStats,
+    async_get_farm_scheduler,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture
+def short_cycle() -> Generator:
+    """Shorten the cycle so staggered polls finish quickly."""
+    with patch(
+        "custom_components.creality_box_control.scheduler.FARM_CYCLE_INTERVAL", 0.01
+    ):
+        yield
+
+
+def _coordinator(*, due: bool) -> MagicMock:
+    """Create a mock coordinator."""
+    coordinator = MagicMock(async_refresh=AsyncMock())
+    coordinator.poll_due.return_value = due
+    return coordinator
+
+
+async def test_get_farm_scheduler(hass: HomeAssistant) -> None:
+    """Test the scheduler is shared by every entry."""
+    scheduler = async_get_farm_scheduler(hass)
+
+    assert async_get_farm_scheduler(hass) is scheduler
+
+
+async def test_register(hass: HomeAssistant) -> None:
+    """Test registering takes over the coordinator timer."""
+    scheduler = CrealityBoxFarmScheduler(hass)
+    first = _coordinator(due=True)
+    second = _coordinator(due=True)
+
+    unregister_first = scheduler.async_register(first)
+    unregister_second = scheduler.async_register(second)
+
+    first.async_use_farm_scheduler.assert_called_once()
+    assert scheduler._unsub_timer is not None  # noqa: SLF001
+
+    unregister_first()
+    assert scheduler._unsub_timer is not None  # noqa: SLF001
+    unregister_second()
+    assert scheduler._unsub_timer is None  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("short_cycle")
+async def test_run_cycle(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """Test a cycle polls only the due boxes and records its timing."""
+    caplog.set_level(logging.DEBUG)
+    scheduler = CrealityBoxFarmScheduler(hass)
+    due = _coordinator(due=True)
+    idle = _coordinator(due=False)
+    unregister_due = scheduler.async_register(due)
+    unregister_idle = scheduler.async_register(idle)
+
+    await scheduler.async_run_cycle()
+
+    due.async_refresh.assert_awaited_once()
+    idle.async_refresh.assert_not_awaited()
+    assert scheduler.last_cycle is not None
+    assert scheduler.last_cycle.boxes == 2  # noqa: PLR2004
+    assert scheduler.last_cycle.polled == 1
+    assert "polled 1 of 2 boxes" in caplog.text
+    unregister_due()
+    unregister_idle()
+
+
+async def test_run_cycle_empty(hass: HomeAssistant) -> None:
+    """Test an empty cycle does nothing."""
+    scheduler = CrealityBoxFarmScheduler(hass)
+
+    await scheduler.async_run_cycle()
+
+    assert scheduler.last_cycle is None
+
+
+@pytest.mark.usefixtures("short_cycle")
+async def test_start_cycle(hass: HomeAssistant) -> None:
+    """Test the timer starts a cycle in the background."""
+    scheduler = CrealityBoxFarmScheduler(hass)
+    coordinator = _coordinator(due=True)
+    scheduler._coordinators.append(coordinator)  # noqa: SLF001
+
+    scheduler._async_start_cycle()  # noqa: SLF001
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    coordinator.async_refresh.assert_awaited_once()
+
+
+async def test_start_cycle_overrun(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a cycle is skipped while the previous one is still running."""
+    scheduler = CrealityBoxFarmScheduler(hass)
+    running = asyncio.get_running_loop().create_future()
+    scheduler._cycle = running  # noqa: SLF001
+
+    scheduler._async_start_cycle()  # noqa: SLF001
+    scheduler._async_start_cycle()  # noqa: SLF001
+
+    assert scheduler._cycle is running  # noqa: SLF001
+    # Reported once while the overrun lasts
+    assert caplog.text.count("still running") == 1
+    running.cancel()
+
+    # A cycle that starts on time reports the next overrun again
+    scheduler._async_start_cycle()  # noqa: SLF001
+    await hass.async_block_till_done(wait_background_tasks=True)
+    running = asyncio.get_running_loop().create_future()
+    scheduler._cycle = running  # noqa: SLF001
+    scheduler._async_start_cycle()  # noqa: SLF001
+    assert caplog.text.count("still running") == 2  # noqa: PLR2004
+    running.cancel()
+
+
+def test_cycle_capacity() -> None:
+    """Test the capacity estimate of a cycle."""
+    assert CycleStats(boxes=3, polled=0, duration=0, poll_time=0).capacity is None
+    stats = CycleStats(boxes=2, polled=2, duration=1, poll_time=1)
+    assert stats.capacity == int(FARM_CYCLE_INTERVAL / 0.5 * FARM_MAX_CONCURRENT)
+    assert stats.as_dict() == {
+        "boxes": 2,
+        "polled": 2,
+        "duration": 1,
+        "poll_time": 1,
+        "capacity": stats.capacity,
+    }
@@ -1,20 +1,57 @@
 """Tests for the sensor platform."""
 
-from datetime import timedelta
-from typing import TYPE_CHECKING, Literal
-from unittest.mock import AsyncMock, MagicMock
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.creality_box_control.const import DOMAIN, HOST, MODEL
+from custom_components.creality_box_control.circuit_breaker import CircuitState
+from custom_components.creality_box_control.const import (
+    CONF_DEADBAND,
+    CONF_ENTITY_GROUPS,
+    CONF_ETA_DRIFT,
+    CONF_HYSTERESIS,
+    CONF_MIN_INTERVAL,
+    DOMAIN,
+    ENTITY_GROUP_JOBS,
+    HOST,
+    JOB_OUTCOME_CANCELLED,
+    JOB_OUTCOME_FINISHED,
+    METRICS_UPDATE_INTERVAL,
+    MODEL,
+)
+from custom_components.creality_box_control.jobs import JobHistory, jobs_store
+from custom_components.creality_box_control.metrics import PollMetrics
 from custom_components.creality_box_control.sensor import (
+    DIAGNOSTIC_ENTITY_DESCRIPTIONS,
     ENTITY_DESCRIPTIONS,
+    JOB_ENTITY_DESCRIPTIONS,
+    METRIC_ENTITY_DESCRIPTIONS,
+    PREDICTED_FINISH_ENTITY_DESCRIPTION,
+    TEMPERATURE_CHANNEL_ENTITY_DESCRIPTIONS,
+    TIMESTAMP_ENTITY_DESCRIPTIONS,
+    TOOLHEAD_ENTITY_DESCRIPTIONS,
+    CrealityBoxDiagnosticSensor,
+    CrealityBoxJobSensor,
+    CrealityBoxMetricSensor,
+    CrealityBoxPredictedFinishSensor,
     CrealityBoxSensor,
-    _map_state,
-    _to_time_left,
+    CrealityBoxTimestampSensor,
     async_setup_entry,
 )
-from tests import TEST_CONFIG_ENTRY_ID, TEST_HOST, TEST_MODEL, TEST_TITLE
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.view import BoxView
+from tests import (
+    TEST_CONFIG_ENTRY_ID,
+    TEST_HOST,
+    TEST_MODEL,
+    TEST_TITLE,
+    box_payload,
+)
 
 if TYPE_CHECKING:
     from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
@@ -24,96 +61,46 @@ if TYPE_CHECKING:
 @pytest.fixture
 def coordinator(mock_box_info: BoxInfo) -> MagicMock:
     """Mock the coordinator."""
-    return MagicMock(
-        data=mock_box_info,
+    coordinator = MagicMock(
+        data=BoxSnapshot(box_payload(mock_box_info)),
         config_entry=MagicMock(
             data={HOST: TEST_HOST, MODEL: TEST_MODEL},
             entry_id=TEST_CONFIG_ENTRY_ID,
             title=TEST_TITLE,
             domain=DOMAIN,
+            options={},
         ),
     )
+    coordinator.estimator.estimate.return_value = None
+    type(coordinator).view = PropertyMock(
+        side_effect=lambda: BoxView.from_snapshot(coordinator.data)
+    )
+    return coordinator
 
 
 @pytest.mark.parametrize(
-    ("entity_description", "expected_state"),
+    ("key", "expected_state"),
     [
-        (
-            MagicMock(
-                key="wanip",
-                name="IP Address",
-                value_fn=lambda x: x.wanip,
-            ),
-            TEST_HOST,
-        ),
-        (
-            MagicMock(
-                key="state",
-                name="Current State",
-                value_fn=lambda x: (
-                    "Printing" if x.state == 1 and x.connect == 1 else "Unknown"
-                ),
-            ),
-            "Printing",
-        ),
-        (
-            MagicMock(
-                key="print_job_time",
-                name="Time Running",
-                value_fn=lambda x: str(timedelta(seconds=x.print_job_time)),
-            ),
-            "2:00:00",
-        ),
-        (
-            MagicMock(
-                key="print_left_time",
-                name="Time Left",
-                value_fn=lambda x: str(timedelta(seconds=x.print_left_time)),
-            ),
-            "1:00:00",
-        ),
-        (
-            MagicMock(
-                key="print_name",
-                name="Currently Printing",
-                value_fn=lambda x: x.print_name,
-            ),
-            "MyPrint.gcode",
-        ),
-        (
-            MagicMock(
-                key="nozzle_temp",
-                name="Nozzle Temp",
-                value_fn=lambda x: x.nozzle_temp,
-            ),
-            212,
-        ),
-        (
-            MagicMock(
-                key="bed_temp",
-                name="Bed Temp",
-                value_fn=lambda x: x.bed_temp,
-            ),
-            60,
-        ),
-        (
-            MagicMock(
-                key="print_progress",
-                name="Print Progress",
-                value_fn=lambda x: x.print_progress,
-            ),
-            56,
-        ),
+        ("wanip", TEST_HOST),
+        ("state", "Printing"),
+        ("print_job_time", "2:00:00"),
+        ("print_left_time", "1:00:00"),
+        ("print_name", "MyPrint.gcode"),
+        ("nozzle_temp", 212),
+        ("bed_temp", 60),
+        ("print_progress", 56),
     ],
 )
 async def test_sensor(
-    coordinator: MagicMock,
-    entity_description: MagicMock,
-    expected_state: Literal["192.168.1.2", "Printing", "0:01:40", "test.gcode", 50]
-    | float,
+    coordinator: MagicMock, key: str, expected_state: str | float
 ) -> None:
     """Test the sensor."""
     # Arrange
+    entity_description = next(
+        entity_description
+        for entity_description in ENTITY_DESCRIPTIONS
+        if entity_description.key == key
+    )
     # Act
     sensor = CrealityBoxSensor(
         coordinator=coordinator, entity_description=entity_description
@@ -122,60 +109,470 @@ async def test_sensor(
     assert sensor.native_value == expected_state
 
 
-async def test_sensor_setup_entry(hass: HomeAssistant) -> None:
+async def test_sensor_setup_entry(hass: HomeAssistant, coordinator: MagicMock) -> None:
     """Test the async_setup_entry function."""
-    entry = MagicMock()
-    coordinator = AsyncMock()
-    coordinator.async_request_refresh = AsyncMock()
+    entry = MagicMock(options={})
     entry.runtime_data = MagicMock(coordinator=coordinator)
-    async_add_entities = AsyncMock()
+    async_add_entities = MagicMock()
 
     await async_setup_entry(hass, entry, async_add_entities)
 
     # Convert the generator expression to a list
-    sensors = list(async_add_entities.call_args[0][0])
+    sensors = list(async_add_entities.call_args_list[0][0][0])
 
     # Assert that async_add_entities was called with a list of the expected sensors
-    assert async_add_entities.call_count == 1
-    assert len(sensors) == len(ENTITY_DESCRIPTIONS)
+    # only, the fixture box mirrors its one nozzle on the first channel
+    async_add_entities.assert_called_once()
+    assert (
+        len(sensors)
+        == len(ENTITY_DESCRIPTIONS)
+        + len(TOOLHEAD_ENTITY_DESCRIPTIONS)
+        + len(TIMESTAMP_ENTITY_DESCRIPTIONS)
+        + len(JOB_ENTITY_DESCRIPTIONS)
+        + len(DIAGNOSTIC_ENTITY_DESCRIPTIONS)
+        + len(METRIC_ENTITY_DESCRIPTIONS)
+        + 1
+    )
 
 
-@pytest.mark.parametrize(
-    ("seconds_left", "expected_output"),
-    [
-        (0, "0:00:00"),
-        (30, "0:00:30"),
-        (125, "0:02:05"),
-        (3666, "1:01:06"),
-        (93780, "1 day, 2:03:00"),
-    ],
-)
-def test_to_time_left(seconds_left: int, expected_output: str) -> None:
-    """Test the _to_time_left function."""
-    assert _to_time_left(seconds_left) == expected_output
+async def test_sensor_setup_entry_groups(
+    hass: HomeAssistant, coordinator: MagicMock
+) -> None:
+    """Test deselected entity groups are not created."""
+    entry = MagicMock(options={CONF_ENTITY_GROUPS: [ENTITY_GROUP_JOBS]})
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+    async_add_entities = MagicMock()
 
+    await async_setup_entry(hass, entry, async_add_entities)
 
-@pytest.mark.parametrize(
-    ("state", "connect", "expected_output"),
-    [
-        (1, 1, "Printing"),
-        (4, 1, "Stopping"),
-        (5, 1, "Suspending"),
-        (0, 1, "Idle"),
-        (1, 0, "Offline"),
-        (4, 0, "Offline"),
-        (5, 0, "Offline"),
-        (0, 0, "Offline"),
-    ],
-)
-def test_map_state(state: int, connect: int, expected_output: str) -> None:
-    """
-    Tests the _map_state function.
+    sensors = list(async_add_entities.call_args_list[0][0][0])
+    assert len(sensors) == (
+        len(ENTITY_DESCRIPTIONS)
+        + len(TIMESTAMP_ENTITY_DESCRIPTIONS)
+        + len(JOB_ENTITY_DESCRIPTIONS)
+        + len(DIAGNOSTIC_ENTITY_DESCRIPTIONS)
+        + 1
+    )
+
+
+async def test_temperature_channels(
+    hass: HomeAssistant, coordinator: MagicMock
+) -> None:
+    """Test channel sensors are only added once the channel reports data."""
+    coordinator.data = coordinator.data.replace(chamber_temp=35)
+    entry = MagicMock()
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(hass, entry, async_add_entities)
+
+    assert async_add_entities.call_count == 2  # noqa: PLR2004
+    (sensor,) = async_add_entities.call_args[0][0]
+    assert sensor.entity_description.key == "chamber_temp"
+    assert sensor.native_value == 35  # noqa: PLR2004
+    listener = coordinator.async_add_listener.call_args[0][0]
+    entry.async_on_unload.assert_called_once_with(
+        coordinator.async_add_listener.return_value
+    )
+
+    # Nothing new reports, nothing is added
+    listener()
+    assert async_add_entities.call_count == 2  # noqa: PLR2004
+
+    # A second nozzle appears later, the first channel is a real nozzle then
+    coordinator.data = coordinator.data.replace(the_2_nd_nozzle_temp=200)
+    listener()
+    assert async_add_entities.call_count == 3  # noqa: PLR2004
+    assert [
+        sensor.entity_description.key for sensor in async_add_entities.call_args[0][0]
+    ] == ["the_1_st_nozzle_temp", "the_2_nd_nozzle_temp"]
+
+
+async def test_temperature_channel_nozzle_1(
+    hass: HomeAssistant, coordinator: MagicMock
+) -> None:
+    """Test the first nozzle channel is added when it differs from the nozzle."""
+    coordinator.data = coordinator.data.replace(the_1_st_nozzle_temp=190)
+    entry = MagicMock()
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(hass, entry, async_add_entities)
+
+    (sensor,) = async_add_entities.call_args[0][0]
+    assert sensor.entity_description.key == "the_1_st_nozzle_temp"
+
+
+async def test_temperature_channel_filter(coordinator: MagicMock) -> None:
+    """Test channel sensors use the deadband of the matching main sensor."""
+    coordinator.config_entry.options = {f"nozzle_temp_{CONF_DEADBAND}": 2}
+    coordinator.data = coordinator.data.replace(nozzle_temp2=200)
+    sensor = CrealityBoxSensor(
+        coordinator=coordinator,
+        entity_description=next(
+            entity_description
+            for entity_description in TEMPERATURE_CHANNEL_ENTITY_DESCRIPTIONS
+            if entity_description.key == "nozzle_temp2"
+        ),
+    )
+    sensor.async_write_ha_state = MagicMock()
+
+    coordinator.data = coordinator.data.replace(nozzle_temp2=201)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 200  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_not_called()
+
+
+async def test_temperature_filter_options_updated(coordinator: MagicMock) -> None:
+    """Test changed deadband options apply to the running filter."""
+    sensor = CrealityBoxSensor(
+        coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[5]
+    )
+    sensor.hass = MagicMock()
+    sensor.async_write_ha_state = MagicMock()
+    await sensor.async_added_to_hass()
+    coordinator.async_add_filter.assert_called_once_with(
+        "nozzle_temp",
+        sensor._filter,  # noqa: SLF001
+    )
+
+    # The coordinator pushes changed options to the registered filter
+    sensor._filter.apply_options(  # noqa: SLF001
+        {f"nozzle_temp_{CONF_DEADBAND}": 5, CONF_HYSTERESIS: 0}, "nozzle_temp"
+    )
+
+    coordinator.data = coordinator.data.replace(nozzle_temp=216)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 212  # noqa: PLR2004
+    coordinator.data = coordinator.data.replace(nozzle_temp=218)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 218  # noqa: PLR2004
+
+
+async def test_unfiltered_sensor_ignores_options(coordinator: MagicMock) -> None:
+    """Test sensors without a filter do not follow the options."""
+    sensor = CrealityBoxSensor(
+        coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[0]
+    )
+    sensor.hass = MagicMock()
+    await sensor.async_added_to_hass()
+    coordinator.async_add_filter.assert_not_called()
+
+
+async def test_connection_state_sensor(coordinator: MagicMock) -> None:
+    """Test the connection state sensor reports the breaker state."""
+    coordinator.breaker.state = CircuitState.OPEN
+    coordinator.last_update_success = False
+
+    sensor = CrealityBoxDiagnosticSensor(
+        coordinator=coordinator,
+        entity_description=DIAGNOSTIC_ENTITY_DESCRIPTIONS[0],
+    )
+
+    assert sensor.available is True
+    assert sensor.native_value == CircuitState.OPEN
+
+    sensor.async_write_ha_state = MagicMock()
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    sensor.async_write_ha_state.assert_not_called()
+
+    coordinator.breaker.state = CircuitState.HALF_OPEN
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == CircuitState.HALF_OPEN
+    sensor.async_write_ha_state.assert_called_once()
+
+
+async def test_metric_sensors(hass: HomeAssistant, coordinator: MagicMock) -> None:
+    """Test the metric sensors are written on their interval only."""
+    coordinator.metrics = PollMetrics(10)
+    coordinator.last_update_success = False
+    sensors = {
+        entity_description.key: CrealityBoxMetricSensor(
+            coordinator=coordinator, entity_description=entity_description
+        )
+        for entity_description in METRIC_ENTITY_DESCRIPTIONS
+    }
+    for sensor in sensors.values():
+        sensor.hass = hass
+        sensor.async_write_ha_state = MagicMock()
+        await sensor.async_added_to_hass()
+        assert sensor.available is True
+        assert sensor.native_value in (None, 0)
+
+    coordinator.metrics.record_response(0.0123, 1500)
+    coordinator.metrics.record_parse(0.0004)
+    coordinator.metrics.record_failure()
+    for sensor in sensors.values():
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        sensor.async_write_ha_state.assert_not_called()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=METRICS_UPDATE_INTERVAL)
+    )
+    await hass.async_block_till_done()
+    for sensor in sensors.values():
+        sensor.async_write_ha_state.assert_called_once()
+    assert {key: sensor.native_value for key, sensor in sensors.items()} == {
+        "poll_latency": 12.3,
+        "poll_latency_p50": 12.3,
+        "poll_latency_p95": 12.3,
+        "consecutive_failures": 1,
+        "bytes_received": 1500,
+        "parse_time": 0.4,
+    }
+
+    for sensor in sensors.values():
+        sensor._call_on_remove_callbacks()  # noqa: SLF001
+
+
+async def test_job_sensors(hass: HomeAssistant, coordinator: MagicMock) -> None:
+    """Test the job sensors report the totals of the job history."""
+    coordinator.jobs = JobHistory(jobs_store(hass, TEST_CONFIG_ENTRY_ID))
+    sensors = {
+        entity_description.key: CrealityBoxJobSensor(
+            coordinator=coordinator, entity_description=entity_description
+        )
+        for entity_description in JOB_ENTITY_DESCRIPTIONS
+    }
+    assert sensors["jobs_printed"].native_value == 0
+    assert sensors["success_rate"].native_value is None
+
+    for outcome in (JOB_OUTCOME_FINISHED, JOB_OUTCOME_CANCELLED, JOB_OUTCOME_FINISHED):
+        coordinator.jobs.async_add(
+            {
+                "print_name": "MyPrint.gcode",
+                "started": 0.0,
+                "ended": 5400.0,
+                "duration": 5400,
+                "filament_length": 1500,
+                "filament_type": "PLA",
+                "outcome": outcome,
+            }
+        )
+    for sensor in sensors.values():
+        sensor.async_write_ha_state = MagicMock()
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        sensor.async_write_ha_state.assert_called_once()
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        sensor.async_write_ha_state.assert_called_once()
+
+    assert sensors["jobs_printed"].native_value == 3  # noqa: PLR2004
+    assert sensors["total_print_time"].native_value == 4.5  # noqa: PLR2004
+    assert sensors["filament_used"].native_value == 4500  # noqa: PLR2004
+    assert sensors["success_rate"].native_value == 66.7  # noqa: PLR2004
+
+
+async def test_sensor_writes_only_changes(coordinator: MagicMock) -> None:
+    """Test the sensor skips the state write when the value did not change."""
+    sensor = CrealityBoxSensor(
+        coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[5]
+    )
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    sensor.async_write_ha_state.assert_not_called()
+
+    coordinator.data = coordinator.data.replace(nozzle_temp=215)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 215  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_called_once()
+
+
+async def test_temperature_sensor_filter(coordinator: MagicMock) -> None:
+    """Test temperature jitter within the deadband is not published."""
+    coordinator.config_entry.options = {
+        f"nozzle_temp_{CONF_DEADBAND}": 2,
+        f"nozzle_temp_{CONF_MIN_INTERVAL}": 0,
+    }
+    sensor = CrealityBoxSensor(
+        coordinator=coordinator,
+        entity_description=next(
+            entity_description
+            for entity_description in ENTITY_DESCRIPTIONS
+            if entity_description.key == "nozzle_temp"
+        ),
+    )
+    sensor.async_write_ha_state = MagicMock()
+    assert sensor.native_value == 212  # noqa: PLR2004
+
+    coordinator.data = coordinator.data.replace(nozzle_temp=214)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 212  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_not_called()
+
+    coordinator.data = coordinator.data.replace(nozzle_temp=180)
+    sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 180  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_called_once()
+
+
+async def test_temperature_held_value_published(
+    hass: HomeAssistant, coordinator: MagicMock
+) -> None:
+    """Test a value held back by the minimum interval is published when it ends."""
+    coordinator.config_entry.options = {f"nozzle_temp_{CONF_MIN_INTERVAL}": 30}
+    monotonic = "custom_components.creality_box_control.sensor.monotonic"
+    with patch(monotonic, return_value=0):
+        sensor = CrealityBoxSensor(
+            coordinator=coordinator, entity_description=ENTITY_DESCRIPTIONS[5]
+        )
+    sensor.hass = hass
+    sensor.async_write_ha_state = MagicMock()
+    await sensor.async_added_to_hass()
+
+    coordinator.data = coordinator.data.replace(nozzle_temp=220)
+    with patch(monotonic, return_value=10):
+        sensor._handle_coordinator_update()  # noqa: SLF001
+    assert sensor.native_value == 212  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_not_called()
+
+    # The temperature settled, the box keeps sending the same payload and the
+    # coordinator calls no listener until the minimum interval ends
+    with patch(monotonic, return_value=30):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+    assert sensor.native_value == 220  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_called_once()
+
+    # A held value is dropped when the temperature returns before it passes
+    coordinator.data = coordinator.data.replace(nozzle_temp=240)
+    with patch(monotonic, return_value=40):
+        sensor._handle_coordinator_update()  # noqa: SLF001
+    coordinator.data = coordinator.data.replace(nozzle_temp=220)
+    with patch(monotonic, return_value=45):
+        sensor._handle_coordinator_update()  # noqa: SLF001
+    with patch(monotonic, return_value=60):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+        await hass.async_block_till_done()
+    assert sensor.native_value == 220  # noqa: PLR2004
+    sensor.async_write_ha_state.assert_called_once()
+
+    sensor._call_on_remove_callbacks()  # noqa: SLF001
+
+
+async def test_toolhead_sensors(coordinator: MagicMock) -> None:
+    """Test the position, layer and feed rate sensors."""
+    sensors = {
+        entity_description.key: CrealityBoxSensor(
+            coordinator=coordinator, entity_description=entity_description
+        )
+        for entity_description in TOOLHEAD_ENTITY_DESCRIPTIONS
+    }
+
+    assert sensors["position_x"].native_value == 100.0  # noqa: PLR2004
+    assert sensors["position_y"].native_value == 100.0  # noqa: PLR2004
+    assert sensors["position_z"].native_value == 5.0  # noqa: PLR2004
+    assert sensors["layer"].native_value == 10  # noqa: PLR2004
+    assert sensors["layer_progress"].native_value == 2.9  # noqa: PLR2004
+    assert sensors["feed_rate"].native_value == 100  # noqa: PLR2004
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Freeze the current time used by the timestamp sensors."""
+    return datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+async def test_timestamp_sensors(coordinator: MagicMock, now: datetime) -> None:
+    """Test the start and finish times are derived from the print times."""
+    with patch(
+        "custom_components.creality_box_control.sensor.dt_util.utcnow",
+        return_value=now,
+    ):
+        start, finish = (
+            CrealityBoxTimestampSensor(
+                coordinator=coordinator, entity_description=entity_description
+            )
+            for entity_description in TIMESTAMP_ENTITY_DESCRIPTIONS
+        )
+
+    assert start.device_class == SensorDeviceClass.TIMESTAMP
+    assert start.native_value == now - timedelta(seconds=7200)
+    assert finish.native_value == now + timedelta(seconds=3600)
+
+
+async def test_timestamp_sensor_drift(coordinator: MagicMock, now: datetime) -> None:
+    """Test the estimate is only rewritten when it drifts past the threshold."""
+    coordinator.config_entry.options = {CONF_ETA_DRIFT: 30}
+    with patch(
+        "custom_components.creality_box_control.sensor.dt_util.utcnow"
+    ) as utcnow:
+        utcnow.return_value = now
+        sensor = CrealityBoxTimestampSensor(
+            coordinator=coordinator,
+            entity_description=TIMESTAMP_ENTITY_DESCRIPTIONS[1],
+        )
+        sensor.async_write_ha_state = MagicMock()
+        finish = now + timedelta(seconds=3600)
+
+        # The estimate ticks along with the clock, nothing is written
+        utcnow.return_value = now + timedelta(seconds=10)
+        coordinator.data = coordinator.data.replace(print_left_time=3590)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value == finish
+        sensor.async_write_ha_state.assert_not_called()
+
+        # The print slowed down by a minute
+        coordinator.data = coordinator.data.replace(print_left_time=3650)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value == finish + timedelta(seconds=60)
+        sensor.async_write_ha_state.assert_called_once()
+
+        # The print finished
+        coordinator.data = coordinator.data.replace(state=0)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value is None
+        assert sensor.async_write_ha_state.call_count == 2  # noqa: PLR2004
+
+
+async def test_predicted_finish_sensor(coordinator: MagicMock, now: datetime) -> None:
+    """Test the predicted finish and its confidence come from the estimator."""
+    with patch(
+        "custom_components.creality_box_control.sensor.dt_util.utcnow",
+        return_value=now,
+    ):
+        sensor = CrealityBoxPredictedFinishSensor(
+            coordinator=coordinator,
+            entity_description=PREDICTED_FINISH_ENTITY_DESCRIPTION,
+        )
+        assert sensor.native_value is None
+        assert sensor.extra_state_attributes == {"confidence": None}
+
+        coordinator.estimator.estimate.return_value = (1800.0, 0.876)
+        sensor.async_write_ha_state = MagicMock()
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value == now + timedelta(seconds=1800)
+        assert sensor.extra_state_attributes == {"confidence": 88}
+        sensor.async_write_ha_state.assert_called_once()
+
+        coordinator.data = coordinator.data.replace(state=0)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value is None
+        assert sensor.extra_state_attributes == {"confidence": None}
+
+
+async def test_predicted_finish_confidence(
+    coordinator: MagicMock, now: datetime
+) -> None:
+    """Test a rising confidence is written while the finish time stays put."""
+    coordinator.estimator.estimate.return_value = (1800.0, 0.08)
+    with patch(
+        "custom_components.creality_box_control.sensor.dt_util.utcnow",
+        return_value=now,
+    ):
+        sensor = CrealityBoxPredictedFinishSensor(
+            coordinator=coordinator,
+            entity_description=PREDICTED_FINISH_ENTITY_DESCRIPTION,
+        )
+        sensor.async_write_ha_state = MagicMock()
 
-    Args:
-      state: The state of the printer, as an integer.
-      connect: The connection status of the printer, as an integer.
-      expected_output: The expected output string.
+        # Within the same step of five points nothing is written
+        coordinator.estimator.estimate.return_value = (1800.0, 0.09)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        sensor.async_write_ha_state.assert_not_called()
 
-    """
-    assert _map_state(state, connect) == expected_output
+        coordinator.estimator.estimate.return_value = (1800.0, 0.95)
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        assert sensor.native_value == now + timedelta(seconds=1800)
+        assert sensor.extra_state_attributes == {"confidence": 95}
+        sensor.async_write_ha_state.assert_called_once()
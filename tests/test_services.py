@@ -0,0 +1,129 @@
+"""Tests for the bulk command services."""
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.creality_box_control.const import (
+    DOMAIN,
+    PRINT_PAUSE,
+    PRINT_STOP,
+)
+from custom_components.creality_box_control.services import async_setup_services
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def _add_box(hass: HomeAssistant, title: str) -> MockConfigEntry:
+    """Add a loaded entry with a mocked coordinator."""
+    entry = MockConfigEntry(domain=DOMAIN, title=title, state=ConfigEntryState.LOADED)
+    entry.add_to_hass(hass)
+    entry.runtime_data = MagicMock()
+    entry.runtime_data.coordinator.send_command = AsyncMock()
+    return entry
+
+
+@pytest.fixture
+def boxes(hass: HomeAssistant) -> list[MockConfigEntry]:
+    """Add three boxes and register the services."""
+    async_setup_services(hass)
+    return [_add_box(hass, f"Box {index}") for index in range(3)]
+
+
+async def test_stop_all(hass: HomeAssistant, boxes: list[MockConfigEntry]) -> None:
+    """Test every box is stopped and the results are reported per box."""
+    failing = boxes[1].runtime_data.coordinator.send_command
+    failing.side_effect = ValueError("refused")
+
+    response = await hass.services.async_call(
+        DOMAIN, "stop_all", blocking=True, return_response=True
+    )
+
+    for entry in boxes:
+        entry.runtime_data.coordinator.send_command.assert_awaited_once_with(PRINT_STOP)
+    assert response == {
+        "boxes": {
+            boxes[0].entry_id: {"title": "Box 0", "success": True, "error": None},
+            boxes[1].entry_id: {"title": "Box 1", "success": False, "error": "refused"},
+            boxes[2].entry_id: {"title": "Box 2", "success": True, "error": None},
+        }
+    }
+
+
+async def test_commands_run_concurrently(
+    hass: HomeAssistant, boxes: list[MockConfigEntry]
+) -> None:
+    """Test a slow box neither delays the others nor the response."""
+    started = 0
+
+    async def _slow_command(_command: str) -> None:
+        nonlocal started
+        started += 1
+        await asyncio.sleep(1)
+
+    for entry in boxes:
+        entry.runtime_data.coordinator.send_command.side_effect = _slow_command
+
+    with patch(
+        "custom_components.creality_box_control.services.BULK_COMMAND_TIMEOUT", 0.05
+    ):
+        response = await hass.services.async_call(
+            DOMAIN, "pause_all", blocking=True, return_response=True
+        )
+
+    assert started == len(boxes)
+    assert response is not None
+    assert {result["error"] for result in response["boxes"].values()} == {"timeout"}
+
+
+async def test_pause_selected(
+    hass: HomeAssistant, boxes: list[MockConfigEntry]
+) -> None:
+    """Test only the boxes of the selected devices are paused."""
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=boxes[0].entry_id, identifiers={(DOMAIN, "12345")}
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "pause_selected",
+        {ATTR_DEVICE_ID: [device.id, device.id]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response is not None
+    assert list(response["boxes"]) == [boxes[0].entry_id]
+    boxes[0].runtime_data.coordinator.send_command.assert_awaited_once_with(PRINT_PAUSE)
+    boxes[1].runtime_data.coordinator.send_command.assert_not_awaited()
+
+
+async def test_selected_unknown_device(
+    hass: HomeAssistant, boxes: list[MockConfigEntry]
+) -> None:
+    """Test selecting a device that is not a loaded box is rejected."""
+    other = MockConfigEntry(domain="other")
+    other.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=other.entry_id, identifiers={("other", "1")}
+    )
+
+    for device_id in (device.id, "missing"):
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "resume_selected",
+                {ATTR_DEVICE_ID: device_id},
+                blocking=True,
+                return_response=True,
+            )
+    for entry in boxes:
+        entry.runtime_data.coordinator.send_command.assert_not_awaited()
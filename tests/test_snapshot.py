@@ -0,0 +1,108 @@
+"""Tests for the info snapshot."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from creality_wifi_box_client.exceptions import InvalidResponseError
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.creality_box_control.snapshot import (
+    PROJECTED_FIELDS,
+    BoxSnapshot,
+    parse_position,
+)
+from tests import box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+@pytest.fixture
+def snapshot(mock_box_info: BoxInfo) -> BoxSnapshot:
+    """Create a snapshot of the fixture payload."""
+    return BoxSnapshot(box_payload(mock_box_info))
+
+
+def test_projected_fields(snapshot: BoxSnapshot, mock_box_info: BoxInfo) -> None:
+    """Test the projected fields match the full model."""
+    for name, _, _ in PROJECTED_FIELDS:
+        assert getattr(snapshot, name) == getattr(mock_box_info, name)
+
+
+def test_lazy_fields(snapshot: BoxSnapshot, mock_box_info: BoxInfo) -> None:
+    """Test other fields are decoded from the raw payload on first access."""
+    assert snapshot._info is None  # noqa: SLF001
+    assert snapshot.box_version == mock_box_info.box_version
+    assert snapshot.filament_type == mock_box_info.filament_type
+    assert snapshot._info is not None  # noqa: SLF001
+
+    with pytest.raises(AttributeError):
+        _ = snapshot._missing  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "raw", [b"not json", b"[]", b'{"state": 1}', b'{"state": "printing"}']
+)
+def test_invalid_payload(raw: bytes) -> None:
+    """Test invalid payloads raise the library error."""
+    with pytest.raises(InvalidResponseError):
+        BoxSnapshot(raw)
+
+
+def test_replace(snapshot: BoxSnapshot) -> None:
+    """Test replace returns a changed copy."""
+    paused = snapshot.replace(state=5)
+
+    assert paused.state == 5  # noqa: PLR2004
+    assert snapshot.state == 1
+    assert paused != snapshot
+    assert paused.raw is snapshot.raw
+
+
+def test_projected(snapshot: BoxSnapshot) -> None:
+    """Test the projected fields decode again without the rest of the payload."""
+    projected = snapshot.projected()
+
+    assert list(projected) == [key for _, key, _ in PROJECTED_FIELDS]
+    assert "wifipasswd" not in projected
+    restored = BoxSnapshot(json_bytes(projected), projected_only=True)
+    for name, _, _ in PROJECTED_FIELDS:
+        assert getattr(restored, name) == getattr(snapshot, name)
+    # Fields that were not saved are missing instead of failing to decode
+    assert not hasattr(restored, "box_version")
+    with pytest.raises(AttributeError):
+        _ = restored.filament_type
+    assert not hasattr(restored.replace(state=5), "filament_type")
+
+
+def test_equality(snapshot: BoxSnapshot, mock_box_info: BoxInfo) -> None:
+    """Test snapshots of the same payload are equal."""
+    same = BoxSnapshot(box_payload(mock_box_info))
+
+    assert same == snapshot
+    assert hash(same) == hash(snapshot)
+    assert snapshot != mock_box_info
+    assert snapshot.as_dict()["DIDString"] == mock_box_info.did_string
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_output"),
+    [
+        ("X:100.0 Y:100.0 Z:5.0", (100.0, 100.0, 5.0)),
+        ("X:-1.5 Y: 20 Z:0.25 E:3.1", (-1.5, 20.0, 0.25)),
+        ("Z:12.", (None, None, 12.0)),
+        ("", (None, None, None)),
+        ("X:abc", (None, None, None)),
+    ],
+)
+def test_parse_position(
+    text: str, expected_output: tuple[float | None, float | None, float | None]
+) -> None:
+    """Test the position is split into the coordinates of the three axes."""
+    assert parse_position(text) == expected_output
+
+
+def test_position(snapshot: BoxSnapshot) -> None:
+    """Test the position is parsed with the payload and kept by copies."""
+    assert snapshot.position == (100.0, 100.0, 5.0)
+    assert snapshot.replace(state=5).position is snapshot.position
@@ -0,0 +1,107 @@
+"""Tests for the entity values derived from a snapshot."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.view import (
+    BoxView,
+    _map_state,
+    _to_layer_progress,
+    _to_time_left,
+)
+from tests import TEST_HOST, box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+
+
+def test_from_snapshot(mock_box_info: BoxInfo) -> None:
+    """Test the values of all entities are derived from the snapshot."""
+    view = BoxView.from_snapshot(BoxSnapshot(box_payload(mock_box_info)))
+
+    assert view == BoxView(
+        wanip=TEST_HOST,
+        state="Printing",
+        print_job_time="2:00:00",
+        print_left_time="1:00:00",
+        print_name="MyPrint.gcode",
+        nozzle_temp=212,
+        bed_temp=60,
+        print_progress=56,
+        position_x=100.0,
+        position_y=100.0,
+        position_z=5.0,
+        layer=10,
+        layer_progress=2.9,
+        feed_rate=100,
+        the_1_st_nozzle_temp=212,
+        the_2_nd_nozzle_temp=0,
+        nozzle_temp2=0,
+        bed_temp2=0,
+        chamber_temp=0,
+        upgrade_status=False,
+        error=False,
+        fan=False,
+    )
+
+
+def test_immutable(mock_box_info: BoxInfo) -> None:
+    """Test entities cannot change the shared view."""
+    view = BoxView.from_snapshot(BoxSnapshot(box_payload(mock_box_info)))
+
+    with pytest.raises(AttributeError):
+        view.nozzle_temp = 0  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@pytest.mark.parametrize(
+    ("seconds_left", "expected_output"),
+    [
+        (0, "0:00:00"),
+        (30, "0:00:30"),
+        (125, "0:02:05"),
+        (3666, "1:01:06"),
+        (93780, "1 day, 2:03:00"),
+    ],
+)
+def test_to_time_left(seconds_left: int, expected_output: str) -> None:
+    """Test the _to_time_left function."""
+    assert _to_time_left(seconds_left) == expected_output
+
+
+@pytest.mark.parametrize(
+    ("state", "connect", "expected_output"),
+    [
+        (1, 1, "Printing"),
+        (4, 1, "Stopping"),
+        (5, 1, "Suspending"),
+        (0, 1, "Idle"),
+        (1, 0, "Offline"),
+        (4, 0, "Offline"),
+        (5, 0, "Offline"),
+        (0, 0, "Offline"),
+    ],
+)
+def test_map_state(state: int, connect: int, expected_output: str) -> None:
+    """
+    Tests the _map_state function.
+
+    Args:
+      state: The state of the printer, as an integer.
+      connect: The connection status of the printer, as an integer.
+      expected_output: The expected output string.
+
+    """
+    assert _map_state(state, connect) == expected_output
+
+
+@pytest.mark.parametrize(
+    ("layer", "total_layer", "expected_output"),
+    [(10, 350, 2.9), (350, 350, 100.0), (400, 350, 100.0), (0, 0, None)],
+)
+def test_to_layer_progress(
+    layer: int, total_layer: int, expected_output: float | None
+) -> None:
+    """Test the layer progress is a percentage capped at 100."""
+    assert _to_layer_progress(layer, total_layer) == expected_output
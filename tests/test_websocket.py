@@ -0,0 +1,127 @@
+"""Tests for the websocket commands."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.creality_box_control.const import DOMAIN
+from custom_components.creality_box_control.history import SampleHistory
+from custom_components.creality_box_control.jobs import JobHistory, jobs_store
+from custom_components.creality_box_control.snapshot import BoxSnapshot
+from custom_components.creality_box_control.websocket import async_setup_websocket
+from tests import box_payload
+
+if TYPE_CHECKING:
+    from creality_wifi_box_client.creality_wifi_box_client import BoxInfo
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+
+@pytest.fixture
+async def entry(hass: HomeAssistant, mock_box_info: BoxInfo) -> MockConfigEntry:
+    """Add a loaded box with three samples and register the commands."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_setup_websocket(hass)
+    entry = MockConfigEntry(domain=DOMAIN, state=ConfigEntryState.LOADED)
+    entry.add_to_hass(hass)
+    entry.runtime_data = MagicMock()
+    history = SampleHistory(10)
+    for layer in range(3):
+        history.append(
+            float(layer), BoxSnapshot(box_payload(mock_box_info, layer=layer))
+        )
+    entry.runtime_data.coordinator.history = history
+    jobs = JobHistory(jobs_store(hass, entry.entry_id))
+    for ended in (1000.0, 2000.0):
+        jobs.async_add(
+            {
+                "print_name": "MyPrint.gcode",
+                "started": ended - 600,
+                "ended": ended,
+                "duration": 600,
+                "filament_length": 100,
+                "filament_type": "PLA",
+                "outcome": "finished",
+            }
+        )
+    entry.runtime_data.coordinator.jobs = jobs
+    return entry
+
+
+async def test_history(
+    hass: HomeAssistant,  # noqa: ARG001
+    hass_ws_client: WebSocketGenerator,
+    entry: MockConfigEntry,
+) -> None:
+    """Test the samples of a box are sent."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/history", "entry_id": entry.entry_id}
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["layer"] == [0, 1, 2]
+    assert response["result"]["time"] == [0, 1, 2]
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/history", "entry_id": entry.entry_id, "max_points": 1}
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["layer"] == [2]
+
+
+async def test_jobs(
+    hass: HomeAssistant,  # noqa: ARG001
+    hass_ws_client: WebSocketGenerator,
+    entry: MockConfigEntry,
+) -> None:
+    """Test the jobs of a box are sent, filtered by name and time."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/jobs", "entry_id": entry.entry_id}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [job["ended"] for job in response["result"]["jobs"]] == [1000, 2000]
+
+    await client.send_json_auto_id(
+        {
+            "type": f"{DOMAIN}/jobs",
+            "entry_id": entry.entry_id,
+            "print_name": "MyPrint.gcode",
+            "start": 1500,
+            "end": 2500,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [job["ended"] for job in response["result"]["jobs"]] == [2000]
+
+
+async def test_history_not_loaded(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, entry: MockConfigEntry
+) -> None:
+    """Test an error is sent for unknown or unloaded entries."""
+    other = MockConfigEntry(domain="other", state=ConfigEntryState.LOADED)
+    other.add_to_hass(hass)
+    entry.mock_state(hass, ConfigEntryState.NOT_LOADED)
+    client = await hass_ws_client()
+
+    for command in ("history", "jobs"):
+        for entry_id in ("missing", other.entry_id, entry.entry_id):
+            await client.send_json_auto_id(
+                {"type": f"{DOMAIN}/{command}", "entry_id": entry_id}
+            )
+            response = await client.receive_json()
+
+            assert not response["success"]
+            assert response["error"]["code"] == "not_found"